@@ -0,0 +1,79 @@
+"""pytest 공용 설정
+
+- DB: 임시 디렉터리의 SQLite (DATABASE_URL 무시 — 운영 DB에 쓰지 않도록 모듈 import 전에 설정)
+- 관리자 API: ADMIN_API_KEY 미설정 상태로 import (테스트에서 monkeypatch.setenv로 켬)
+- 카카오: httpx MockTransport로 대체 (`kakao` fixture), 프로세스 전역 캐시/브레이커/예산은 테스트마다 초기화
+
+사용법:
+    cd src && python -m pytest -q restaurant recommend loadtest
+"""
+
+import os
+import tempfile
+
+os.environ.pop("DATABASE_URL", None)
+os.environ.pop("ADMIN_API_KEY", None)
+os.chdir(tempfile.mkdtemp(prefix="nyam-test-"))
+os.environ["KAKAO_REST_API_KEY"] = "test-key"
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from database.connection import init_db  # noqa: E402
+from restaurant import kakao_client  # noqa: E402
+from restaurant.circuit_breaker import CircuitBreaker  # noqa: E402
+from restaurant.governor import governor  # noqa: E402
+from restaurant.singleflight import SingleFlight  # noqa: E402
+
+init_db()
+
+
+class FakeKakao:
+    """카카오 업스트림 목
+
+    handler(request) -> httpx.Response (async 함수도 가능)를 테스트에서 바꿔 끼움
+    calls: 받은 요청 URL 순서대로
+    """
+
+    def __init__(self):
+        self.calls: list[httpx.URL] = []
+        self.handler = lambda request: httpx.Response(404)
+
+    def _dispatch(self, request: httpx.Request):
+        self.calls.append(request.url)
+        return self.handler(request)
+
+    def count(self, path_part: str) -> int:
+        return sum(1 for url in self.calls if path_part in url.path)
+
+
+@pytest.fixture
+def kakao(monkeypatch) -> FakeKakao:
+    fake = FakeKakao()
+    monkeypatch.setattr(
+        kakao_client, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(fake._dispatch))
+    )
+    for cache in (
+        kakao_client._search_cache,
+        kakao_client._image_cache,
+        kakao_client._review_cache,
+        kakao_client._info_cache,
+        kakao_client._schedule_cache,
+        kakao_client._region_cache,
+    ):
+        cache.clear()
+    kakao_client._host_semaphores.clear()
+    kakao_client._prefetch_tasks.clear()
+    kakao_client._review_refreshes.clear()
+    kakao_client._search_inflight_priority.clear()
+    monkeypatch.setattr(kakao_client, "_flight", SingleFlight())
+    for name, breaker in list(kakao_client._breakers.items()):
+        kakao_client._breakers[name] = CircuitBreaker(
+            name,
+            failure_threshold=breaker.failure_threshold,
+            window=breaker.window,
+            recovery_timeout=breaker.recovery_timeout,
+            half_open_max_calls=breaker.half_open_max_calls,
+        )
+    governor.__init__()
+    return fake
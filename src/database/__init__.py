@@ -1,4 +1,4 @@
 from .connection import engine, SessionLocal, get_db, Base
-from .models import User, RefreshToken
+from .models import User, RefreshToken, PlaceMetadata, PlaceRecord, Review, PlaceReviewStats, RestaurantKeyword, BatchCheckpoint, ApiQuotaUsage
 
-__all__ = ["engine", "SessionLocal", "get_db", "Base", "User", "RefreshToken"]
+__all__ = ["engine", "SessionLocal", "get_db", "Base", "User", "RefreshToken", "PlaceMetadata", "PlaceRecord", "Review", "PlaceReviewStats", "RestaurantKeyword", "BatchCheckpoint", "ApiQuotaUsage"]
@@ -1,7 +1,7 @@
 """데이터베이스 모델"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, String, Integer, DateTime, Date, Boolean, ForeignKey, Text, BigInteger, Float, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from .connection import Base
@@ -69,3 +69,121 @@ class Favorite(Base):
 
     def __repr__(self):
         return f"<Favorite {self.restaurant_name}>"
+
+
+class PlaceMetadata(Base):
+    """카카오 플레이스 메타데이터 캐시 (재시작/배포 후에도 유지)"""
+    __tablename__ = "place_metadata"
+
+    place_id = Column(String(50), primary_key=True)  # 카카오 place_id
+    image_url = Column(Text, nullable=True)  # og:image URL
+    reviews_json = Column(Text, nullable=True)  # 리뷰 응답 JSON (첫 페이지)
+    avg_score = Column(Float, nullable=True)  # 평균 별점
+    review_count = Column(Integer, nullable=True)  # 별점 수
+    info_json = Column(Text, nullable=True)  # 영업시간 등 기본정보 JSON
+
+    # 항목별 갱신 시각 (항목별로 만료 판단)
+    image_updated_at = Column(DateTime, nullable=True)
+    reviews_updated_at = Column(DateTime, nullable=True)
+    info_updated_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<PlaceMetadata {self.place_id}>"
+
+
+class PlaceRecord(Base):
+    """검색 결과로 받은 매장 기본 레코드 (place_id → 상세 조회용 인덱스)"""
+    __tablename__ = "place_records"
+
+    place_id = Column(String(50), primary_key=True)  # 카카오 place_id
+    record_json = Column(Text, nullable=False)  # _parse_place 결과 JSON (distance 제외)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<PlaceRecord {self.place_id}>"
+
+
+class Review(Base):
+    """매장 리뷰 (docs/data-collection.md reviews 테이블, 카카오 place_id 기준)"""
+    __tablename__ = "reviews"
+    __table_args__ = (UniqueConstraint("place_id", "source_id", name="uq_reviews_place_source"),)
+
+    # SQLite 로컬 개발 시 INTEGER PK여야 자동 증가
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    place_id = Column(String(50), nullable=False, index=True)  # 카카오 place_id
+    source_id = Column(String(64), nullable=False)  # 카카오 commentid (중복 수집 방지)
+    content = Column(Text, nullable=False)
+    rating = Column(Integer, nullable=True)
+    review_date = Column(Date, nullable=True)
+    keywords = Column(JSON, nullable=True)  # 추출된 키워드
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Review {self.place_id}/{self.source_id}>"
+
+
+class PlaceReviewStats(Base):
+    """매장별 리뷰 집계 + 증분 동기화 상태"""
+    __tablename__ = "place_review_stats"
+
+    place_id = Column(String(50), primary_key=True)  # 카카오 place_id
+    avg_score = Column(Float, nullable=False, default=0.0)  # 카카오 기준 평균 별점
+    score_count = Column(Integer, nullable=False, default=0)  # 카카오 기준 별점 수
+    stored_count = Column(Integer, nullable=False, default=0)  # reviews 테이블에 쌓인 리뷰 수
+
+    # 증분 동기화 커서 (마지막으로 본 가장 최신 리뷰)
+    latest_source_id = Column(String(64), nullable=True)
+    latest_review_date = Column(Date, nullable=True)
+    # 페이지 상한/중간 실패로 커서까지 못 읽었을 때 이어받을 지점
+    # (resume_source_id: 끊긴 주기에 본 가장 최신 리뷰, resume_after_id: 다음에 읽을 페이지의 기준 commentid)
+    resume_source_id = Column(String(64), nullable=True)
+    resume_review_date = Column(Date, nullable=True)
+    resume_after_id = Column(String(64), nullable=True)
+    # 조건부 요청용 (업스트림이 내려준 경우에만)
+    etag = Column(String(200), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+    synced_at = Column(DateTime, nullable=True, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PlaceReviewStats {self.place_id}: {self.avg_score} ({self.score_count})>"
+
+
+class RestaurantKeyword(Base):
+    """매장별 리뷰 키워드 언급 수 (PRD restaurant_keywords, 키워드 배치가 누적)"""
+    __tablename__ = "restaurant_keywords"
+
+    restaurant_id = Column(String(50), primary_key=True)  # 카카오 place_id
+    keyword = Column(String(50), primary_key=True)  # 대표 키워드 (예: 든든, 맵다)
+    count = Column(Integer, nullable=False, default=0)  # 언급한 리뷰 수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<RestaurantKeyword {self.restaurant_id}/{self.keyword}: {self.count}>"
+
+
+class BatchCheckpoint(Base):
+    """배치 작업 진행 위치 (중단 후 이어서 실행)"""
+    __tablename__ = "batch_checkpoints"
+
+    name = Column(String(50), primary_key=True)  # 배치 이름
+    last_id = Column(BigInteger, nullable=False, default=0)  # 마지막으로 처리한 행 ID
+    processed = Column(BigInteger, nullable=False, default=0)  # 누적 처리 건수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<BatchCheckpoint {self.name}: {self.last_id}>"
+
+
+class ApiQuotaUsage(Base):
+    """외부 API 일일 호출량 (재시작 후에도 일일 쿼터 추적)"""
+    __tablename__ = "api_quota_usage"
+
+    day = Column(String(10), primary_key=True)  # KST 기준 날짜 (YYYY-MM-DD)
+    api = Column(String(30), primary_key=True)  # 'kakao_rest'
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ApiQuotaUsage {self.api} {self.day}: {self.count}>"
@@ -0,0 +1,4 @@
+"""부하 테스트 도구 (카카오 가짜 서버, 벤치마크 스크립트)
+
+운영 코드에서는 import하지 않음
+"""
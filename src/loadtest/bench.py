@@ -0,0 +1,127 @@
+"""API 처리량/지연 벤치마크 스크립트
+
+가짜 카카오 서버(loadtest.fake_kakao)를 바라보는 앱에 동시 요청을 보내고
+엔드포인트별 처리량, p50/p90/p99 지연, 오류 수를 출력
+
+사용법:
+    cd src && python -m loadtest.fake_kakao --port 8010 &
+    KAKAO_REST_API_KEY=fake KAKAO_API_BASE_URL=http://localhost:8010 \\
+    KAKAO_PLACE_BASE_URL=http://localhost:8010 KAKAO_PLACE_API_BASE_URL=http://localhost:8010 \\
+        uvicorn main:app --port 8000 &
+    cd src && python -m loadtest.bench --requests 2000 --concurrency 50
+
+요청마다 X-Forwarded-For를 바꿔서 IP당 rate limit에 걸리지 않게 함
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+from restaurant.kakao_client import LOCATION_COORDS
+
+BASE_URL = "http://localhost:8000"
+_QUERIES = ["국밥", "삼겹살", "짬뽕", "샐러드", "냉면", "치킨", "김치찌개", "파스타"]
+
+
+def _point(rng: random.Random) -> tuple[float, float]:
+    """중심지 주변 ±1km 안의 임의 좌표"""
+    coords = rng.choice(list(LOCATION_COORDS.values()))
+    return coords["lat"] + rng.uniform(-0.009, 0.009), coords["lng"] + rng.uniform(-0.011, 0.011)
+
+
+def _scenario(rng: random.Random, place_ids: list[str]) -> tuple[str, str, str, dict]:
+    """(이름, 메서드, 경로, 인자) — 검색 위주 + 상세/추천 섞음"""
+    lat, lng = _point(rng)
+    roll = rng.random()
+    if roll < 0.35:
+        return "search", "GET", "/api/restaurants/search", {
+            "params": {"query": rng.choice(_QUERIES), "lat": lat, "lng": lng, "radius": 1500},
+        }
+    if roll < 0.55:
+        return "nearby", "GET", "/api/restaurants/nearby", {"params": {"lat": lat, "lng": lng}}
+    if roll < 0.75 and place_ids:
+        pid = rng.choice(place_ids)
+        kind = rng.choice(["reviews", "info"])
+        return kind, "GET", f"/api/restaurants/{pid}/{kind}", {}
+    if roll < 0.85:
+        return "region", "GET", "/api/restaurants/region", {"params": {"lat": lat, "lng": lng}}
+    return "recommend", "POST", "/api/recommend", {
+        "json": {
+            "spicy": rng.random() < 0.5,
+            "warm": rng.random() < 0.5,
+            "light": rng.random() < 0.5,
+            "soup": rng.random() < 0.5,
+            "lat": lat,
+            "lng": lng,
+        },
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(base_url: str, total: int, concurrency: int, seed: int) -> None:
+    rng = random.Random(seed)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    place_ids: list[str] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+
+        async def worker() -> None:
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                name, method, path, kwargs = _scenario(rng, place_ids)
+                headers = {"X-Forwarded-For": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"}
+                started = time.perf_counter()
+                try:
+                    resp = await client.request(method, path, headers=headers, **kwargs)
+                    ok = resp.status_code == 200
+                except httpx.HTTPError:
+                    ok, resp = False, None
+                latencies[name].append((time.perf_counter() - started) * 1000)
+                if not ok:
+                    errors[name] += 1
+                elif name in ("search", "nearby") and len(place_ids) < 500:
+                    place_ids.extend(r["id"] for r in resp.json().get("restaurants", []))
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    print(f"\n총 {total}건 / 동시 {concurrency} / {elapsed:.1f}s → {total / elapsed:.1f} req/s")
+    print(f"{'endpoint':<10} {'count':>6} {'err':>5} {'p50':>8} {'p90':>8} {'p99':>8}  (ms)")
+    for name in sorted(latencies):
+        values = latencies[name]
+        print(
+            f"{name:<10} {len(values):>6} {errors[name]:>5} "
+            f"{_percentile(values, 0.5):>8.1f} {_percentile(values, 0.9):>8.1f} {_percentile(values, 0.99):>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 처리량/지연 벤치마크")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.requests, args.concurrency, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""추천 점수 계산 마이크로벤치마크
+
+후보 수별로 후보 1건당 점수 계산 비용(µs)을 비교
+- distance: 기존 compute_recommendation_score (평점 + 거리 가중치)
+- keyword-python: PRD BE-01 공식을 dict 순회로 계산 후 정렬
+- keyword-numpy: recommend.keyword_scoring (행 gather + 행렬-벡터 곱 + argpartition)
+
+사용법:
+    cd src && python -m loadtest.bench_scoring --places 50000
+"""
+
+import argparse
+import random
+import timeit
+
+import numpy as np
+
+from recommend.keyword_scoring import KEYWORDS, KeywordMatrix, condition_flags, top_k, weight_vector
+from recommend.schemas import FoodType
+from recommend.scoring import compute_recommendation_score
+
+TOP_K = 10
+
+
+def _synthetic_rows(places: int, rng: random.Random) -> list[tuple[str, str, int]]:
+    rows = []
+    for i in range(places):
+        for keyword in rng.sample(KEYWORDS, rng.randint(0, 8)):
+            rows.append((f"p{i}", keyword, rng.randint(1, 50)))
+    return rows
+
+
+def _per_candidate_us(fn, candidates: int, number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return best / number / candidates * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추천 점수 계산 마이크로벤치마크")
+    parser.add_argument("--places", type=int, default=50000, help="행렬에 들어가는 매장 수")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="후보 수 목록 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows = _synthetic_rows(args.places, rng)
+    matrix = KeywordMatrix()
+    matrix.load_rows(rows)
+    by_place: dict[str, dict[str, int]] = {}
+    for place_id, keyword, count in rows:
+        by_place.setdefault(place_id, {})[keyword] = count
+
+    weights = weight_vector(FoodType.SPICY_SOUP, condition_flags(True, True, False, True))
+    weight_map = {KEYWORDS[i]: float(w) for i, w in enumerate(weights) if w}
+
+    print(f"매장 {len(matrix)}곳 × 키워드 {len(KEYWORDS)}개 행렬 ({matrix.counts.nbytes / 1024 / 1024:.1f}MB)")
+    print(f"{'candidates':>10} {'distance':>10} {'kw-python':>10} {'kw-numpy':>10}  (µs / 후보)")
+    for size in (int(s) for s in args.sizes.split(",")):
+        place_ids = [f"p{rng.randrange(args.places)}" for _ in range(size)]
+        ratings = [round(rng.uniform(0, 5), 1) for _ in range(size)]
+        distances = [rng.randint(0, 2000) for _ in range(size)]
+        ratings_np = np.array(ratings, dtype=np.float32)
+        number = max(1, 20000 // size)
+
+        def distance_path():
+            scores = [compute_recommendation_score(r, d) for r, d in zip(ratings, distances)]
+            return sorted(range(size), key=scores.__getitem__, reverse=True)[:TOP_K]
+
+        def python_path():
+            scores = []
+            for place_id, rating in zip(place_ids, ratings):
+                counts = by_place.get(place_id, {})
+                total = sum(counts.get(k, 0) * w for k, w in weight_map.items())
+                scores.append(total + rating * 10)
+            return sorted(range(size), key=scores.__getitem__, reverse=True)[:TOP_K]
+
+        def numpy_path():
+            totals, _ = matrix.score(place_ids, ratings_np, weights)
+            return top_k(totals, TOP_K)
+
+        print(
+            f"{size:>10} "
+            f"{_per_candidate_us(distance_path, size, number):>10.3f} "
+            f"{_per_candidate_us(python_path, size, number):>10.3f} "
+            f"{_per_candidate_us(numpy_path, size, number):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,543 @@
+"""카카오 로컬 API 가짜 서버 (부하 테스트용, record/replay)
+
+kakao_client가 호출하는 엔드포인트를 같은 경로로 흉내냄:
+    GET /v2/local/search/keyword.json      키워드 검색
+    GET /v2/local/search/category.json     카테고리 검색
+    GET /v2/local/geo/coord2regioncode.json 좌표 → 지역
+    GET /main/v/{place_id}                 리뷰 (comment)
+    GET /places/panel3/{place_id}          영업시간
+    GET /{place_id}                        플레이스 페이지 HTML (og:image)
+
+- replay: 녹화한 fixture(JSON)를 서빙, fixture가 없으면 시드 고정 가상 데이터 생성
+- 검색은 요청 좌표 기준으로 거리 계산/반경·rect 필터/정렬/페이지(최대 45건)를 실제처럼 처리
+- 지연(기본 + 지터 + 꼬리)과 오류(상태 코드/타임아웃) 비율을 설정 가능 (시드 고정)
+- record: 실제 카카오로 프록시하면서 응답을 fixture로 저장 (종료 시 기록)
+
+사용법:
+    cd src && python -m loadtest.fake_kakao --port 8010 --latency-ms 40 --error-rate 0.01
+    cd src && python -m loadtest.fake_kakao --record fixtures.json   # 실제 카카오 녹화
+    cd src && python -m loadtest.fake_kakao --fixtures fixtures.json # 녹화 재생
+
+앱 쪽 설정 (.env):
+    KAKAO_REST_API_KEY=fake
+    KAKAO_API_BASE_URL=http://localhost:8010
+    KAKAO_PLACE_BASE_URL=http://localhost:8010
+    KAKAO_PLACE_API_BASE_URL=http://localhost:8010
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import zlib
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+from recommend.food_type_search import FOOD_TYPE_KEYWORDS
+from restaurant.geo import haversine_m
+from restaurant.open_hours import KST, is_open_at, next_transition, parse_weekly_schedule
+
+# 실제 카카오 주소 (record 모드 프록시 대상)
+UPSTREAM_API = "https://dapi.kakao.com"
+UPSTREAM_PLACE = "https://place.map.kakao.com"
+UPSTREAM_PLACE_API = "https://place-api.map.kakao.com"
+
+# 카카오 검색 페이지 제한
+MAX_PAGEABLE = 45
+
+# 가상 데이터 생성 중심지 (kakao_client.LOCATION_COORDS 일부)
+_HOTSPOTS = {
+    "강남": (37.4979, 127.0276),
+    "홍대": (37.5563, 126.9220),
+    "여의도": (37.5219, 126.9245),
+    "성수": (37.5445, 127.0560),
+    "잠실": (37.5133, 127.1001),
+    "종로": (37.5704, 126.9922),
+}
+_CUISINES = {
+    "한식": ["김치찌개", "육개장", "설렁탕", "갈비탕", "삼계탕", "삼겹살", "갈비", "백반",
+             "제육볶음", "된장찌개", "냉면", "국밥", "해장국", "김밥", "칼국수"],
+    "중식": ["짬뽕", "마라탕", "짜장면"],
+    "일식": ["메밀", "회", "우동", "돈까스"],
+    "양식": ["스테이크", "샐러드", "포케", "샌드위치", "피자", "햄버거", "파스타"],
+    "치킨": ["치킨"],
+    "분식": ["토스트", "떡볶이"],
+}
+# 추천 키워드가 모두 검색되도록 보강
+for _keywords in FOOD_TYPE_KEYWORDS.values():
+    for _kw in _keywords:
+        if not any(_kw in menus for menus in _CUISINES.values()):
+            _CUISINES["한식"].append(_kw)
+
+_REVIEW_SNIPPETS = [
+    "국물이 진하고 맛있어요", "양이 많아서 든든해요", "깔끔하고 친절합니다",
+    "웨이팅이 좀 있어요", "가성비 좋아요", "매콤해서 해장으로 딱", "재방문 의사 있어요",
+]
+_REVIEW_NAMES = ["김민수", "이서연", "박지훈", "최유진", "정하늘", "강도윤", "윤서아"]
+_WEEKDAYS = "월화수목금토일"
+
+
+def _rng(*parts) -> random.Random:
+    """입력값별로 항상 같은 난수열 (재현 가능한 가상 데이터)"""
+    return random.Random(zlib.crc32("|".join(map(str, parts)).encode()))
+
+
+# ── 데이터 ───────────────────────────────────────────────────
+@dataclass
+class Fixtures:
+    """가짜 서버 데이터 (녹화 또는 가상 생성)
+
+    places: 카카오 검색 응답 document 원본 (distance 제외)
+    regions: [{"x", "y", "documents"}] coord2region 응답
+    reviews/info: place_id -> /main/v, panel3 응답 원본
+    images: place_id -> og:image URL
+    """
+    places: dict[str, dict] = field(default_factory=dict)
+    regions: list[dict] = field(default_factory=list)
+    reviews: dict[str, dict] = field(default_factory=dict)
+    info: dict[str, dict] = field(default_factory=dict)
+    images: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Fixtures":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            places={p["id"]: p for p in data.get("places", [])},
+            regions=data.get("regions", []),
+            reviews=data.get("reviews", {}),
+            info=data.get("info", {}),
+            images=data.get("images", {}),
+        )
+
+    def save(self, path: Path) -> None:
+        data = {
+            "places": list(self.places.values()),
+            "regions": self.regions,
+            "reviews": self.reviews,
+            "info": self.info,
+            "images": self.images,
+        }
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    @classmethod
+    def synthetic(cls, per_hotspot: int, seed: int) -> "Fixtures":
+        """중심지 주변 반경 3km에 가상 음식점 생성 (리뷰/영업시간/이미지는 요청 시 생성)"""
+        fixtures = cls()
+        next_id = 10_000_000
+        for area, (lat, lng) in _HOTSPOTS.items():
+            rng = _rng(seed, area)
+            for _ in range(per_hotspot):
+                cuisine = rng.choice(list(_CUISINES))
+                menu = rng.choice(_CUISINES[cuisine])
+                # 중심에 몰리도록 반경 분포를 제곱으로
+                dist = 3000 * rng.random() ** 2
+                bearing = rng.uniform(0, 2 * math.pi)
+                p_lat = lat + dist * math.cos(bearing) / 111_320
+                p_lng = lng + dist * math.sin(bearing) / (111_320 * math.cos(math.radians(lat)))
+                place_id = str(next_id)
+                next_id += 1
+                fixtures.places[place_id] = {
+                    "id": place_id,
+                    "place_name": f"{area} {menu} {rng.randint(1, 99)}호점",
+                    "category_name": f"음식점 > {cuisine} > {menu}",
+                    "category_group_code": "FD6",
+                    "category_group_name": "음식점",
+                    "address_name": f"서울 {area} {rng.randint(1, 300)}-{rng.randint(1, 50)}",
+                    "road_address_name": f"서울 {area}로 {rng.randint(1, 200)}",
+                    "phone": f"02-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                    "place_url": f"http://place.map.kakao.com/{place_id}",
+                    "x": f"{p_lng:.7f}",
+                    "y": f"{p_lat:.7f}",
+                }
+        return fixtures
+
+
+# 첫 페이지(main) / 다음 페이지(commentlist) 리뷰 수
+_REVIEW_FIRST_PAGE = 3
+_REVIEW_PAGE = 5
+
+
+def _synthetic_comments(place_id: str) -> tuple[int, float, list[dict]]:
+    """(별점 수, 평균, 최신순 리뷰 목록) — 목록은 최대 23건"""
+    rng = _rng("reviews", place_id)
+    count = rng.randint(0, 300)
+    avg = rng.uniform(3.0, 5.0)
+    today = datetime.now(KST).date()
+    ages = sorted(rng.randint(0, 400) for _ in range(min(count, 23)))
+    base_id = rng.randint(1_000_000, 9_000_000)
+    items = [
+        {
+            "commentid": str(base_id - i),
+            "username": rng.choice(_REVIEW_NAMES),
+            "point": rng.randint(3, 5),
+            "contents": rng.choice(_REVIEW_SNIPPETS),
+            "date": (today - timedelta(days=age)).strftime("%Y.%m.%d."),
+            "photoList": [],
+        }
+        for i, age in enumerate(ages)
+    ]
+    return count, avg, items
+
+
+def _synthetic_reviews(place_id: str) -> dict:
+    count, avg, items = _synthetic_comments(place_id)
+    return {"comment": {
+        "scorecnt": count,
+        "scoresum": round(avg * count),
+        "list": items[:_REVIEW_FIRST_PAGE],
+        "hasNext": len(items) > _REVIEW_FIRST_PAGE,
+    }}
+
+
+def _synthetic_comment_page(place_id: str, after_id: str) -> dict:
+    _, _, items = _synthetic_comments(place_id)
+    ids = [item["commentid"] for item in items]
+    start = ids.index(after_id) + 1 if after_id in ids else len(ids)
+    page = items[start:start + _REVIEW_PAGE]
+    return {"comment": {"list": page, "hasNext": start + _REVIEW_PAGE < len(items)}}
+
+
+def _synthetic_info(place_id: str) -> dict:
+    rng = _rng("info", place_id)
+    opens, closes = rng.choice([(10, 21), (11, 22), (11, 23), (17, 2), (0, 0)])
+    time_desc = "24시간 영업" if opens == closes else f"{opens:02d}:00 ~ {closes:02d}:00"
+    has_break = opens in (10, 11) and rng.random() < 0.5
+    off_day = rng.choice([None, None, 0, 6])
+    now = datetime.now(KST)
+    days = []
+    for offset in range(7):
+        day = now + timedelta(days=offset)
+        label = f"{_WEEKDAYS[day.weekday()]}({day.month}/{day.day})"
+        entry = {"day_of_the_week_desc": label, "is_highlight": offset == 0}
+        if day.weekday() == off_day:
+            entry["off_days_desc"] = "정기휴무"
+        else:
+            entry["on_days"] = {
+                "start_end_time_desc": time_desc,
+                "break_times_desc": ["15:00 ~ 17:00"] if has_break else [],
+            }
+        days.append(entry)
+
+    # 헤드라인도 같은 영업시간으로 계산
+    hours = [
+        {
+            "day": d["day_of_the_week_desc"],
+            "time": d.get("on_days", {}).get("start_end_time_desc", ""),
+            "break_time": (d.get("on_days", {}).get("break_times_desc") or [""])[0],
+            "off": "on_days" not in d,
+        }
+        for d in days
+    ]
+    schedule = parse_weekly_schedule(hours)
+    is_open = is_open_at(schedule, now) if schedule else None
+    transition = next_transition(schedule, now) if schedule else None
+    if is_open:
+        headline = ("영업 중", f"{transition:%H:%M}에 영업 종료" if transition else "")
+    else:
+        headline = ("영업 전" if off_day != now.weekday() else "휴무일",
+                    f"{transition:%H:%M}에 영업 시작" if transition else "")
+    return {
+        "open_hours": {
+            "headline": {"display_text": headline[0], "display_text_info": headline[1]},
+            "week_from_today": {"week_periods": [{"days": days}]},
+        },
+        "summary": {"homepages": []},
+    }
+
+
+# ── 지연/오류 주입 ───────────────────────────────────────────
+@dataclass
+class FaultProfile:
+    """엔드포인트 그룹별 지연/오류 분포
+
+    지연 = latency_ms ± jitter_ms (균등) + tail_rate 확률로 tail_ms 추가
+    error_rate 확률로 error_statuses 중 하나 반환, timeout_rate 확률로 timeout_s 동안 응답 없음
+    """
+    latency_ms: float = 30.0
+    jitter_ms: float = 10.0
+    tail_rate: float = 0.01
+    tail_ms: float = 500.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503, 429)
+    timeout_rate: float = 0.0
+    timeout_s: float = 30.0
+
+
+class FaultInjector:
+    """그룹(search/region/reviews/info/image)별 FaultProfile 적용 (시드 고정)"""
+
+    def __init__(self, default: FaultProfile, overrides: dict[str, FaultProfile], seed: int):
+        self.default = default
+        self.overrides = overrides
+        self._rng = random.Random(seed)
+        self.counts: dict[str, dict[str, int]] = {}
+
+    def _count(self, group: str, key: str) -> None:
+        counts = self.counts.setdefault(group, {"requests": 0, "errors": 0, "timeouts": 0})
+        counts[key] += 1
+
+    async def apply(self, group: str) -> Response | None:
+        """지연 후 주입할 오류 응답 반환 (정상이면 None)"""
+        profile = self.overrides.get(group, self.default)
+        self._count(group, "requests")
+        roll = self._rng.random()
+        if roll < profile.timeout_rate:
+            self._count(group, "timeouts")
+            await asyncio.sleep(profile.timeout_s)
+        delay = profile.latency_ms + self._rng.uniform(-profile.jitter_ms, profile.jitter_ms)
+        if self._rng.random() < profile.tail_rate:
+            delay += profile.tail_ms
+        await asyncio.sleep(max(0.0, delay) / 1000)
+        if profile.timeout_rate <= roll < profile.timeout_rate + profile.error_rate:
+            self._count(group, "errors")
+            return JSONResponse({"errorType": "InjectedError"}, status_code=self._rng.choice(profile.error_statuses))
+        return None
+
+
+# ── 검색 ─────────────────────────────────────────────────────
+def _search(places: list[dict], params: dict, query: str | None) -> dict:
+    """카카오 검색 의미대로 필터/정렬/페이지 처리 (거리는 요청 좌표 기준)"""
+    group = params.get("category_group_code")
+    x, y = params.get("x"), params.get("y")
+    origin = (float(y), float(x)) if x and y else None
+    radius = int(params.get("radius", 20000))
+    rect = [float(v) for v in params["rect"].split(",")] if params.get("rect") else None
+    tokens = query.split() if query else []
+
+    hits = []
+    for place in places:
+        if group and place.get("category_group_code") != group:
+            continue
+        if tokens:
+            text = place["place_name"] + " " + place.get("category_name", "")
+            if not all(t in text for t in tokens):
+                continue
+        p_lat, p_lng = float(place["y"]), float(place["x"])
+        if rect and not (rect[0] <= p_lng <= rect[2] and rect[1] <= p_lat <= rect[3]):
+            continue
+        distance = haversine_m(origin[0], origin[1], p_lat, p_lng) if origin else None
+        if origin and not rect and distance > radius:
+            continue
+        hits.append((distance, place))
+
+    if params.get("sort") == "distance" and origin:
+        hits.sort(key=lambda h: h[0])
+
+    page = max(1, int(params.get("page", 1)))
+    size = min(15, max(1, int(params.get("size", 15))))
+    pageable = min(len(hits), MAX_PAGEABLE)
+    start = (page - 1) * size
+    window = hits[start:min(start + size, pageable)]
+    return {
+        "documents": [
+            {**place, "distance": str(distance) if distance is not None else ""}
+            for distance, place in window
+        ],
+        "meta": {
+            "total_count": len(hits),
+            "pageable_count": pageable,
+            "is_end": start + size >= pageable,
+            "same_name": None,
+        },
+    }
+
+
+def _region_for(fixtures: Fixtures, lat: float, lng: float) -> dict:
+    if fixtures.regions:
+        nearest = min(fixtures.regions, key=lambda r: haversine_m(lat, lng, r["y"], r["x"]))
+        return {"meta": {"total_count": len(nearest["documents"])}, "documents": nearest["documents"]}
+    area = min(_HOTSPOTS, key=lambda a: haversine_m(lat, lng, *_HOTSPOTS[a]))
+    doc = {
+        "region_type": "H",
+        "region_1depth_name": "서울특별시",
+        "region_2depth_name": f"{area}구",
+        "region_3depth_name": f"{area}동",
+        "x": lng,
+        "y": lat,
+    }
+    return {"meta": {"total_count": 1}, "documents": [doc]}
+
+
+_OG_IMAGE_RE = re.compile(r'og:image["\s]+content="([^"]+)"')
+
+
+# ── 앱 ───────────────────────────────────────────────────────
+def create_app(
+    fixtures: Fixtures,
+    faults: FaultInjector,
+    record_path: Path | None = None,
+) -> FastAPI:
+    """가짜 카카오 앱 (record_path가 있으면 실제 카카오로 프록시하며 녹화)"""
+    upstream: httpx.AsyncClient | None = None
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        nonlocal upstream
+        if record_path:
+            upstream = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
+        yield
+        if upstream is not None:
+            await upstream.aclose()
+        if record_path:
+            fixtures.save(record_path)
+            print(f"📼 녹화 저장: {record_path} (매장 {len(fixtures.places)}곳)")
+
+    app = FastAPI(title="Fake Kakao", lifespan=lifespan)
+
+    async def _proxy(request: Request, base: str) -> httpx.Response:
+        headers = {
+            k: v for k, v in request.headers.items()
+            if k.lower() in ("authorization", "user-agent", "referer", "origin", "appversion", "pf")
+        }
+        return await upstream.get(base + request.url.path, params=request.query_params, headers=headers)
+
+    async def _search_route(request: Request, with_query: bool) -> Response:
+        params = dict(request.query_params)
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_API)
+            if resp.status_code == 200:
+                for doc in resp.json().get("documents", []):
+                    fixtures.places[doc["id"]] = {k: v for k, v in doc.items() if k != "distance"}
+            return Response(resp.content, status_code=resp.status_code, media_type="application/json")
+        if (error := await faults.apply("search")) is not None:
+            return error
+        return JSONResponse(_search(list(fixtures.places.values()), params, params.get("query") if with_query else None))
+
+    @app.get("/v2/local/search/keyword.json")
+    async def keyword(request: Request):
+        return await _search_route(request, with_query=True)
+
+    @app.get("/v2/local/search/category.json")
+    async def category(request: Request):
+        return await _search_route(request, with_query=False)
+
+    @app.get("/v2/local/geo/coord2regioncode.json")
+    async def coord2region(request: Request, x: float, y: float):
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_API)
+            if resp.status_code == 200:
+                fixtures.regions.append({"x": x, "y": y, "documents": resp.json().get("documents", [])})
+            return Response(resp.content, status_code=resp.status_code, media_type="application/json")
+        if (error := await faults.apply("region")) is not None:
+            return error
+        return JSONResponse(_region_for(fixtures, y, x))
+
+    @app.get("/main/v/{place_id}")
+    async def reviews(request: Request, place_id: str):
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_PLACE)
+            if resp.status_code == 200:
+                fixtures.reviews[place_id] = resp.json()
+            return Response(resp.content, status_code=resp.status_code, media_type="application/json")
+        if (error := await faults.apply("reviews")) is not None:
+            return error
+        return JSONResponse(fixtures.reviews.get(place_id) or _synthetic_reviews(place_id))
+
+    @app.get("/commentlist/v/{place_id}/{after_id}")
+    async def comment_list(request: Request, place_id: str, after_id: str):
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_PLACE)
+            return Response(resp.content, status_code=resp.status_code, media_type="application/json")
+        if (error := await faults.apply("reviews")) is not None:
+            return error
+        if place_id in fixtures.reviews:
+            # 녹화된 매장은 첫 페이지만 있음
+            return JSONResponse({"comment": {"list": [], "hasNext": False}})
+        return JSONResponse(_synthetic_comment_page(place_id, after_id))
+
+    @app.get("/places/panel3/{place_id}")
+    async def info(request: Request, place_id: str):
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_PLACE_API)
+            if resp.status_code == 200:
+                fixtures.info[place_id] = resp.json()
+            return Response(resp.content, status_code=resp.status_code, media_type="application/json")
+        if (error := await faults.apply("info")) is not None:
+            return error
+        return JSONResponse(fixtures.info.get(place_id) or _synthetic_info(place_id))
+
+    @app.get("/_stats")
+    async def stats():
+        """주입된 요청/오류/타임아웃 수"""
+        return {"places": len(fixtures.places), "faults": faults.counts}
+
+    @app.get("/{place_id}")
+    async def place_page(request: Request, place_id: str):
+        if record_path:
+            resp = await _proxy(request, UPSTREAM_PLACE)
+            if resp.status_code == 200:
+                match = _OG_IMAGE_RE.search(resp.text)
+                if match:
+                    fixtures.images[place_id] = match.group(1)
+            return HTMLResponse(resp.text, status_code=resp.status_code)
+        if (error := await faults.apply("image")) is not None:
+            return error
+        image = fixtures.images.get(place_id, f"//img1.kakaocdn.net/fake/{place_id}.jpg")
+        # 실제 페이지처럼 head 뒤에 본문이 길게 이어짐 (스트리밍 조기 종료 확인용)
+        return HTMLResponse(
+            f'<html><head><meta property="og:image" content="{image}"></head>'
+            f"<body>{'<div></div>' * 4000}</body></html>"
+        )
+
+    return app
+
+
+def _parse_profiles(path: str | None) -> dict[str, FaultProfile]:
+    if not path:
+        return {}
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {group: FaultProfile(**values) for group, values in raw.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카카오 로컬 API 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--fixtures", help="재생할 fixture JSON (없으면 가상 데이터)")
+    parser.add_argument("--record", help="실제 카카오로 프록시하며 이 파일에 녹화")
+    parser.add_argument("--per-hotspot", type=int, default=1500, help="가상 데이터: 중심지별 매장 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--tail-rate", type=float, default=0.01)
+    parser.add_argument("--tail-ms", type=float, default=500.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--profile",
+        help='그룹별 지연/오류 JSON (예: {"image": {"latency_ms": 200, "error_rate": 0.05}})',
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        fixtures = Fixtures.load(Path(args.record)) if Path(args.record).exists() else Fixtures()
+    elif args.fixtures:
+        fixtures = Fixtures.load(Path(args.fixtures))
+    else:
+        fixtures = Fixtures.synthetic(args.per_hotspot, args.seed)
+
+    default = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+    )
+    faults = FaultInjector(default, _parse_profiles(args.profile), args.seed)
+    app = create_app(fixtures, faults, Path(args.record) if args.record else None)
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
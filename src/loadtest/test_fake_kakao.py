@@ -0,0 +1,87 @@
+"""카카오 가짜 서버 테스트 (가상 데이터 재현성, 검색 의미, 오류 주입, kakao_client 연동)"""
+
+import asyncio
+
+import httpx
+
+from restaurant import kakao_client
+from restaurant.geo import haversine_m
+
+from .fake_kakao import FaultInjector, FaultProfile, Fixtures, _search, create_app
+
+GANGNAM = (37.4979, 127.0276)
+QUIET = FaultProfile(latency_ms=0, jitter_ms=0, tail_rate=0)
+
+
+def _params(**values) -> dict:
+    return {"x": str(GANGNAM[1]), "y": str(GANGNAM[0]), **{k: str(v) for k, v in values.items()}}
+
+
+def test_synthetic_data_is_reproducible_per_seed():
+    first = Fixtures.synthetic(per_hotspot=20, seed=7)
+    assert first.places == Fixtures.synthetic(per_hotspot=20, seed=7).places
+    assert first.places != Fixtures.synthetic(per_hotspot=20, seed=8).places
+
+
+def test_search_filters_by_radius_and_sorts_by_distance_from_request():
+    places = list(Fixtures.synthetic(per_hotspot=200, seed=1).places.values())
+    result = _search(places, _params(radius=500, sort="distance"), None)
+
+    distances = [int(doc["distance"]) for doc in result["documents"]]
+    assert distances == sorted(distances) and all(d <= 500 for d in distances)
+    doc = result["documents"][0]
+    assert int(doc["distance"]) == haversine_m(*GANGNAM, float(doc["y"]), float(doc["x"]))
+
+
+def test_search_pages_stop_at_45_results():
+    places = list(Fixtures.synthetic(per_hotspot=300, seed=1).places.values())
+    first = _search(places, _params(radius=3000), None)
+    assert first["meta"]["total_count"] > 45 and first["meta"]["pageable_count"] == 45
+    last = _search(places, _params(radius=3000, page=3), None)
+    assert len(last["documents"]) == 15 and last["meta"]["is_end"]
+    assert _search(places, _params(radius=3000, page=4), None)["documents"] == []
+
+
+def test_keyword_search_requires_every_token():
+    places = list(Fixtures.synthetic(per_hotspot=300, seed=1).places.values())
+    result = _search(places, _params(radius=3000), "강남 국밥")
+    names = [doc["place_name"] for doc in result["documents"]]
+    assert names and all("강남" in n and "국밥" in n for n in names)
+
+
+def test_fault_injector_returns_errors_and_counts_them():
+    faults = FaultInjector(QUIET, {"image": FaultProfile(0, 0, 0, 0, error_rate=1.0)}, seed=1)
+    error = asyncio.run(faults.apply("image"))
+    assert error.status_code in (500, 502, 503, 429)
+    assert asyncio.run(faults.apply("search")) is None
+    assert faults.counts["image"] == {"requests": 1, "errors": 1, "timeouts": 0}
+
+
+def test_fixtures_round_trip_through_file(tmp_path):
+    fixtures = Fixtures.synthetic(per_hotspot=3, seed=1)
+    fixtures.images["10000000"] = "//img/a.jpg"
+    fixtures.save(tmp_path / "fixtures.json")
+    loaded = Fixtures.load(tmp_path / "fixtures.json")
+    assert loaded.places == fixtures.places and loaded.images == fixtures.images
+
+
+def test_kakao_client_runs_against_fake_server(kakao, monkeypatch):
+    """kakao_client가 가짜 서버 응답을 실제 카카오 응답처럼 해석"""
+    fixtures = Fixtures.synthetic(per_hotspot=100, seed=3)
+    app = create_app(fixtures, FaultInjector(QUIET, {}, seed=3))
+    monkeypatch.setattr(
+        kakao_client, "_http_client", httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+
+    async def run():
+        found = await kakao_client.search_keyword("한식", lat=GANGNAM[0], lng=GANGNAM[1])
+        place_id = found["documents"][0]["id"]
+        reviews = await kakao_client.fetch_place_reviews(place_id)
+        image = await kakao_client.fetch_place_image(place_id)
+        return found, place_id, reviews, image
+
+    found, place_id, reviews, image = asyncio.run(run())
+    assert found["documents"]
+    assert all("한식" in doc["full_category"] for doc in found["documents"])
+    assert reviews["total_count"] >= 0 and len(reviews["reviews"]) <= reviews["total_count"]
+    assert image == f"https://img1.kakaocdn.net/fake/{place_id}.jpg"
@@ -1,6 +1,7 @@
 """FastAPI 메인 애플리케이션"""
 
 import os
+import asyncio
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
@@ -10,20 +11,23 @@ from fastapi.responses import FileResponse
 from slowapi.errors import RateLimitExceeded
 from dotenv import load_dotenv
 
+# 환경변수 로드 (모듈 import 시점에 설정값을 읽는 restaurant.config보다 먼저)
+load_dotenv()
+
 from chatbot.api import router as chatbot_router
 from chatbot.rate_limit import limiter, rate_limit_exceeded_handler, RateLimits
 from auth import auth_router
 from favorites import favorites_router
-from restaurant import restaurant_router
+from restaurant import restaurant_router, restaurant_admin_router
 from recommend import recommend_router
+from restaurant.kakao_client import open_http_client, close_http_client
+from restaurant import config, place_store, review_sync
+from restaurant.governor import governor
 from database.connection import init_db
 
 # 프론트엔드 빌드 디렉토리
 FRONTEND_DIR = Path(__file__).parent / "frontend" / "dist"
 
-# 환경변수 로드
-load_dotenv()
-
 # 허용된 오리진 (CORS)
 ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite 개발 서버
@@ -43,6 +47,18 @@ async def lifespan(app: FastAPI):
     init_db()
     print("✅ 데이터베이스 초기화 완료")
 
+    # 카카오 API 공유 커넥션 풀
+    await open_http_client()
+    # 플레이스 메타데이터 저장소 정리 작업 (백그라운드)
+    compaction_task = asyncio.create_task(place_store.run_compaction())
+    # 카카오 REST 키 일일 사용량 복원 + 주기적 기록
+    await governor.load()
+    quota_task = asyncio.create_task(governor.run_flush())
+    # 리뷰 증분 동기화 (설정 시에만)
+    review_sync_task = (
+        asyncio.create_task(review_sync.run_sync()) if config.REVIEW_SYNC_ENABLED else None
+    )
+
     if not os.getenv("OPENAI_API_KEY"):
         print("⚠️  OPENAI_API_KEY 환경변수를 설정해주세요.")
     else:
@@ -51,6 +67,8 @@ async def lifespan(app: FastAPI):
         print("⚠️  KAKAO_REST_API_KEY 미설정 — 맛집 검색에 목업 데이터 사용")
     else:
         print("✅ 카카오 REST API 키가 설정되었습니다.")
+    if config.KAKAO_API_BASE_URL != "https://dapi.kakao.com":
+        print(f"⚠️  카카오 업스트림 주소 변경됨 — {config.KAKAO_API_BASE_URL} (부하 테스트용)")
     if not os.getenv("JWT_SECRET_KEY"):
         print("⚠️  JWT_SECRET_KEY 미설정 — 배포 시마다 랜덤 키 생성 (기존 로그인 세션 무효화됨)")
     else:
@@ -58,6 +76,13 @@ async def lifespan(app: FastAPI):
     print("🚀 메뉴 추천 챗봇 API 서버 시작")
     yield
     # 종료 시
+    compaction_task.cancel()
+    quota_task.cancel()
+    if review_sync_task is not None:
+        review_sync_task.cancel()
+    await governor.flush()
+    await place_store.flush()
+    await close_http_client()
     print("👋 서버 종료")
 
 
@@ -100,6 +125,7 @@ app.include_router(chatbot_router)
 app.include_router(auth_router)
 app.include_router(favorites_router)
 app.include_router(restaurant_router)
+app.include_router(restaurant_admin_router)
 app.include_router(recommend_router)
 
 # 프론트엔드 정적 파일 서빙
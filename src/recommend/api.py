@@ -1,17 +1,38 @@
 import asyncio
+import json
 import logging
+from typing import AsyncIterator, Callable
 
-from fastapi import APIRouter, HTTPException, Request
+import numpy as np
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from chatbot.rate_limit import limiter, RateLimits
 from restaurant.kakao_client import (
-    fetch_place_images,
+    cached_rating,
+    fetch_place_image,
     fetch_place_reviews,
+    review_stats,
     search_keyword,
+    search_local,
 )
+from restaurant import config
+from restaurant.admin import require_admin_key
+from restaurant.governor import Priority, governor
+from restaurant.singleflight import SingleFlight
 
 from .food_type_search import FOOD_TYPE_KEYWORDS, FOOD_TYPE_LABELS, FOOD_TYPE_REASONS
-from .schemas import FoodType, RecommendRequest, RecommendResponse, ScoredRestaurant
+from . import result_cache
+from .keyword_scoring import condition_flags, keyword_matrix, matched_keywords, top_k, weight_vector
+from .schemas import (
+    FoodType,
+    RecommendRequest,
+    RecommendResponse,
+    ScoredRestaurant,
+    ScoringMode,
+    StreamFormat,
+)
 from .scoring import (
     compute_food_type_scores,
     compute_recommendation_score,
@@ -23,28 +44,89 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["recommend"])
 
+# Concurrent cache misses for the same key share one search + enrichment
+_flight = SingleFlight()
+
+# Speculative secondary searches in flight (bounded by RECOMMEND_SPECULATIVE_MAX_INFLIGHT)
+_speculative: set[asyncio.Task] = set()
+_speculation_counters = {"started": 0, "skipped": 0, "used": 0, "more_options": 0, "cancelled": 0}
+
+# Fetches left running after a request deadline (they still fill the caches)
+_abandoned: set[asyncio.Task] = set()
+_deadline_counters = {"search_timeouts": 0, "enrich_timeouts": 0, "abandoned": 0, "partial_responses": 0}
+
+# Top-K lazy enrichment; overtook_top_k counts deferred candidates that,
+# once enriched, scored above the lowest of the top K already shown
+_lazy_counters = {"enriched_top": 0, "deferred": 0, "more_requests": 0, "lazy_enriched": 0, "overtook_top_k": 0}
+
+
+def _deadline_after(seconds: float) -> float | None:
+    """Absolute loop time `seconds` from now (None = no deadline)."""
+    return asyncio.get_running_loop().time() + seconds if seconds > 0 else None
+
+
+def _remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+
+def _abandon(tasks) -> None:
+    """Stop waiting for tasks without cancelling them.
+
+    They keep running and fill the search/review/image caches for the next
+    request; references are held here until they finish.
+    """
+    for task in tasks:
+        _abandoned.add(task)
+        task.add_done_callback(_abandoned.discard)
+        # Consume the outcome so failures are not reported as never retrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _deadline_counters["abandoned"] += 1
+
 
 async def _search_by_food_type(
     food_type: FoodType,
     lat: float,
     lng: float,
     radius: int,
+    deadline: float | None = None,
 ) -> list[dict]:
-    """Search restaurants for a food type using its keywords in parallel."""
+    """Search restaurants for a food type using its keywords in parallel.
+
+    Served from the local mirror when the area has been fully scanned
+    recently; falls back to Kakao keyword search otherwise. Keyword searches
+    still running at the deadline are abandoned and their results skipped.
+    """
     keywords = FOOD_TYPE_KEYWORDS[food_type][:3]
+    local = search_local(lat, lng, radius, keywords=keywords)
+    if local is not None:
+        return local[:10]
+
     tasks = [
-        search_keyword(query=kw, lat=lat, lng=lng, radius=radius, size=15)
+        asyncio.create_task(search_keyword(query=kw, lat=lat, lng=lng, radius=radius, size=15))
         for kw in keywords
     ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=_remaining(deadline))
+    except asyncio.CancelledError:
+        # Caller gave up (e.g. speculation no longer needed) — stop the searches too
+        for task in tasks:
+            task.cancel()
+        raise
+    if pending:
+        _deadline_counters["search_timeouts"] += 1
+        _abandon(pending)
 
     seen_ids: set[str] = set()
     restaurants: list[dict] = []
-    for result in results:
-        if isinstance(result, Exception):
-            logger.warning("Search keyword failed: %s", result)
+    for task in tasks:
+        if task not in done:
             continue
-        for doc in result.get("documents", []):
+        if task.exception() is not None:
+            logger.warning("Search keyword failed: %s", task.exception())
+            continue
+        for doc in task.result().get("documents", []):
             rid = doc.get("id", "")
             if rid and rid not in seen_ids:
                 seen_ids.add(rid)
@@ -57,57 +139,344 @@ async def _search_by_food_type(
 
 async def _enrich_restaurants(
     restaurants: list[dict],
+    deadline: float | None = None,
 ) -> list[ScoredRestaurant]:
-    """Fetch reviews + images in parallel, compute scores."""
+    """Fetch reviews + images in parallel, compute scores.
+
+    Fetches still pending at the deadline are abandoned; those restaurants
+    are scored on distance alone (rating unknown) and flagged as partial.
+    """
     if not restaurants:
         return []
 
     place_ids = [r["id"] for r in restaurants]
 
-    # Parallel: fetch reviews for each + batch images
-    review_tasks = [fetch_place_reviews(pid) for pid in place_ids]
-    image_task = fetch_place_images(place_ids)
-
-    review_results = await asyncio.gather(*review_tasks, return_exceptions=True)
-    image_map = await image_task
-
-    scored: list[ScoredRestaurant] = []
-    for i, r in enumerate(restaurants):
-        # Extract rating from review data
-        rating = 0.0
-        if i < len(review_results) and not isinstance(review_results[i], Exception):
-            review_data = review_results[i]
-            rating = review_data.get("avg_score", 0.0)
-
-        distance = r.get("distance", 0)
-        if isinstance(distance, str):
-            distance = int(distance) if distance.isdigit() else 0
-
-        dist_weight = compute_distance_weight(distance)
-        rec_score = compute_recommendation_score(rating, distance)
-
-        scored.append(ScoredRestaurant(
-            id=r.get("id", ""),
-            name=r.get("name", ""),
-            category=r.get("category", ""),
-            full_category=r.get("full_category", ""),
-            address=r.get("address", ""),
-            phone=r.get("phone", ""),
-            place_url=r.get("place_url", ""),
-            image_url=image_map.get(r.get("id", ""), r.get("image_url", "")),
-            lat=float(r.get("lat", 0)),
-            lng=float(r.get("lng", 0)),
-            distance=distance,
-            rating=rating,
-            recommendation_score=rec_score,
-            distance_weight=dist_weight,
-        ))
+    # Ratings come from the aggregated review stats rows when fresh; only the
+    # places without one need a review fetch. Images are fetched meanwhile.
+    image_tasks = {pid: asyncio.create_task(fetch_place_image(pid)) for pid in dict.fromkeys(place_ids)}
+    ratings = {pid: stats["avg_score"] for pid, stats in (await review_stats(place_ids)).items()}
+    review_tasks = {
+        pid: asyncio.create_task(fetch_place_reviews(pid))
+        for pid in dict.fromkeys(place_ids) if pid not in ratings
+    }
+    tasks = [*review_tasks.values(), *image_tasks.values()]
+    done, pending = await asyncio.wait(tasks, timeout=_remaining(deadline))
+    if pending:
+        _deadline_counters["enrich_timeouts"] += 1
+        _abandon(pending)
+
+    unknown: set[str] = set()
+    for pid, task in review_tasks.items():
+        if task not in done:
+            unknown.add(pid)
+        elif task.exception() is None:
+            ratings[pid] = task.result().get("avg_score", 0.0)
+    images = {
+        pid: task.result() if task.exception() is None else ""
+        for pid, task in image_tasks.items()
+        if task in done
+    }
 
+    scored = []
+    for r in restaurants:
+        pid = r["id"]
+        candidate = _to_scored(r, ratings.get(pid, 0.0), images.get(pid) or r.get("image_url", ""))
+        if pid in unknown or pid not in images:
+            candidate.rating_known = pid not in unknown
+            candidate.partial = True
+        scored.append(candidate)
     # PRD 11.5: score DESC → rating DESC → distance ASC
     scored.sort(key=lambda s: (-s.recommendation_score, -s.rating, s.distance))
     return scored
 
 
+def _to_scored(r: dict, rating: float, image_url: str) -> ScoredRestaurant:
+    distance = r.get("distance", 0)
+    if isinstance(distance, str):
+        distance = int(distance) if distance.isdigit() else 0
+
+    return ScoredRestaurant(
+        id=r.get("id", ""),
+        name=r.get("name", ""),
+        category=r.get("category", ""),
+        full_category=r.get("full_category", ""),
+        address=r.get("address", ""),
+        phone=r.get("phone", ""),
+        place_url=r.get("place_url", ""),
+        image_url=image_url,
+        lat=float(r.get("lat", 0)),
+        lng=float(r.get("lng", 0)),
+        distance=distance,
+        rating=rating,
+        recommendation_score=compute_recommendation_score(rating, distance),
+        distance_weight=compute_distance_weight(distance),
+    )
+
+
+async def _prescore(restaurants: list[dict]) -> list[ScoredRestaurant]:
+    """Score raw search results without any upstream call.
+
+    Ratings come from the aggregated review stats rows or the review cache
+    (0 and rating_known=False when neither has one), images from whatever
+    the search result already carries.
+    """
+    stats = await review_stats([r["id"] for r in restaurants])
+    scored = []
+    for r in restaurants:
+        rating = stats[r["id"]]["avg_score"] if r["id"] in stats else cached_rating(r["id"])
+        candidate = _to_scored(r, rating or 0.0, r.get("image_url", ""))
+        candidate.rating_known = rating is not None
+        scored.append(candidate)
+    scored.sort(key=lambda s: (-s.recommendation_score, -s.rating, s.distance))
+    return scored
+
+
+async def _split_top_k(
+    restaurants: list[dict],
+) -> tuple[list[ScoredRestaurant], list[ScoredRestaurant]]:
+    """Pre-score every candidate and split off the best RECOMMEND_ENRICH_TOP_K.
+
+    Both sides come back lazy (pre-scored only): the top K for /recommend
+    to enrich now, the rest for /recommend/more (all of them are top when
+    RECOMMEND_ENRICH_TOP_K is 0).
+    """
+    prescored = await _prescore(restaurants)
+    for candidate in prescored:
+        candidate.lazy = True
+    k = config.RECOMMEND_ENRICH_TOP_K
+    if k <= 0:
+        return prescored, []
+    _lazy_counters["deferred"] += len(prescored[k:])
+    return prescored[:k], prescored[k:]
+
+
+async def _enrich_lazy(
+    candidates,
+    deadline: float | None = None,
+) -> list[ScoredRestaurant]:
+    """Enrich the lazy candidates, keep the already enriched ones as they are.
+
+    Returned in PRD 11.5 order.
+    """
+    ready = [c for c in candidates if not c.lazy]
+    lazy = [c for c in candidates if c.lazy]
+    if lazy:
+        ready += await _enrich_restaurants([c.model_dump() for c in lazy], deadline)
+    ready.sort(key=lambda s: (-s.recommendation_score, -s.rating, s.distance))
+    return ready
+
+
+async def _candidates_for(
+    food_type: FoodType,
+    lat: float,
+    lng: float,
+    radius: int,
+    search: asyncio.Task | None = None,
+    deadline: float | None = None,
+    on_found: Callable[[int], None] | None = None,
+    deferred: bool = False,
+) -> tuple[list[ScoredRestaurant], list[ScoredRestaurant]]:
+    """Candidates for a food type, scored for the caller's position.
+
+    Returns (top, rest): `top` is what /recommend shows, `rest` what
+    /recommend/more appends after it. The search results are pre-scored
+    once and cached in that order; each caller takes the first K within
+    its radius as `top` (see result_cache.visible), so the top stays the
+    same for every caller sharing the entry and /recommend/more never
+    re-ranks it. Only the side the caller needs is enriched (`rest` when
+    `deferred`, else `top`); the other side keeps its lazy entries.
+
+    Served from the result cache when a nearby caller asked recently;
+    otherwise searched with the bucketed radius (or taken from an already
+    running speculative `search`), pre-scored, split and cached.
+    Enrichment cut off by the deadline (partial entries) is not cached.
+
+    `on_found` is called with the number of candidates within the caller's
+    radius as soon as they are known, before any enrichment.
+    """
+    key = result_cache.cache_key(food_type, lat, lng, radius)
+    entry = result_cache.get(key)
+    if entry is not None and on_found is not None:
+        view = result_cache.visible(entry, lat, lng, radius)
+        on_found(len(view.top) + len(view.rest))
+
+    def _needs_enrichment(cached: result_cache.Entry) -> bool:
+        view = result_cache.visible(cached, lat, lng, radius)
+        return any(c.lazy for c in (view.rest if deferred else view.top))
+
+    async def _fill(cached: result_cache.Entry | None) -> result_cache.Entry:
+        if cached is None:
+            if search is not None:
+                raw = await search
+            else:
+                raw = await _search_by_food_type(
+                    food_type, lat, lng, result_cache.radius_bucket(radius), deadline
+                )
+            if on_found is not None:
+                on_found(sum(1 for r in raw if r.get("distance", 0) <= radius))
+            split = result_cache.Entry(*map(tuple, await _split_top_k(raw)))
+        else:
+            split = cached
+        top, rest = result_cache.visible(split, lat, lng, radius)
+
+        if deferred:
+            lazy_ids = {c.id for c in rest if c.lazy}
+            updated = await _enrich_lazy(rest, deadline)
+            _lazy_counters["lazy_enriched"] += len(lazy_ids)
+            shown = [c.recommendation_score for c in top if not c.lazy]
+            if shown:
+                floor = min(shown)
+                _lazy_counters["overtook_top_k"] += sum(
+                    1 for c in updated if c.id in lazy_ids and c.recommendation_score > floor
+                )
+        else:
+            _lazy_counters["enriched_top"] += sum(1 for c in top if c.lazy)
+            updated = await _enrich_lazy(top, deadline)
+
+        if cached is not None:
+            result_cache.merge(key, [c for c in updated if not c.partial])
+        elif not any(c.partial for c in updated):
+            result_cache.put(key, *result_cache.replace(split, updated))
+        return result_cache.replace(split, updated)
+
+    if entry is None or _needs_enrichment(entry):
+        entry = await _flight.do((key, deferred), lambda: _fill(entry))
+        # Joined a caller elsewhere in the cell whose radius saw other candidates
+        if _needs_enrichment(entry):
+            entry = await _fill(entry)
+    top, rest = result_cache.visible(entry, lat, lng, radius)
+    return (
+        result_cache.relocate(top, lat, lng, radius),
+        result_cache.relocate(rest, lat, lng, radius),
+    )
+
+
+def _start_speculation(
+    food_type: FoodType,
+    lat: float,
+    lng: float,
+    radius: int,
+    deadline: float | None = None,
+) -> asyncio.Task | None:
+    """Start the secondary food type's search alongside the primary.
+
+    Only when it is not cached already and there is spare budget: fewer than
+    RECOMMEND_SPECULATIVE_MAX_INFLIGHT in flight and the REST bucket would
+    still admit a BACKGROUND call, so speculation never eats into the
+    budget reserved for user requests.
+    """
+    if result_cache.contains(result_cache.cache_key(food_type, lat, lng, radius)):
+        return None
+    if (
+        len(_speculative) >= config.RECOMMEND_SPECULATIVE_MAX_INFLIGHT
+        or not governor.admits("rest", Priority.BACKGROUND)
+    ):
+        _speculation_counters["skipped"] += 1
+        return None
+    task = asyncio.create_task(
+        _search_by_food_type(food_type, lat, lng, result_cache.radius_bucket(radius), deadline)
+    )
+    _speculative.add(task)
+    task.add_done_callback(_speculative.discard)
+    _speculation_counters["started"] += 1
+    return task
+
+
+def _cancel_speculation(task: asyncio.Task) -> None:
+    if not task.done():
+        task.cancel()
+        _speculation_counters["cancelled"] += 1
+
+
+async def _more_options(
+    food_type: FoodType,
+    lat: float,
+    lng: float,
+    radius: int,
+    search: asyncio.Task | None,
+    exclude: set[str],
+) -> list[ScoredRestaurant]:
+    """Secondary food type candidates for the "more options" section.
+
+    Uses the cached enriched list when there is one, otherwise pre-scores
+    the speculative search results without further upstream calls. Options
+    that are only pre-scored are flagged lazy; /recommend/more with
+    more_options=true enriches them.
+    """
+    cached = result_cache.get(result_cache.cache_key(food_type, lat, lng, radius))
+    if cached is not None:
+        options = result_cache.relocate([*cached.top, *cached.rest], lat, lng, radius)
+    elif search is not None:
+        raw = await search
+        options = result_cache.relocate(await _prescore(raw), lat, lng, radius)
+        for option in options:
+            option.lazy = True
+    else:
+        return []
+    return [o for o in options if o.id not in exclude]
+
+
+async def _enrich_more_options(
+    food_type: FoodType,
+    lat: float,
+    lng: float,
+    radius: int,
+    exclude: set[str],
+    deadline: float | None = None,
+) -> list[ScoredRestaurant]:
+    """Enrich the lazy "more options" candidates /recommend returned.
+
+    From the secondary's cached list when there is one (enriched entries
+    are written back), otherwise from a fresh search, which the search
+    cache serves after the speculative one. Returned in score order; the
+    client replaces the matching option cards by id.
+    """
+    key = result_cache.cache_key(food_type, lat, lng, radius)
+    cached = result_cache.get(key)
+    if cached is not None:
+        lazy = [c for c in (*cached.top, *cached.rest) if c.lazy and c.id not in exclude]
+        if not lazy:
+            return []
+        enriched = await _enrich_restaurants([c.model_dump() for c in lazy], deadline)
+        result_cache.merge(key, [c for c in enriched if not c.partial])
+    else:
+        raw = await _search_by_food_type(food_type, lat, lng, result_cache.radius_bucket(radius), deadline)
+        enriched = await _enrich_restaurants([r for r in raw if r["id"] not in exclude], deadline)
+    return result_cache.relocate(enriched, lat, lng, radius)
+
+
+def _rank_by_keywords(
+    scored: list[ScoredRestaurant],
+    food_type: FoodType,
+    flags: frozenset[str],
+    k: int = 10,
+) -> list[ScoredRestaurant]:
+    """Re-rank enriched candidates with the PRD BE-01 keyword formula."""
+    if not scored:
+        return scored
+    weights = weight_vector(food_type, flags)
+    ratings = np.fromiter((s.rating for s in scored), dtype=np.float32, count=len(scored))
+    totals, counts = keyword_matrix.score([s.id for s in scored], ratings, weights)
+
+    ranked = []
+    for i in top_k(totals, k):
+        s = scored[i]
+        s.recommendation_score = round(float(totals[i]), 1)
+        s.keyword_score = round(float(totals[i] - ratings[i] * 10), 1)
+        s.matched_keywords = matched_keywords(counts[i], weights)
+        ranked.append(s)
+    return ranked
+
+
+def _condition_summary(body: RecommendRequest) -> dict[str, bool]:
+    return {
+        "spicy": body.spicy,
+        "warm": body.warm,
+        "light": body.light,
+        "soup": body.soup,
+    }
+
+
 @router.post("/recommend", response_model=RecommendResponse)
 @limiter.limit(RateLimits.GENERAL)
 async def recommend(request: Request, body: RecommendRequest) -> RecommendResponse:
@@ -118,34 +487,345 @@ async def recommend(request: Request, body: RecommendRequest) -> RecommendRespon
     # 2. Determine primary + secondary food type
     primary, secondary = determine_food_type(scores)
 
-    # 3. Search restaurants by primary food type
-    raw_restaurants = await _search_by_food_type(
-        primary, body.lat, body.lng, body.radius
-    )
+    flags = condition_flags(body.spicy, body.warm, body.light, body.soup)
+    deadline = _deadline_after(config.RECOMMEND_DEADLINE)
+    if body.scoring == ScoringMode.KEYWORD:
+        await keyword_matrix.ensure_fresh()
 
-    # 4. Enrich with reviews, images, scores
-    scored = await _enrich_restaurants(raw_restaurants)
+    # Optionally start the secondary search now instead of after an empty primary
+    speculation = None
+    if secondary and (config.RECOMMEND_SPECULATIVE or body.more_options):
+        speculation = _start_speculation(secondary, body.lat, body.lng, body.radius, deadline)
 
-    # 5. If 0 results with primary, try secondary
-    if not scored and secondary:
-        raw_restaurants = await _search_by_food_type(
-            secondary, body.lat, body.lng, body.radius
+    def _primary_found(count: int) -> None:
+        # The secondary is only needed for an empty primary (or more options):
+        # stop its search now rather than after the primary's enrichment
+        nonlocal speculation
+        if count and not body.more_options and speculation is not None:
+            _cancel_speculation(speculation)
+            speculation = None
+
+    more_options: list[ScoredRestaurant] = []
+    try:
+        # 3-4. Search + enrich restaurants for the primary food type (cached per area)
+        scored, deferred = await _candidates_for(
+            primary, body.lat, body.lng, body.radius, deadline=deadline, on_found=_primary_found
         )
-        scored = await _enrich_restaurants(raw_restaurants)
+        scored_type = primary
 
-    condition_summary = {
-        "spicy": body.spicy,
-        "warm": body.warm,
-        "light": body.light,
-        "soup": body.soup,
-    }
+        # 5. If 0 results with primary, try secondary
+        if not scored and not deferred and secondary:
+            if speculation is not None:
+                _speculation_counters["used"] += 1
+            scored, deferred = await _candidates_for(
+                secondary, body.lat, body.lng, body.radius, search=speculation, deadline=deadline
+            )
+            scored_type = secondary
+            speculation = None
+        elif secondary and body.more_options:
+            more_options = await _more_options(
+                secondary, body.lat, body.lng, body.radius, speculation,
+                {s.id for s in [*scored, *deferred]},
+            )
+            if more_options:
+                _speculation_counters["more_options"] += 1
+            speculation = None
+    finally:
+        # Request failed (or more options came from the cache) — drop the secondary search
+        if speculation is not None:
+            _cancel_speculation(speculation)
+
+    # Deferred candidates are left for /recommend/more
+    remaining = len(deferred)
+    if body.scoring == ScoringMode.KEYWORD:
+        scored = _rank_by_keywords(scored, scored_type, flags)
+    partial = any(s.partial for s in scored)
+    if partial:
+        _deadline_counters["partial_responses"] += 1
 
     return RecommendResponse(
         food_type=primary,
         food_type_label=FOOD_TYPE_LABELS[primary],
         food_type_reason=FOOD_TYPE_REASONS[primary],
-        condition_summary=condition_summary,
+        condition_summary=_condition_summary(body),
         restaurants=scored,
         total_count=len(scored),
         secondary_food_type=secondary,
+        scoring=body.scoring,
+        more_options=more_options,
+        partial=partial,
+        remaining_count=remaining,
     )
+
+
+@router.post("/recommend/more", response_model=RecommendResponse)
+@limiter.limit(RateLimits.GENERAL)
+async def recommend_more(request: Request, body: RecommendRequest) -> RecommendResponse:
+    """Enrich and return the candidates /recommend deferred.
+
+    Takes the same body as /recommend. `restaurants` holds only the
+    additional candidates, in score order, to be appended after the ones
+    already shown; the top K are never re-ranked or re-enriched here. If
+    the cached split has expired, the search (served by the search cache)
+    is pre-scored and split again; the places /recommend showed now have
+    cached ratings, so they land in the top K again. With
+    more_options=true, `more_options` holds the lazy "more options"
+    candidates, now enriched.
+    """
+    scores = compute_food_type_scores(body.spicy, body.warm, body.light, body.soup)
+    primary, secondary = determine_food_type(scores)
+    flags = condition_flags(body.spicy, body.warm, body.light, body.soup)
+    deadline = _deadline_after(config.RECOMMEND_DEADLINE)
+    if body.scoring == ScoringMode.KEYWORD:
+        await keyword_matrix.ensure_fresh()
+
+    # Same food type choice as /recommend (secondary only when primary is empty)
+    scored_type = primary
+    shown, more = await _candidates_for(
+        primary, body.lat, body.lng, body.radius, deadline=deadline, deferred=True
+    )
+    if not shown and not more and secondary:
+        scored_type = secondary
+        shown, more = await _candidates_for(
+            secondary, body.lat, body.lng, body.radius, deadline=deadline, deferred=True
+        )
+    _lazy_counters["more_requests"] += 1
+    if body.scoring == ScoringMode.KEYWORD:
+        more = _rank_by_keywords(more, scored_type, flags)
+    more_options: list[ScoredRestaurant] = []
+    if secondary and body.more_options and scored_type == primary:
+        more_options = await _enrich_more_options(
+            secondary, body.lat, body.lng, body.radius, {c.id for c in [*shown, *more]}, deadline
+        )
+    partial = any(s.partial for s in [*more, *more_options])
+    if partial:
+        _deadline_counters["partial_responses"] += 1
+
+    return RecommendResponse(
+        food_type=primary,
+        food_type_label=FOOD_TYPE_LABELS[primary],
+        food_type_reason=FOOD_TYPE_REASONS[primary],
+        condition_summary=_condition_summary(body),
+        restaurants=more,
+        total_count=len(more),
+        secondary_food_type=secondary,
+        scoring=body.scoring,
+        more_options=more_options,
+        partial=partial,
+    )
+
+
+async def _stream_candidates(
+    food_type: FoodType,
+    lat: float,
+    lng: float,
+    radius: int,
+    deferred: list[ScoredRestaurant],
+    deadline: float | None = None,
+) -> AsyncIterator[ScoredRestaurant]:
+    """Yield each top-K candidate as soon as its own enrichment finishes.
+
+    Same split and cache entry as /recommend: the top K of a result-cache
+    hit are yielded at once (any still lazy are enriched like on a miss);
+    on a miss the search results are pre-scored and split, and each of the
+    top K fetches its rating (unless a fresh stats row exists) and image
+    independently. The rest are appended to `deferred`, left for
+    /recommend/more. The entry is cached (or updated) once the top K are
+    done. Candidates still enriching at the deadline are yielded as
+    partial (distance-only) entries and their fetches are abandoned.
+    """
+    key = result_cache.cache_key(food_type, lat, lng, radius)
+    entry = result_cache.get(key)
+    if entry is None:
+        raw = await _search_by_food_type(food_type, lat, lng, result_cache.radius_bucket(radius), deadline)
+        split = result_cache.Entry(*map(tuple, await _split_top_k(raw)))
+    else:
+        split = entry
+    top, rest = result_cache.visible(split, lat, lng, radius)
+    deferred.extend(result_cache.relocate(rest, lat, lng, radius))
+    for candidate in result_cache.relocate([c for c in top if not c.lazy], lat, lng, radius):
+        yield candidate
+    lazy = [c.model_dump() for c in top if c.lazy]
+    if not lazy:
+        if entry is None:
+            result_cache.put(key, *split)
+        return
+    _lazy_counters["enriched_top"] += len(lazy)
+    stats = await review_stats([r["id"] for r in lazy])
+
+    async def _rating(place_id: str) -> float:
+        if place_id in stats:
+            return stats[place_id]["avg_score"]
+        return (await fetch_place_reviews(place_id)).get("avg_score", 0.0)
+
+    async def _enrich_one(r: dict) -> ScoredRestaurant:
+        rating, image_url = await asyncio.gather(
+            _rating(r["id"]), fetch_place_image(r["id"]), return_exceptions=True
+        )
+        if isinstance(rating, Exception):
+            rating = 0.0
+        if isinstance(image_url, Exception):
+            image_url = ""
+        return _to_scored(r, rating, image_url or r.get("image_url", ""))
+
+    tasks = {asyncio.create_task(_enrich_one(r)): r for r in lazy}
+    pending = set(tasks)
+    enriched: list[ScoredRestaurant] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=_remaining(deadline), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                candidate = task.result()
+                enriched.append(candidate)
+                for relocated in result_cache.relocate([candidate], lat, lng, radius):
+                    yield relocated
+    except BaseException:
+        # Client went away mid-stream — stop the remaining fetches
+        for task in pending:
+            task.cancel()
+        raise
+
+    if pending:
+        _deadline_counters["enrich_timeouts"] += 1
+        _abandon(pending)
+        for task in pending:
+            r = tasks[task]
+            partial = _to_scored(r, 0.0, r.get("image_url", ""))
+            partial.rating_known = False
+            partial.partial = True
+            for relocated in result_cache.relocate([partial], lat, lng, radius):
+                yield relocated
+        return
+
+    if entry is not None:
+        result_cache.merge(key, enriched)
+        return
+    result_cache.put(key, *result_cache.replace(split, enriched))
+
+
+def _ranked(
+    scored: list[ScoredRestaurant],
+    body: RecommendRequest,
+    food_type: FoodType,
+    flags: frozenset[str],
+) -> list[ScoredRestaurant]:
+    """Final ordering for the request's scoring mode (inputs left untouched)."""
+    if body.scoring == ScoringMode.KEYWORD:
+        return _rank_by_keywords([s.model_copy() for s in scored], food_type, flags)
+    return sorted(scored, key=lambda s: (-s.recommendation_score, -s.rating, s.distance))
+
+
+def _encode_event(event: str, data: dict, fmt: StreamFormat) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    if fmt == StreamFormat.SSE:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return json.dumps({"event": event, **data}, ensure_ascii=False) + "\n"
+
+
+@router.post("/recommend/stream")
+@limiter.limit(RateLimits.GENERAL)
+async def recommend_stream(
+    request: Request,
+    body: RecommendRequest,
+    format: StreamFormat = StreamFormat.NDJSON,
+):
+    """Progressive variant of /recommend (NDJSON or SSE).
+
+    Events, in order:
+      food_type   — the decision, sent before any upstream call
+      fallback    — primary had no candidates, switching to the secondary
+      restaurant  — one card, as soon as its enrichment completes
+      rank        — current ordering (ids + scores) after each card
+      done        — the same payload /recommend would return (top K only,
+                    remaining_count left for /recommend/more)
+    """
+    scores = compute_food_type_scores(body.spicy, body.warm, body.light, body.soup)
+    primary, secondary = determine_food_type(scores)
+    flags = condition_flags(body.spicy, body.warm, body.light, body.soup)
+    deadline = _deadline_after(config.RECOMMEND_STREAM_DEADLINE)
+
+    async def _events() -> AsyncIterator[str]:
+        yield _encode_event("food_type", {
+            "food_type": primary.value,
+            "food_type_label": FOOD_TYPE_LABELS[primary],
+            "food_type_reason": FOOD_TYPE_REASONS[primary],
+            "secondary_food_type": secondary.value if secondary else None,
+            "condition_summary": _condition_summary(body),
+        }, format)
+        if body.scoring == ScoringMode.KEYWORD:
+            await keyword_matrix.ensure_fresh()
+
+        scored: list[ScoredRestaurant] = []
+        deferred: list[ScoredRestaurant] = []
+        scored_type = primary
+        for food_type in (primary, secondary):
+            if food_type is None:
+                break
+            if food_type != primary:
+                yield _encode_event("fallback", {"food_type": food_type.value}, format)
+            scored_type = food_type
+            async for candidate in _stream_candidates(
+                food_type, body.lat, body.lng, body.radius, deferred, deadline
+            ):
+                scored.append(candidate)
+                yield _encode_event("restaurant", candidate.model_dump(mode="json"), format)
+                yield _encode_event("rank", {"ranking": [
+                    {"id": s.id, "recommendation_score": s.recommendation_score}
+                    for s in _ranked(scored, body, scored_type, flags)
+                ]}, format)
+            if scored or deferred:
+                break
+
+        final = _ranked(scored, body, scored_type, flags)
+        partial = any(s.partial for s in final)
+        if partial:
+            _deadline_counters["partial_responses"] += 1
+        response = RecommendResponse(
+            food_type=primary,
+            food_type_label=FOOD_TYPE_LABELS[primary],
+            food_type_reason=FOOD_TYPE_REASONS[primary],
+            condition_summary=_condition_summary(body),
+            restaurants=final,
+            total_count=len(final),
+            secondary_food_type=secondary,
+            scoring=body.scoring,
+            partial=partial,
+            remaining_count=len(deferred),
+        )
+        yield _encode_event("done", response.model_dump(mode="json"), format)
+
+    media_type = "text/event-stream" if format == StreamFormat.SSE else "application/x-ndjson"
+    return StreamingResponse(_events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
+@router.get("/admin/recommend", dependencies=[Depends(require_admin_key)])
+@limiter.limit(RateLimits.GENERAL)
+async def recommend_status(request: Request):
+    """Recommendation cache statistics (admin)."""
+    return {
+        "result_cache": result_cache.stats(),
+        "singleflight": _flight.stats(),
+        "speculation": {
+            "enabled": config.RECOMMEND_SPECULATIVE,
+            "inflight": len(_speculative),
+            **_speculation_counters,
+        },
+        "deadline": {
+            "recommend_sec": config.RECOMMEND_DEADLINE,
+            "stream_sec": config.RECOMMEND_STREAM_DEADLINE,
+            "abandoned_inflight": len(_abandoned),
+            **_deadline_counters,
+        },
+        "lazy": {
+            "top_k": config.RECOMMEND_ENRICH_TOP_K,
+            **_lazy_counters,
+            "overtake_ratio": (
+                round(_lazy_counters["overtook_top_k"] / _lazy_counters["lazy_enriched"], 3)
+                if _lazy_counters["lazy_enriched"] else 0.0
+            ),
+        },
+    }
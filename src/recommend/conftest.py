@@ -0,0 +1,112 @@
+"""추천 API 테스트 공용 설정
+
+카카오 호출 함수(검색/리뷰/이미지)를 recommend.api 안에서 가짜로 바꿔 끼우고
+추천 결과 캐시/요청 합치기/통계는 테스트마다 초기화
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from chatbot.rate_limit import limiter
+from restaurant.singleflight import SingleFlight
+
+from . import api, result_cache
+from .food_type_search import FOOD_TYPE_KEYWORDS
+from .schemas import FoodType
+from .scoring import compute_food_type_scores, determine_food_type
+
+app = FastAPI()
+app.state.limiter = limiter
+app.include_router(api.router)
+
+LAT, LNG = 37.5, 127.0
+# 매콤 + 따뜻 + 국물 → 주 유형 SPICY_SOUP, 보조 유형 MILD_SOUP
+BODY = {"spicy": True, "warm": True, "light": False, "soup": True, "lat": LAT, "lng": LNG, "radius": 1000}
+PRIMARY, SECONDARY = determine_food_type(compute_food_type_scores(True, True, False, True))
+
+
+def place(pid: str, distance: int) -> dict:
+    """검색 결과 문서 (요청 좌표에서 정북 방향 distance m)"""
+    return {
+        "id": pid,
+        "name": f"매장{pid}",
+        "category": "한식",
+        "lat": LAT + distance / 111_320,
+        "lng": LNG,
+        "distance": distance,
+    }
+
+
+class FakeUpstream:
+    """검색/리뷰/이미지 가짜 업스트림
+
+    results: 음식 유형 → 검색 결과 (첫 키워드로만 나옴)
+    ratings: place_id → 평균 별점 (리뷰를 가져온 뒤에는 cached_rating에도 나옴)
+    search_delay: 음식 유형 → 검색 지연(초)
+    """
+
+    def __init__(self):
+        self.results: dict[FoodType, list[dict]] = {}
+        self.ratings: dict[str, float] = {}
+        self.search_delay: dict[FoodType, float] = {}
+        self.searched: list[str] = []
+        self.cancelled: list[str] = []
+        self.reviewed: list[str] = []
+        self.imaged: list[str] = []
+        self.on_review = lambda place_id: None
+
+    def _food_type(self, query: str) -> FoodType | None:
+        for food_type, keywords in FOOD_TYPE_KEYWORDS.items():
+            if query == keywords[0]:
+                return food_type
+        return None
+
+    async def search_keyword(self, query: str, lat: float, lng: float, radius: int, size: int = 15) -> dict:
+        food_type = self._food_type(query)
+        self.searched.append(query)
+        try:
+            await asyncio.sleep(self.search_delay.get(food_type, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(query)
+            raise
+        return {"documents": [dict(d) for d in self.results.get(food_type, [])]}
+
+    async def fetch_place_reviews(self, place_id: str) -> dict:
+        self.on_review(place_id)
+        self.reviewed.append(place_id)
+        return {"reviews": [], "total_count": 1, "avg_score": self.ratings.get(place_id, 0.0)}
+
+    async def fetch_place_image(self, place_id: str) -> str:
+        self.imaged.append(place_id)
+        return f"https://img/{place_id}.jpg"
+
+    def cached_rating(self, place_id: str) -> float | None:
+        return self.ratings.get(place_id) if place_id in self.reviewed else None
+
+
+@pytest.fixture
+def upstream(kakao, monkeypatch) -> FakeUpstream:
+    fake = FakeUpstream()
+    monkeypatch.setattr(api, "search_keyword", fake.search_keyword)
+    monkeypatch.setattr(api, "fetch_place_reviews", fake.fetch_place_reviews)
+    monkeypatch.setattr(api, "fetch_place_image", fake.fetch_place_image)
+    monkeypatch.setattr(api, "cached_rating", fake.cached_rating)
+    monkeypatch.setattr(api, "search_local", lambda *args, **kwargs: None)
+
+    async def no_stats(place_ids: list[str]) -> dict:
+        return {}
+
+    monkeypatch.setattr(api, "review_stats", no_stats)
+    monkeypatch.setattr(api, "_flight", SingleFlight())
+    result_cache._cache.clear()
+    return fake
+
+
+def post(path: str, body: dict, **params) -> httpx.Response:
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(path, json=body, params=params)
+    return asyncio.run(run())
@@ -0,0 +1,179 @@
+"""
+Keyword-weight scoring engine (PRD BE-01).
+
+    TotalScore = Σ(KeywordCount × Weight) + Rating × 10
+
+KeywordCount comes from `restaurant_keywords` (filled by the review keyword
+batch) and is held in memory as a dense place × keyword count matrix.
+`condition_rules` are compiled once into weight vectors per
+(food type, condition flag) pair, so scoring a candidate list is a row
+gather, one matrix-vector product and an argpartition for the top k.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import select
+
+from database.connection import SessionLocal
+from database.models import RestaurantKeyword
+from restaurant import config
+from restaurant.keywords import LEXICON
+
+from .schemas import FoodType
+
+# Column order of the count matrix / weight vectors
+KEYWORDS: list[str] = list(LEXICON)
+_KEYWORD_INDEX = {keyword: i for i, keyword in enumerate(KEYWORDS)}
+
+RATING_WEIGHT = 10.0
+
+# PRD 7.2 condition_rules: (condition, detail) -> [(target keyword, weight)]
+# condition = food type, detail = condition flag ("*" applies to every request)
+CONDITION_RULES: dict[tuple[FoodType, str], list[tuple[str, float]]] = {
+    (FoodType.SPICY_SOUP, "*"):       [("얼큰", 2.0), ("국물", 1.5), ("해장", 1.5)],
+    (FoodType.SPICY_SOUP, "SPICY"):   [("맵다", 1.5)],
+    (FoodType.SPICY_SOUP, "WARM"):    [("뜨끈", 1.2)],
+    (FoodType.MILD_SOUP, "*"):        [("국물", 1.5), ("담백", 2.0)],
+    (FoodType.MILD_SOUP, "NON_SPICY"): [("부드럽다", 1.0), ("맵다", -1.0)],
+    (FoodType.MILD_SOUP, "WARM"):     [("뜨끈", 1.2)],
+    (FoodType.MEAT_HEAVY, "*"):       [("든든", 2.0), ("푸짐", 1.5)],
+    (FoodType.MEAT_HEAVY, "HEAVY"):   [("고소", 1.0)],
+    (FoodType.LIGHT_MEAL, "*"):       [("가볍다", 2.0), ("신선", 1.5), ("건강", 1.5), ("느끼", -1.5)],
+    (FoodType.LIGHT_MEAL, "LIGHT"):   [("깔끔", 1.2)],
+    (FoodType.COMFORT_FOOD, "*"):     [("든든", 1.5), ("뜨끈", 1.5)],
+    (FoodType.COMFORT_FOOD, "NON_SPICY"): [("담백", 1.2)],
+    (FoodType.COMFORT_FOOD, "SOUP"):  [("국물", 1.0)],
+    (FoodType.REFRESH_MEAL, "*"):     [("시원", 2.0), ("깔끔", 1.5)],
+    (FoodType.REFRESH_MEAL, "COOL"):  [("신선", 1.2)],
+    (FoodType.GREASY_MEAL, "*"):      [("바삭", 2.0), ("고소", 1.5)],
+    (FoodType.GREASY_MEAL, "HEAVY"):  [("푸짐", 1.2)],
+    (FoodType.QUICK_MEAL, "*"):       [("가성비", 2.0), ("깔끔", 1.0)],
+    (FoodType.QUICK_MEAL, "DRY"):     [("든든", 1.0)],
+}
+
+
+def _compile_rules() -> dict[tuple[FoodType, str], np.ndarray]:
+    compiled = {}
+    for pair, rules in CONDITION_RULES.items():
+        vector = np.zeros(len(KEYWORDS), dtype=np.float32)
+        for keyword, weight in rules:
+            vector[_KEYWORD_INDEX[keyword]] += weight
+        compiled[pair] = vector
+    return compiled
+
+
+_RULE_VECTORS = _compile_rules()
+
+
+def condition_flags(spicy: bool, warm: bool, light: bool, soup: bool) -> frozenset[str]:
+    """Same flag names as the food type rules in scoring.py."""
+    return frozenset({
+        "SPICY" if spicy else "NON_SPICY",
+        "WARM" if warm else "COOL",
+        "LIGHT" if light else "HEAVY",
+        "SOUP" if soup else "DRY",
+    })
+
+
+@lru_cache(maxsize=256)
+def weight_vector(food_type: FoodType, flags: frozenset[str]) -> np.ndarray:
+    """Weight vector for a request: the food type's "*" rules plus each active flag's."""
+    vector = np.zeros(len(KEYWORDS), dtype=np.float32)
+    for detail in ("*", *sorted(flags)):
+        rules = _RULE_VECTORS.get((food_type, detail))
+        if rules is not None:
+            vector += rules
+    vector.flags.writeable = False
+    return vector
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (argpartition, then sort only k)."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+class KeywordMatrix:
+    """Dense place × keyword count matrix loaded from `restaurant_keywords`.
+
+    Rows are looked up by place_id; places without any counted review map to
+    a shared all-zero row, so every candidate can be scored in one product.
+    """
+
+    def __init__(self) -> None:
+        self.counts = np.zeros((1, len(KEYWORDS)), dtype=np.float32)
+        self.rows: dict[str, int] = {}
+        self.loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def load_rows(self, rows) -> None:
+        """Build the matrix from (place_id, keyword, count) rows."""
+        index: dict[str, int] = {}
+        entries: list[tuple[int, int, int]] = []
+        for place_id, keyword, count in rows:
+            col = _KEYWORD_INDEX.get(keyword)
+            if col is None:
+                continue
+            row = index.setdefault(place_id, len(index) + 1)
+            entries.append((row, col, count))
+        counts = np.zeros((len(index) + 1, len(KEYWORDS)), dtype=np.float32)
+        if entries:
+            r, c, v = np.array(entries, dtype=np.int64).T
+            counts[r, c] = v
+        self.counts, self.rows = counts, index
+        self.loaded_at = time.time()
+
+    def _load_sync(self) -> None:
+        with SessionLocal() as db:
+            self.load_rows(db.execute(
+                select(RestaurantKeyword.restaurant_id, RestaurantKeyword.keyword, RestaurantKeyword.count)
+            ))
+
+    async def ensure_fresh(self) -> None:
+        """Reload from the DB when older than KEYWORD_MATRIX_REFRESH_INTERVAL.
+
+        A failed reload keeps serving the previous matrix.
+        """
+        if time.time() - self.loaded_at < config.KEYWORD_MATRIX_REFRESH_INTERVAL:
+            return
+        async with self._lock:
+            if time.time() - self.loaded_at < config.KEYWORD_MATRIX_REFRESH_INTERVAL:
+                return
+            try:
+                await asyncio.to_thread(self._load_sync)
+            except Exception as e:
+                self.loaded_at = time.time()
+                print(f"Keyword matrix load error: {e}")
+
+    def gather(self, place_ids: list[str]) -> np.ndarray:
+        """Count rows for the candidates (row 0 = no keywords)."""
+        idx = np.fromiter((self.rows.get(pid, 0) for pid in place_ids), dtype=np.intp, count=len(place_ids))
+        return self.counts[idx]
+
+    def score(
+        self,
+        place_ids: list[str],
+        ratings: np.ndarray,
+        weights: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """TotalScore per candidate plus the gathered count rows."""
+        counts = self.gather(place_ids)
+        return counts @ weights + ratings * RATING_WEIGHT, counts
+
+
+def matched_keywords(counts_row: np.ndarray, weights: np.ndarray, limit: int = 3) -> list[str]:
+    """Keywords that contributed most to a candidate's score (for the card badges)."""
+    contribution = counts_row * weights
+    order = np.argsort(-contribution, kind="stable")[:limit]
+    return [KEYWORDS[i] for i in order if contribution[i] > 0]
+
+
+keyword_matrix = KeywordMatrix()
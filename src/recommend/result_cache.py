@@ -0,0 +1,147 @@
+"""
+Short-lived cache of enriched recommendation candidates.
+
+Users a few hundred meters apart asking for the same food type get nearly
+the same candidates, so the enriched list (ratings, images) is cached per
+(food type, snapped cell, radius bucket). Only the distance-dependent part
+of the score is recomputed against each caller's exact coordinates.
+
+Entries keep the candidates in the order they were first split at top K.
+Each caller re-splits the ones within its own radius in that order, so the
+cards /recommend shows stay the same for every caller sharing the entry
+from the same spot and /recommend/more only ever appends after them.
+"""
+
+import bisect
+from typing import NamedTuple
+
+from restaurant import config
+from restaurant.cache import TTLCache
+from restaurant.geo import haversine_m, snap_to_cell
+
+from .schemas import FoodType, ScoredRestaurant
+from .scoring import compute_distance_weight, compute_recommendation_score
+
+# Search radii are rounded up to one of these so nearby radii share entries
+RADIUS_BUCKETS = (500, 1000, 1500, 2000, 3000, 5000)
+
+
+class Entry(NamedTuple):
+    """Cached candidates, split at RECOMMEND_ENRICH_TOP_K over the bucket radius.
+
+    `top` then `rest` is the order callers re-split in (see `visible`).
+    Either side may hold lazy (pre-scored only) candidates until an
+    endpoint enriches them.
+    """
+    top: tuple[ScoredRestaurant, ...]
+    rest: tuple[ScoredRestaurant, ...] = ()
+
+
+_cache = TTLCache(
+    maxsize=config.RECOMMEND_CACHE_MAX_ENTRIES,
+    ttl=config.RECOMMEND_CACHE_TTL,
+    negative_ttl=config.RECOMMEND_CACHE_NEGATIVE_TTL,
+)
+
+
+def radius_bucket(radius: int) -> int:
+    """Smallest bucket covering the radius (the radius itself past the last one)."""
+    i = bisect.bisect_left(RADIUS_BUCKETS, radius)
+    return RADIUS_BUCKETS[i] if i < len(RADIUS_BUCKETS) else radius
+
+
+def cache_key(food_type: FoodType, lat: float, lng: float, radius: int) -> tuple:
+    cell, _, _ = snap_to_cell(lat, lng, config.RECOMMEND_CACHE_CELL_M)
+    return (food_type, cell, radius_bucket(radius))
+
+
+def get(key: tuple) -> Entry | None:
+    if not config.RECOMMEND_CACHE_ENABLED:
+        return None
+    return _cache.get(key)
+
+
+def contains(key: tuple) -> bool:
+    """Whether a fresh entry exists (does not count as a hit or miss)."""
+    return config.RECOMMEND_CACHE_ENABLED and _cache.peek(key) is not None
+
+
+def put(key: tuple, top: list[ScoredRestaurant], rest: list[ScoredRestaurant] = ()) -> None:
+    if not config.RECOMMEND_CACHE_ENABLED:
+        return
+    _cache.set(
+        key,
+        Entry(tuple(c.model_copy() for c in top), tuple(c.model_copy() for c in rest)),
+        negative=not top and not rest,
+    )
+
+
+def replace(entry: Entry, updated: list[ScoredRestaurant]) -> Entry:
+    """The entry with candidates replaced by id, each keeping its position."""
+    by_id = {c.id: c for c in updated}
+    return Entry(*(
+        tuple(by_id[c.id].model_copy() if c.id in by_id else c for c in side)
+        for side in entry
+    ))
+
+
+def merge(key: tuple, updated: list[ScoredRestaurant]) -> None:
+    """Replace candidates by id (e.g. lazy ones once enriched) in the cached entry.
+
+    No-op when the entry has expired in the meantime.
+    """
+    if not config.RECOMMEND_CACHE_ENABLED:
+        return
+    current = _cache.peek(key)
+    if current is None:
+        return
+    _cache.set(key, replace(current, updated))
+
+
+def _distance(c: ScoredRestaurant, lat: float, lng: float) -> int:
+    return haversine_m(lat, lng, c.lat, c.lng) if c.lat or c.lng else c.distance
+
+
+def visible(entry: Entry, lat: float, lng: float, radius: int) -> Entry:
+    """The entry's candidates within the caller's radius, re-split at top K.
+
+    Entries are split over the bucket radius; splitting each side by the
+    caller's smaller radius would drop top-K cards outside it with nothing
+    taking their place. Instead the candidates keep the entry's order (top,
+    then rest) and the first RECOMMEND_ENRICH_TOP_K within the radius form
+    the caller's top. Not relocated; lazy candidates stay lazy.
+    """
+    inside = tuple(c for c in (*entry.top, *entry.rest) if _distance(c, lat, lng) <= radius)
+    k = config.RECOMMEND_ENRICH_TOP_K
+    if k <= 0:
+        return Entry(inside)
+    return Entry(inside[:k], inside[k:])
+
+
+def relocate(
+    candidates,
+    lat: float,
+    lng: float,
+    radius: int,
+) -> list[ScoredRestaurant]:
+    """Copies re-scored for the caller's position, outside-radius ones dropped.
+
+    Rating and images are kept; distance, distance weight and the
+    recommendation score are recomputed, then PRD 11.5 ordering applies.
+    """
+    relocated = []
+    for c in candidates:
+        distance = _distance(c, lat, lng)
+        if distance > radius:
+            continue
+        relocated.append(c.model_copy(update={
+            "distance": distance,
+            "distance_weight": compute_distance_weight(distance),
+            "recommendation_score": compute_recommendation_score(c.rating, distance),
+        }))
+    relocated.sort(key=lambda s: (-s.recommendation_score, -s.rating, s.distance))
+    return relocated
+
+
+def stats() -> dict:
+    return {"enabled": config.RECOMMEND_CACHE_ENABLED, **_cache.stats()}
@@ -14,6 +14,16 @@ class FoodType(str, Enum):
     QUICK_MEAL = "QUICK_MEAL"
 
 
+class ScoringMode(str, Enum):
+    DISTANCE = "distance"  # PRD 11.2: rating * 15 + distance weight
+    KEYWORD = "keyword"    # PRD BE-01: Σ(keyword count * weight) + rating * 10
+
+
+class StreamFormat(str, Enum):
+    NDJSON = "ndjson"  # one JSON object per line, "event" field names the event
+    SSE = "sse"        # text/event-stream frames (event: / data:)
+
+
 class RecommendRequest(BaseModel):
     spicy: bool
     warm: bool
@@ -22,6 +32,8 @@ class RecommendRequest(BaseModel):
     lat: float
     lng: float
     radius: int = Field(default=1200, ge=200, le=5000)
+    scoring: ScoringMode = ScoringMode.DISTANCE
+    more_options: bool = False  # also return the secondary food type's candidates
 
 
 class ScoredRestaurant(BaseModel):
@@ -39,6 +51,11 @@ class ScoredRestaurant(BaseModel):
     rating: float = 0.0
     recommendation_score: float = 0.0
     distance_weight: int = 0
+    keyword_score: float = 0.0
+    matched_keywords: list[str] = []
+    rating_known: bool = True  # False: rating not fetched (deadline hit or deferred), 0 placeholder
+    partial: bool = False      # enrichment (rating or image) cut off by the deadline
+    lazy: bool = False         # pre-scored only; enriched on demand by /recommend/more
 
 
 class RecommendResponse(BaseModel):
@@ -49,3 +66,7 @@ class RecommendResponse(BaseModel):
     restaurants: list[ScoredRestaurant]
     total_count: int
     secondary_food_type: FoodType | None = None
+    scoring: ScoringMode = ScoringMode.DISTANCE
+    more_options: list[ScoredRestaurant] = []
+    partial: bool = False  # some restaurants were scored on distance alone
+    remaining_count: int = 0  # deferred candidates available from /recommend/more
@@ -0,0 +1,84 @@
+"""추천 마감 시간 테스트 (늦은 리뷰는 거리만으로 점수, 부분 결과 미캐시, 버린 요청은 계속 실행)"""
+
+import asyncio
+
+from restaurant import config
+
+from . import api, result_cache
+from .conftest import BODY, LAT, LNG, PRIMARY, place, post
+
+
+def _slow_reviews(upstream, monkeypatch, slow_id: str, delay: float) -> None:
+    async def fetch(place_id: str) -> dict:
+        if place_id == slow_id:
+            await asyncio.sleep(delay)
+        return await upstream.fetch_place_reviews(place_id)
+
+    monkeypatch.setattr(api, "fetch_place_reviews", fetch)
+
+
+def test_late_review_is_scored_on_distance_and_flagged_partial(upstream, monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_DEADLINE", 0.1)
+    _slow_reviews(upstream, monkeypatch, "2", 5.0)
+    upstream.results[PRIMARY] = [place("1", 100), place("2", 200)]
+    upstream.ratings.update({"1": 3.0, "2": 5.0})
+    counters = dict(api._deadline_counters)
+
+    body = post("/api/recommend", BODY).json()
+    restaurants = {r["id"]: r for r in body["restaurants"]}
+    assert body["partial"] is True
+    assert (restaurants["1"]["rating"], restaurants["1"]["partial"]) == (3.0, False)
+    late = restaurants["2"]
+    assert (late["rating"], late["rating_known"], late["partial"]) == (0.0, False, True)
+    assert late["image_url"] == "https://img/2.jpg"
+    assert api._deadline_counters["enrich_timeouts"] == counters["enrich_timeouts"] + 1
+    assert api._deadline_counters["partial_responses"] == counters["partial_responses"] + 1
+
+    # 부분 결과는 캐시하지 않음
+    assert not result_cache.contains(result_cache.cache_key(PRIMARY, LAT, LNG, BODY["radius"]))
+
+
+def test_zero_deadline_waits_for_every_fetch(upstream, monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_DEADLINE", 0.0)
+    _slow_reviews(upstream, monkeypatch, "1", 0.2)
+    upstream.results[PRIMARY] = [place("1", 100)]
+    upstream.ratings["1"] = 4.0
+
+    body = post("/api/recommend", BODY).json()
+    assert body["partial"] is False
+    assert body["restaurants"][0]["rating"] == 4.0
+
+
+def test_abandoned_fetches_keep_running(upstream, monkeypatch):
+    _slow_reviews(upstream, monkeypatch, "2", 0.2)
+    abandoned = api._deadline_counters["abandoned"]
+
+    async def run():
+        scored = await api._enrich_restaurants(
+            [place("1", 100), place("2", 200)], api._deadline_after(0.05)
+        )
+        pending = list(api._abandoned)
+        await asyncio.gather(*pending)
+        return scored, pending
+
+    scored, pending = asyncio.run(run())
+    assert [(s.id, s.partial) for s in scored] == [("1", False), ("2", True)]
+    assert len(pending) == 1 and not pending[0].cancelled()
+    assert sorted(upstream.reviewed) == ["1", "2"]
+    assert api._deadline_counters["abandoned"] == abandoned + 1
+    assert not api._abandoned
+
+
+def test_search_past_the_deadline_is_skipped_not_cancelled(upstream):
+    upstream.search_delay[PRIMARY] = 0.2
+    upstream.results[PRIMARY] = [place("1", 100)]
+    timeouts = api._deadline_counters["search_timeouts"]
+
+    async def run():
+        found = await api._search_by_food_type(PRIMARY, LAT, LNG, 1000, api._deadline_after(0.05))
+        await asyncio.gather(*list(api._abandoned))
+        return found
+
+    assert asyncio.run(run()) == []
+    assert upstream.searched and upstream.cancelled == []
+    assert api._deadline_counters["search_timeouts"] == timeouts + 1
@@ -0,0 +1,94 @@
+"""키워드 가중치 점수 엔진 테스트 (PRD BE-01: Σ(키워드 수 × 가중치) + 평점 × 10)"""
+
+import asyncio
+
+import numpy as np
+
+from database.connection import SessionLocal
+from database.models import RestaurantKeyword
+from restaurant import config
+
+from . import api
+from .conftest import BODY, PRIMARY, place, post
+from .keyword_scoring import (
+    KEYWORDS,
+    KeywordMatrix,
+    condition_flags,
+    matched_keywords,
+    top_k,
+    weight_vector,
+)
+from .schemas import FoodType
+
+
+def _weight(vector: np.ndarray, keyword: str) -> float:
+    return round(float(vector[KEYWORDS.index(keyword)]), 3)
+
+
+def test_weight_vector_adds_common_and_flag_rules():
+    spicy = weight_vector(FoodType.SPICY_SOUP, condition_flags(True, True, False, True))
+    assert [_weight(spicy, kw) for kw in ("얼큰", "맵다", "뜨끈")] == [2.0, 1.5, 1.2]
+
+    mild = weight_vector(FoodType.MILD_SOUP, condition_flags(False, False, False, True))
+    assert (_weight(mild, "맵다"), _weight(mild, "뜨끈")) == (-1.0, 0.0)
+    assert not mild.flags.writeable
+
+
+def test_top_k_returns_best_first_with_stable_ties():
+    scores = np.array([1.0, 5.0, 3.0, 5.0, 2.0], dtype=np.float32)
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+
+
+def test_score_applies_the_prd_formula():
+    matrix = KeywordMatrix()
+    matrix.load_rows([("1", "얼큰", 3), ("1", "국물", 2), ("2", "맵다", 4), ("2", "없는키워드", 9)])
+    weights = weight_vector(FoodType.SPICY_SOUP, condition_flags(True, False, False, True))
+
+    totals, counts = matrix.score(["1", "2", "unknown"], np.array([4.0, 3.0, 5.0]), weights)
+    # 1: 3×2.0 + 2×1.5 + 40, 2: 4×1.5 + 30, 카운트 없는 매장은 평점만
+    assert totals.tolist() == [49.0, 36.0, 50.0]
+    assert matched_keywords(counts[0], weights) == ["얼큰", "국물"]
+    assert matched_keywords(counts[2], weights) == []
+
+
+def test_negative_weights_are_not_shown_as_matches():
+    matrix = KeywordMatrix()
+    matrix.load_rows([("1", "맵다", 5), ("1", "담백", 1)])
+    weights = weight_vector(FoodType.MILD_SOUP, condition_flags(False, True, False, True))
+    totals, counts = matrix.score(["1"], np.array([0.0]), weights)
+    assert totals.tolist() == [-3.0]
+    assert matched_keywords(counts[0], weights) == ["담백"]
+
+
+def test_ensure_fresh_reloads_only_after_the_interval(monkeypatch):
+    with SessionLocal() as db:
+        db.add(RestaurantKeyword(restaurant_id="930001", keyword="든든", count=2))
+        db.commit()
+    matrix = KeywordMatrix()
+    asyncio.run(matrix.ensure_fresh())
+    assert matrix.gather(["930001"])[0][KEYWORDS.index("든든")] == 2
+
+    with SessionLocal() as db:
+        db.get(RestaurantKeyword, ("930001", "든든")).count = 7
+        db.commit()
+    asyncio.run(matrix.ensure_fresh())
+    assert matrix.gather(["930001"])[0][KEYWORDS.index("든든")] == 2
+
+    monkeypatch.setattr(config, "KEYWORD_MATRIX_REFRESH_INTERVAL", 0.0)
+    asyncio.run(matrix.ensure_fresh())
+    assert matrix.gather(["930001"])[0][KEYWORDS.index("든든")] == 7
+
+
+def test_keyword_mode_ranks_by_review_keywords(upstream, monkeypatch):
+    """가까운 매장보다 조건 키워드가 많이 언급된 매장이 먼저"""
+    matrix = KeywordMatrix()
+    matrix.load_rows([("2", "얼큰", 10)])
+    monkeypatch.setattr(api, "keyword_matrix", matrix)
+    upstream.results[PRIMARY] = [place("1", 100), place("2", 900)]
+
+    response = post("/api/recommend", {**BODY, "scoring": "keyword"})
+    assert response.status_code == 200
+    restaurants = response.json()["restaurants"]
+    assert [r["id"] for r in restaurants][:2] == ["2", "1"]
+    assert restaurants[0]["matched_keywords"] == ["얼큰"]
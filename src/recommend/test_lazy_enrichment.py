@@ -0,0 +1,73 @@
+"""상위 K개 지연 보강 테스트 (보여준 순위 고정, 나머지는 뒤에만 붙음)"""
+
+import pytest
+
+from restaurant import config
+
+from . import api, result_cache
+from .conftest import BODY, PRIMARY, place, post
+
+# 가까운 1~3번은 별점 3.0, 먼 4~7번은 5.0 → 보강 후에는 나머지가 상위 K개보다 점수가 높음
+DISTANCES = {"1": 100, "2": 150, "3": 300, "4": 500, "5": 600, "6": 800, "7": 900}
+
+
+@pytest.fixture(autouse=True)
+def candidates(upstream, monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_ENRICH_TOP_K", 3)
+    upstream.results[PRIMARY] = [place(pid, distance) for pid, distance in DISTANCES.items()]
+    upstream.ratings.update({pid: 3.0 if int(pid) <= 3 else 5.0 for pid in DISTANCES})
+
+
+def _ids(response: dict) -> list[str]:
+    return [r["id"] for r in response["restaurants"]]
+
+
+def test_only_top_k_are_enriched_up_front(upstream):
+    response = post("/api/recommend", BODY).json()
+    assert _ids(response) == ["1", "2", "3"]
+    assert response["remaining_count"] == 4
+    assert sorted(upstream.reviewed) == ["1", "2", "3"]
+
+
+def test_more_appends_after_the_shown_prefix(upstream):
+    """/recommend/more 이후에도 /recommend는 처음 보여준 상위 K개만, 나머지는 섞이지 않음"""
+    overtook = api._lazy_counters["overtook_top_k"]
+    first = post("/api/recommend", BODY).json()
+
+    more = post("/api/recommend/more", BODY).json()
+    assert _ids(more) == ["4", "5", "6", "7"]
+    assert all(r["rating"] == 5.0 and not r["lazy"] for r in more["restaurants"])
+    assert api._lazy_counters["overtook_top_k"] - overtook == 4
+
+    again = post("/api/recommend", BODY).json()
+    assert _ids(again) == _ids(first)
+    assert again["remaining_count"] == 4
+    assert _ids(post("/api/recommend/more", BODY).json()) == ["4", "5", "6", "7"]
+    assert sorted(upstream.reviewed) == sorted(DISTANCES)
+
+
+def test_more_after_cache_expiry_does_not_re_enrich_the_top_k(upstream):
+    post("/api/recommend", BODY)
+    result_cache._cache.clear()
+
+    more = post("/api/recommend/more", BODY).json()
+    assert _ids(more) == ["4", "5", "6", "7"]
+    assert sorted(upstream.reviewed) == sorted(DISTANCES)
+
+
+def test_radius_smaller_than_the_bucket_still_fills_the_top_k(upstream):
+    """버킷 반경으로 나눈 상위 K개 중 호출자 반경 밖 매장은 반경 안의 다음 후보로 채움"""
+    # 먼 6, 7번은 별점이 이미 캐시돼 있어 사전 점수로는 상위 K개에 들어감
+    upstream.reviewed.extend(["6", "7"])
+    near = {**BODY, "radius": 700}
+
+    response = post("/api/recommend", near).json()
+    assert _ids(response) == ["1", "2", "3"]
+    assert response["remaining_count"] == 2
+    assert _ids(post("/api/recommend/more", near).json()) == ["4", "5"]
+    assert sorted(upstream.reviewed[2:]) == ["1", "2", "3", "4", "5"]
+
+    # 버킷 반경 전체를 보는 호출자는 같은 항목의 원래 상위 K개
+    full = post("/api/recommend", BODY).json()
+    assert _ids(full) == ["6", "7", "1"]
+    assert full["remaining_count"] == 4
@@ -0,0 +1,29 @@
+"""음식 유형 검색의 로컬 미러 사용 테스트 (커버된 빈 영역은 업스트림 대체 없음)"""
+
+import asyncio
+
+from . import api
+from .conftest import LAT, LNG, PRIMARY, place
+
+
+def _search() -> list[dict]:
+    return asyncio.run(api._search_by_food_type(PRIMARY, LAT, LNG, 1000))
+
+
+def test_covered_area_with_no_match_skips_keyword_search(upstream, monkeypatch):
+    upstream.results[PRIMARY] = [place("1", 100)]
+    monkeypatch.setattr(api, "search_local", lambda *args, **kwargs: [])
+    assert _search() == []
+    assert upstream.searched == []
+
+
+def test_local_hit_is_served_without_keyword_search(upstream, monkeypatch):
+    monkeypatch.setattr(api, "search_local", lambda *args, **kwargs: [place("2", 200)])
+    assert [r["id"] for r in _search()] == ["2"]
+    assert upstream.searched == []
+
+
+def test_uncovered_area_falls_back_to_keyword_search(upstream):
+    upstream.results[PRIMARY] = [place("3", 300)]
+    assert [r["id"] for r in _search()] == ["3"]
+    assert upstream.searched
@@ -0,0 +1,76 @@
+"""추천 결과 캐시 테스트 (격자/반경 구간 키, 호출 위치 기준 재계산, 갱신 병합)"""
+
+from restaurant import config
+
+from . import result_cache
+from .conftest import BODY, LAT, LNG, PRIMARY, place, post
+from .schemas import FoodType, ScoredRestaurant
+
+
+def _scored(pid: str, meters_north: int, rating: float = 4.0) -> ScoredRestaurant:
+    return ScoredRestaurant(
+        id=pid,
+        name=f"매장{pid}",
+        category="한식",
+        lat=LAT + meters_north / 111_320,
+        lng=LNG,
+        distance=meters_north,
+        rating=rating,
+    )
+
+
+def test_radius_rounds_up_to_a_bucket():
+    assert [result_cache.radius_bucket(r) for r in (400, 500, 501, 5000, 7000)] == [
+        500, 500, 1000, 5000, 7000,
+    ]
+
+
+def test_nearby_callers_share_a_key():
+    key = result_cache.cache_key(FoodType.SPICY_SOUP, LAT, LNG, 1000)
+    assert result_cache.cache_key(FoodType.SPICY_SOUP, LAT + 0.0001, LNG, 700) == key
+    assert result_cache.cache_key(FoodType.SPICY_SOUP, LAT + 0.01, LNG, 1000) != key
+    assert result_cache.cache_key(FoodType.SPICY_SOUP, LAT, LNG, 1500) != key
+    assert result_cache.cache_key(FoodType.MILD_SOUP, LAT, LNG, 1000) != key
+
+
+def test_relocate_rescores_for_the_caller_and_drops_outside_radius():
+    near, far = _scored("1", 100, rating=3.0), _scored("2", 600, rating=5.0)
+    # 300m 북쪽으로 옮긴 호출자 기준: 1번 200m, 2번 300m
+    relocated = result_cache.relocate([near, far], LAT + 300 / 111_320, LNG, 1000)
+    assert [(c.id, c.distance) for c in relocated] == [("2", 300), ("1", 200)]
+    assert relocated[0].recommendation_score == 5.0 * 15 + 25
+    assert (near.distance, far.distance) == (100, 600)
+
+    assert [c.id for c in result_cache.relocate([near, far], LAT, LNG, 500)] == ["1"]
+
+
+def test_merge_replaces_by_id_and_skips_expired_entries():
+    key = ("test", "merge")
+    result_cache.put(key, [_scored("1", 100)], [_scored("2", 200)])
+    result_cache.merge(key, [_scored("2", 200, rating=1.0), _scored("9", 900)])
+    entry = result_cache.get(key)
+    assert [c.id for c in entry.top] == ["1"]
+    assert [(c.id, c.rating) for c in entry.rest] == [("2", 1.0)]
+
+    result_cache.merge(("test", "missing"), [_scored("1", 100)])
+    assert not result_cache.contains(("test", "missing"))
+
+
+def test_disabled_cache_stores_nothing(monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_CACHE_ENABLED", False)
+    result_cache.put(("test", "disabled"), [_scored("1", 100)])
+    assert result_cache.get(("test", "disabled")) is None
+    assert result_cache.stats()["enabled"] is False
+
+
+def test_nearby_caller_is_served_from_the_cache(upstream):
+    upstream.results[PRIMARY] = [place("1", 100), place("2", 400)]
+    upstream.ratings.update({"1": 3.0, "2": 4.0})
+    first = post("/api/recommend", BODY).json()
+    searched = len(upstream.searched)
+
+    moved = post("/api/recommend", {**BODY, "lat": LAT + 100 / 111_320}).json()
+    assert len(upstream.searched) == searched
+    assert sorted(upstream.reviewed) == ["1", "2"]
+    assert [r["id"] for r in moved["restaurants"]] == [r["id"] for r in first["restaurants"]]
+    assert {r["id"]: r["distance"] for r in moved["restaurants"]} == {"1": 0, "2": 300}
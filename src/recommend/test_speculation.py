@@ -0,0 +1,55 @@
+"""보조 음식 유형 선행 검색 테스트 (취소 시점, 더 보기 후보 보강)"""
+
+import pytest
+
+from restaurant import config
+
+from . import api
+from .conftest import BODY, PRIMARY, SECONDARY, place, post
+from .food_type_search import FOOD_TYPE_KEYWORDS
+
+
+@pytest.fixture(autouse=True)
+def speculative(monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_SPECULATIVE", True)
+    monkeypatch.setattr(config, "RECOMMEND_ENRICH_TOP_K", 5)
+
+
+def test_secondary_search_is_cancelled_before_primary_enrichment(upstream):
+    """주 유형 검색 결과가 나오면 보강(리뷰/이미지 조회) 전에 보조 검색을 멈춤"""
+    upstream.results[PRIMARY] = [place("1", 100)]
+    upstream.search_delay[SECONDARY] = 5
+    cancelled = api._speculation_counters["cancelled"]
+    cancelled_before_enrich = []
+    upstream.on_review = lambda place_id: cancelled_before_enrich.append(
+        api._speculation_counters["cancelled"] - cancelled
+    )
+
+    response = post("/api/recommend", BODY)
+    assert [r["id"] for r in response.json()["restaurants"]] == ["1"]
+    assert cancelled_before_enrich == [1]
+    assert FOOD_TYPE_KEYWORDS[SECONDARY][0] in upstream.cancelled
+
+
+def test_empty_primary_uses_the_running_secondary_search(upstream):
+    upstream.results[SECONDARY] = [place("2", 100)]
+    response = post("/api/recommend", BODY)
+    assert [r["id"] for r in response.json()["restaurants"]] == ["2"]
+    assert upstream.searched.count(FOOD_TYPE_KEYWORDS[SECONDARY][0]) == 1
+
+
+def test_more_options_are_lazy_until_recommend_more(upstream):
+    """선행 검색 결과는 점수만 매긴 lazy 후보 → /recommend/more가 보강"""
+    upstream.results[PRIMARY] = [place("1", 100)]
+    upstream.results[SECONDARY] = [place("1", 100), place("21", 200), place("22", 300)]
+    upstream.ratings.update({"21": 4.0, "22": 5.0})
+    body = {**BODY, "more_options": True}
+
+    options = post("/api/recommend", body).json()["more_options"]
+    assert [(o["id"], o["lazy"], o["rating_known"]) for o in options] == [("21", True, False), ("22", True, False)]
+    assert "21" not in upstream.reviewed
+
+    more = post("/api/recommend/more", body).json()
+    assert more["restaurants"] == []
+    assert [(o["id"], o["rating"], o["lazy"]) for o in more["more_options"]] == [("22", 5.0, False), ("21", 4.0, False)]
+    assert more["more_options"][0]["image_url"] == "https://img/22.jpg"
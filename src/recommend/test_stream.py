@@ -0,0 +1,60 @@
+"""추천 스트리밍 테스트 (/api/recommend/stream — 상위 K개만 보강, /recommend와 같은 캐시)"""
+
+import json
+
+import pytest
+
+from restaurant import config
+
+from .conftest import BODY, PRIMARY, place, post
+
+
+@pytest.fixture(autouse=True)
+def top_k(monkeypatch):
+    monkeypatch.setattr(config, "RECOMMEND_ENRICH_TOP_K", 3)
+
+
+def _events(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_stream_enriches_only_top_k_and_caches_the_same_split(upstream):
+    upstream.results[PRIMARY] = [place(str(i), 100 * i) for i in range(1, 8)]
+    events = _events(post("/api/recommend/stream", BODY))
+
+    assert [e["event"] for e in events][0] == "food_type"
+    cards = [e["id"] for e in events if e["event"] == "restaurant"]
+    assert sorted(cards) == ["1", "2", "3"]
+    assert sorted(upstream.reviewed) == ["1", "2", "3"]
+    done = events[-1]
+    assert done["event"] == "done"
+    assert [r["id"] for r in done["restaurants"]] == ["1", "2", "3"]
+    assert done["remaining_count"] == 4
+
+    # 같은 지역 /recommend는 캐시에서 같은 상위 K개 + 남은 수
+    response = post("/api/recommend", BODY).json()
+    assert [r["id"] for r in response["restaurants"]] == ["1", "2", "3"]
+    assert response["remaining_count"] == 4
+    assert len(upstream.reviewed) == 3
+
+
+def test_stream_cache_hit_leaves_lazy_candidates_for_more(upstream):
+    upstream.results[PRIMARY] = [place(str(i), 100 * i) for i in range(1, 8)]
+    post("/api/recommend", BODY)
+    events = _events(post("/api/recommend/stream", BODY))
+    assert sorted(e["id"] for e in events if e["event"] == "restaurant") == ["1", "2", "3"]
+    assert events[-1]["remaining_count"] == 4
+    assert len(upstream.reviewed) == 3
+
+
+def test_stream_fills_the_top_k_within_a_smaller_radius(upstream):
+    """버킷 상위 K개 중 반경 밖 매장 대신 반경 안의 다음 후보를 보강"""
+    upstream.results[PRIMARY] = [place(str(i), 100 * i) for i in range(1, 8)]
+    # 먼 6, 7번은 별점이 이미 캐시돼 있어 사전 점수로는 상위 K개에 들어감
+    upstream.reviewed.extend(["6", "7"])
+    upstream.ratings.update({"6": 5.0, "7": 5.0})
+
+    events = _events(post("/api/recommend/stream", {**BODY, "radius": 450}))
+    assert sorted(e["id"] for e in events if e["event"] == "restaurant") == ["1", "2", "3"]
+    assert events[-1]["remaining_count"] == 1
+    assert sorted(upstream.reviewed[2:]) == ["1", "2", "3"]
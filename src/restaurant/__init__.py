@@ -1,5 +1,6 @@
 # Restaurant module
 
 from .api import router as restaurant_router
+from .admin import router as restaurant_admin_router
 
-__all__ = ["restaurant_router"]
+__all__ = ["restaurant_router", "restaurant_admin_router"]
@@ -0,0 +1,95 @@
+"""카카오 업스트림 모니터링 및 수집 API (관리자용)"""
+
+import hmac
+import json
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from chatbot.rate_limit import limiter, RateLimits
+from . import review_sync
+from .area_scanner import AreaScanner
+from .geo import bbox_around
+from .governor import governor
+from .kakao_client import (
+    breaker_states,
+    image_cache_stats,
+    info_cache_stats,
+    mirror_stats,
+    place_index_stats,
+    prefetch_stats,
+    region_stats,
+    review_cache_stats,
+    search_cache_stats,
+    singleflight_stats,
+)
+from .schemas import AreaScanRequest
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def require_admin_key(x_admin_key: str | None = Header(default=None)) -> None:
+    """X-Admin-Key 헤더 확인
+
+    ADMIN_API_KEY가 설정되지 않았으면 관리자 API 전체를 없는 것으로 취급 (404)
+    """
+    expected = os.getenv("ADMIN_API_KEY")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if x_admin_key is None or not hmac.compare_digest(x_admin_key.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 키가 올바르지 않습니다",
+        )
+
+
+@router.get("/kakao", dependencies=[Depends(require_admin_key)])
+@limiter.limit(RateLimits.GENERAL)
+async def kakao_status(request: Request):
+    """카카오 업스트림 상태 (예산, 브레이커, 캐시, 요청 합치기 통계)"""
+    return {
+        "budget": governor.snapshot(),
+        "breakers": breaker_states(),
+        "caches": {
+            "search": search_cache_stats(),
+            "image": image_cache_stats(),
+            "reviews": review_cache_stats(),
+            "info": info_cache_stats(),
+            "region": region_stats(),
+            "place_index": place_index_stats(),
+            "mirror": mirror_stats(),
+        },
+        "singleflight": singleflight_stats(),
+        "prefetch": prefetch_stats(),
+        "review_sync": review_sync.stats(),
+    }
+
+
+@router.get("/kakao/budget", dependencies=[Depends(require_admin_key)])
+@limiter.limit(RateLimits.GENERAL)
+async def kakao_budget(request: Request):
+    """카카오 REST 키 남은 일일 쿼터 및 초당 버킷 상태"""
+    return governor.snapshot()
+
+
+@router.post("/kakao/scan", dependencies=[Depends(require_admin_key)])
+@limiter.limit(RateLimits.GENERAL)
+async def kakao_scan(request: Request, body: AreaScanRequest):
+    """영역 전체 매장 수집 (NDJSON 스트리밍, 마지막 줄은 수집 통계)
+
+    수집된 매장은 검색 캐시와 매장 ID 인덱스에도 저장됨
+    """
+    scanner = AreaScanner(
+        bbox_around(body.lat, body.lng, body.radius),
+        query=body.query,
+        category_code=body.category_code,
+    )
+
+    async def _stream():
+        async for place in scanner.run():
+            yield json.dumps(place, ensure_ascii=False) + "\n"
+        yield json.dumps({"done": True, **scanner.stats()}) + "\n"
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
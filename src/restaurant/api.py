@@ -1,9 +1,22 @@
 """맛집 검색 API 라우터"""
 
+import asyncio
+
 from fastapi import APIRouter, Request
+from fastapi.responses import Response, StreamingResponse
 from chatbot.rate_limit import limiter, RateLimits
-from .schemas import KakaoRestaurant, SearchResponse, RegionInfo, ReviewResponse, PlaceInfoResponse
-from .kakao_client import search_keyword, search_nearby, coord2region, fetch_place_image, fetch_place_images, fetch_place_reviews, fetch_place_info
+from . import config
+from .schemas import (
+    KakaoRestaurant,
+    SearchResponse,
+    RegionInfo,
+    ReviewResponse,
+    PlaceInfoResponse,
+    BatchPlaceRequest,
+    BatchPlaceResponse,
+    PlaceDetails,
+)
+from .kakao_client import search_keyword, search_nearby, coord2region, get_place, fetch_place_image, fetch_place_images, fetch_place_reviews, fetch_place_info, is_place_open, prefetch_next_page
 
 router = APIRouter(prefix="/api/restaurants", tags=["restaurants"])
 
@@ -22,6 +35,8 @@ async def api_search(
     """키워드로 맛집 검색"""
     result = await search_keyword(query, lat, lng, radius, page, size)
     docs = result["documents"]
+    if not result["meta"]["is_end"]:
+        prefetch_next_page(query, lat, lng, radius, page, size)
 
     # 이미지 병렬 가져오기
     images = await fetch_place_images([d["id"] for d in docs])
@@ -80,6 +95,96 @@ async def api_region(
     return RegionInfo(**result)
 
 
+async def _fetch_place_details(place_id: str, fields: set[str]) -> PlaceDetails:
+    """한 매장의 요청 항목(info/reviews/image)을 병렬로 조회"""
+    tasks = {}
+    if "info" in fields:
+        tasks["info"] = fetch_place_info(place_id)
+    if "reviews" in fields:
+        tasks["reviews"] = fetch_place_reviews(place_id)
+    if "image" in fields:
+        tasks["image"] = fetch_place_image(place_id)
+    results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+
+    details = PlaceDetails(id=place_id)
+    if "info" in results:
+        details.info = PlaceInfoResponse(**results["info"], is_open=is_place_open(place_id))
+    if "reviews" in results:
+        details.reviews = ReviewResponse(**results["reviews"])
+    if "image" in results:
+        details.image_url = results["image"]
+    return details
+
+
+def _batch_jobs(body: BatchPlaceRequest) -> list[asyncio.Task]:
+    """중복 제거 후 매장별 조회 Task (동시 조회 수 제한, 요청 순서)"""
+    place_ids = list(dict.fromkeys(body.place_ids))
+    fields = set(body.fields)
+    sem = asyncio.Semaphore(config.BATCH_CONCURRENCY)
+
+    async def _one(place_id: str) -> PlaceDetails:
+        async with sem:
+            return await _fetch_place_details(place_id, fields)
+
+    return [asyncio.create_task(_one(pid)) for pid in place_ids]
+
+
+def _cancel(tasks: list[asyncio.Task]) -> None:
+    """끝나지 않은 조회 취소 (이미 끝난 Task는 영향 없음)"""
+    for task in tasks:
+        task.cancel()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """클라이언트 연결이 끊길 때까지 대기 (요청 본문은 이미 읽은 상태)"""
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+class _NoResponse(Response):
+    """클라이언트가 이미 끊었을 때 — 아무것도 보내지 않고 요청 종료"""
+
+    async def __call__(self, scope, receive, send) -> None:
+        return None
+
+
+@router.post("/batch", response_model=BatchPlaceResponse)
+@limiter.limit(RateLimits.GENERAL)
+async def api_batch(request: Request, body: BatchPlaceRequest):
+    """여러 매장의 영업정보/리뷰/이미지 일괄 조회 (클라이언트가 끊으면 남은 조회 취소)"""
+    jobs = _batch_jobs(body)
+    gathered = asyncio.gather(*jobs)
+    disconnected = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({gathered, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnected.cancel()
+        # 끝나지 않았으면 (클라이언트 끊김/요청 취소) 남은 조회까지 함께 취소
+        gathered.cancel()
+    if not gathered.done() or gathered.cancelled():
+        # 응답을 받을 클라이언트가 없음
+        return _NoResponse()
+    return BatchPlaceResponse(places=gathered.result())
+
+
+@router.post("/batch/stream")
+@limiter.limit(RateLimits.GENERAL)
+async def api_batch_stream(request: Request, body: BatchPlaceRequest):
+    """여러 매장 상세 일괄 조회 (NDJSON 스트리밍, 준비된 매장부터 한 줄씩)"""
+    jobs = _batch_jobs(body)
+
+    async def _stream():
+        try:
+            for next_done in asyncio.as_completed(jobs):
+                place = await next_done
+                yield place.model_dump_json() + "\n"
+        finally:
+            # 클라이언트가 끊으면 남은 조회 취소
+            _cancel(jobs)
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/{place_id}/info", response_model=PlaceInfoResponse)
 @limiter.limit(RateLimits.GENERAL)
 async def api_place_info(
@@ -88,7 +193,7 @@ async def api_place_info(
 ):
     """매장 기본정보 (영업시간 등) 조회"""
     result = await fetch_place_info(place_id)
-    return PlaceInfoResponse(**result)
+    return PlaceInfoResponse(**result, is_open=is_place_open(place_id))
 
 
 @router.get("/{place_id}/reviews", response_model=ReviewResponse)
@@ -111,24 +216,22 @@ async def api_detail(
     lat: float | None = None,
     lng: float | None = None,
 ):
-    """단일 맛집 조회 (이름으로 검색 후 ID 매칭)"""
-    if not name:
-        return None
-
-    # 기본 좌표 (서울 중심) — 좌표 없이 검색하면 카카오 API가 실패할 수 있음
-    search_lat = lat or 37.5665
-    search_lng = lng or 126.9780
-
-    result = await search_keyword(name, lat=search_lat, lng=search_lng, radius=20000, size=5)
-
-    matched = None
-    for doc in result["documents"]:
-        if doc["id"] == place_id:
-            matched = doc
-            break
-
-    if not matched and result["documents"]:
-        matched = result["documents"][0]
+    """단일 맛집 조회 (ID 인덱스 → 없으면 이름으로 검색 후 ID 매칭)"""
+    matched = await get_place(place_id, lat, lng)
+
+    if not matched:
+        if not name:
+            return None
+
+        # 기본 좌표 (서울 중심) — 좌표 없이 검색하면 카카오 API가 실패할 수 있음
+        search_lat = lat or 37.5665
+        search_lng = lng or 126.9780
+
+        result = await search_keyword(name, lat=search_lat, lng=search_lng, radius=20000, size=5)
+        for doc in result["documents"]:
+            if doc["id"] == place_id:
+                matched = doc
+                break
 
     if matched:
         matched["image_url"] = await fetch_place_image(matched["id"])
@@ -0,0 +1,188 @@
+"""영역 전체 매장 수집 (격자 분할 스캐너)
+
+카카오 검색은 한 질의당 최대 45건(15건 × 3페이지)까지만 조회 가능 →
+사각형(rect) 영역의 total_count가 45건을 넘으면 4등분해서 다시 조회,
+45건 이하가 된 격자만 페이지를 끝까지 읽어서 빠짐없이 수집
+
+- 격자는 여러 워커가 동시에 조회 (BACKGROUND 우선순위, 호출 예산 안에서)
+- place_id 기준 중복 제거 후 찾는 대로 흘려보냄 (async iterator)
+- 조회 결과는 검색 경로를 그대로 타므로 검색 캐시, 매장 ID 인덱스, 로컬 미러에도 쌓임
+- 카테고리 스캔(query 없음)은 영역을 미러 격자 경계에 맞춰 넓히고,
+  빠짐없이 끝나면 미러에 해당 영역을 커버리지로 표시 → 이후 search_nearby가 로컬 응답
+"""
+
+import asyncio
+import math
+import time
+from typing import AsyncIterator
+
+from . import config
+from .geo import METERS_PER_DEG_LAT
+from .governor import Priority, outbound_priority
+from .kakao_client import search_rect
+from .local_mirror import align_to_cells, mirror
+
+# 카카오 검색 페이지 크기 / 한 질의로 볼 수 있는 최대 건수
+PAGE_SIZE = 15
+MAX_RESULTS = 45
+
+# (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+Rect = tuple[float, float, float, float]
+
+# 출력 큐 종료 표시
+_DONE = object()
+
+
+def _split(rect: Rect) -> list[Rect]:
+    min_lng, min_lat, max_lng, max_lat = rect
+    mid_lng, mid_lat = (min_lng + max_lng) / 2, (min_lat + max_lat) / 2
+    return [
+        (min_lng, min_lat, mid_lng, mid_lat),
+        (mid_lng, min_lat, max_lng, mid_lat),
+        (min_lng, mid_lat, mid_lng, max_lat),
+        (mid_lng, mid_lat, max_lng, max_lat),
+    ]
+
+
+def _short_side_m(rect: Rect) -> float:
+    min_lng, min_lat, max_lng, max_lat = rect
+    height = (max_lat - min_lat) * METERS_PER_DEG_LAT
+    center_lat = math.radians((min_lat + max_lat) / 2)
+    width = (max_lng - min_lng) * METERS_PER_DEG_LAT * math.cos(center_lat)
+    return min(width, height)
+
+
+class AreaScanner:
+    """사각형 영역의 매장을 격자 분할로 전부 수집
+
+    사용:
+        scanner = AreaScanner(bbox_around(lat, lng, 2000))
+        async for place in scanner.run():
+            ...
+        scanner.stats()
+    """
+
+    def __init__(
+        self,
+        rect: Rect,
+        query: str | None = None,
+        category_code: str = "FD6",
+        concurrency: int = config.SCAN_CONCURRENCY,
+        min_cell_m: float = config.SCAN_MIN_CELL_M,
+    ):
+        self.rect = rect if query else align_to_cells(rect)
+        self.query = query
+        self.category_code = category_code
+        self.concurrency = concurrency
+        self.min_cell_m = min_cell_m
+        self._seen: set[str] = set()
+        self.cells = 0         # 조회한 격자 수
+        self.splits = 0        # 4분할한 격자 수
+        self.requests = 0      # 검색 호출 수 (캐시 hit 포함)
+        self.retries = 0
+        self.failed_cells = 0  # 재시도 후에도 실패한 격자 수
+        self.truncated = 0     # 최소 크기라 45건에서 잘린 격자 수
+
+    async def _search(self, rect: Rect, page: int) -> dict | None:
+        for attempt in range(config.SCAN_MAX_RETRIES + 1):
+            if attempt:
+                self.retries += 1
+                await asyncio.sleep(config.SCAN_RETRY_DELAY * 2 ** (attempt - 1))
+            self.requests += 1
+            with outbound_priority(Priority.BACKGROUND):
+                result = await search_rect(rect, self.query, self.category_code, page, PAGE_SIZE)
+            if result is not None:
+                # 캐시에서 나온 결과도 이번 스캔에서 확인한 것으로 갱신 (커버리지 표시 시 제거 방지)
+                if config.MIRROR_ENABLED:
+                    mirror.add_many(result["documents"], self.category_code)
+                return result
+        return None
+
+    def _emit(self, documents: list[dict], out: asyncio.Queue) -> None:
+        for doc in documents:
+            if doc["id"] not in self._seen:
+                self._seen.add(doc["id"])
+                out.put_nowait(doc)
+
+    async def _scan_cell(self, rect: Rect, cells: asyncio.Queue, out: asyncio.Queue) -> None:
+        self.cells += 1
+        first = await self._search(rect, 1)
+        if first is None:
+            self.failed_cells += 1
+            return
+        self._emit(first["documents"], out)
+
+        total = first["meta"]["total_count"]
+        if total > MAX_RESULTS:
+            if _short_side_m(rect) / 2 >= self.min_cell_m:
+                self.splits += 1
+                for sub in _split(rect):
+                    cells.put_nowait(sub)
+                return
+            self.truncated += 1
+
+        if first["meta"]["is_end"]:
+            return
+        for page in range(2, min(math.ceil(total / PAGE_SIZE), MAX_RESULTS // PAGE_SIZE) + 1):
+            result = await self._search(rect, page)
+            if result is None:
+                self.failed_cells += 1
+                return
+            self._emit(result["documents"], out)
+            if result["meta"]["is_end"]:
+                return
+
+    async def _worker(self, cells: asyncio.Queue, out: asyncio.Queue) -> None:
+        while True:
+            rect = await cells.get()
+            try:
+                await self._scan_cell(rect, cells, out)
+            except Exception as e:
+                self.failed_cells += 1
+                print(f"Area scan cell error: {e}")
+            finally:
+                cells.task_done()
+
+    async def run(self) -> AsyncIterator[dict]:
+        """수집한 매장을 찾는 대로 반환 (place_id 중복 제거)"""
+        started_at = time.time()
+        cells: asyncio.Queue = asyncio.Queue()
+        out: asyncio.Queue = asyncio.Queue()
+        cells.put_nowait(self.rect)
+
+        workers = [
+            asyncio.create_task(self._worker(cells, out))
+            for _ in range(max(1, self.concurrency))
+        ]
+
+        async def _finish() -> None:
+            await cells.join()
+            out.put_nowait(_DONE)
+
+        finisher = asyncio.create_task(_finish())
+        try:
+            while (item := await out.get()) is not _DONE:
+                yield item
+            if self.complete and config.MIRROR_ENABLED:
+                mirror.mark_covered(self.rect, self.category_code, started_at)
+        finally:
+            finisher.cancel()
+            for task in workers:
+                task.cancel()
+
+    @property
+    def complete(self) -> bool:
+        """카테고리 스캔이 실패/잘림 없이 영역 전체를 수집했는지"""
+        return not self.query and not self.failed_cells and not self.truncated
+
+    def stats(self) -> dict:
+        return {
+            "places": len(self._seen),
+            "cells": self.cells,
+            "splits": self.splits,
+            "requests": self.requests,
+            "retries": self.retries,
+            "failed_cells": self.failed_cells,
+            "truncated_cells": self.truncated,
+            "complete": self.complete,
+        }
@@ -0,0 +1,141 @@
+"""카카오 응답용 인메모리 캐시 (LRU + TTL)"""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+def estimate_size(value: Any) -> int:
+    """캐시 값의 대략적인 메모리 크기 (bytes)
+
+    dict/list/str 위주의 JSON 형태 값 기준 — 정확한 값이 아닌 상한 관리용 추정치
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(v) for v in value)
+    return size
+
+
+class TTLCache:
+    """크기 제한 LRU + 만료 시간 캐시
+
+    - maxsize(항목 수) 또는 max_bytes(추정 메모리) 초과 시 LRU 순으로 제거
+    - 정상 결과(ttl)와 빈/실패 결과(negative_ttl)의 만료 시간을 따로 둠
+    - hit/miss/eviction 카운터와 메모리 사용량으로 캐시 효과 측정
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        negative_ttl: float | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        # key -> (만료 시각, 값, 빈 결과 여부, 추정 크기)
+        self._data: OrderedDict[Hashable, tuple[float, Any, bool, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0     # 용량 초과로 밀려난 항목 수
+        self.expirations = 0   # TTL 만료로 제거된 항목 수
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료됐거나 없으면 default)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value, negative, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        if negative:
+            self.negative_hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """통계/LRU 순서에 영향 없이 조회 (만료됐거나 없으면 default)"""
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, negative: bool = False, ttl: float | None = None) -> None:
+        """캐시 저장 (negative=True면 빈/실패 결과용 TTL, ttl 지정 시 해당 항목만 덮어씀)"""
+        if ttl is None:
+            ttl = self.negative_ttl if negative else self.ttl
+        if ttl <= 0:
+            return
+        if key in self._data:
+            self._remove(key)
+        size = self._sizeof(key) + self._sizeof(value)
+        self._data[key] = (time.monotonic() + ttl, value, negative, size)
+        self.bytes += size
+        self._evict()
+
+    def pop(self, key: Hashable) -> None:
+        if key in self._data:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 제거 (제거 수 반환)"""
+        now = time.monotonic()
+        expired = [k for k, entry in self._data.items() if entry[0] <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self.bytes -= entry[3]
+
+    def _evict(self) -> None:
+        while self._data and (
+            len(self._data) > self.maxsize
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """hit/miss/eviction 통계 및 메모리 사용량"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,123 @@
+"""업스트림 서킷 브레이커
+
+카카오 장애 시 매 요청이 타임아웃까지 기다리지 않도록 빠르게 실패 처리
+- CLOSED: 정상. 롤링 윈도우 안의 실패가 임계치를 넘으면 OPEN (사이사이 성공이 있어도)
+- OPEN: 즉시 실패 (호출 측 기존 fallback 사용). recovery_timeout 후 HALF_OPEN
+- HALF_OPEN: 소수의 probe 요청만 통과. 성공하면 CLOSED, 실패하면 다시 OPEN
+"""
+
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 요청을 보내지 않음"""
+
+    def __init__(self, name: str):
+        super().__init__(f"circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """엔드포인트별 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        window: float = 30.0,
+        recovery_timeout: float = 15.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._half_open_since = 0.0
+        self._half_open_calls = 0
+
+        # 모니터링용 누적 카운터
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 여부"""
+        now = time.monotonic()
+        if self.state == OPEN:
+            if now - self._opened_at < self.recovery_timeout:
+                self.total_rejected += 1
+                return False
+            self._to_half_open(now)
+
+        if self.state == HALF_OPEN:
+            # probe가 결과 없이 사라진 경우(취소 등) 새 probe 허용
+            if now - self._half_open_since >= self.recovery_timeout:
+                self._to_half_open(now)
+            if self._half_open_calls >= self.half_open_max_calls:
+                self.total_rejected += 1
+                return False
+            self._half_open_calls += 1
+
+        return True
+
+    def record_success(self) -> None:
+        """성공 기록 — CLOSED에서는 실패 기록을 지우지 않음
+
+        실패는 윈도우를 벗어날 때만 빠지므로, 성공과 실패가 섞인 부분 장애도
+        윈도우 안 실패 수가 임계치를 넘으면 열림.
+        OPEN 중에 끝난(열리기 전에 보낸) 요청의 성공은 무시 — probe 성공만 닫음
+        """
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self._half_open_calls = 0
+            self._failures.clear()
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        self.total_failures += 1
+        if self.state == HALF_OPEN:
+            self._open(now)
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+        if self.state == CLOSED and len(self._failures) >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._failures.clear()
+        self.times_opened += 1
+
+    def _to_half_open(self, now: float) -> None:
+        self.state = HALF_OPEN
+        self._half_open_since = now
+        self._half_open_calls = 0
+
+    def snapshot(self) -> dict:
+        """모니터링용 상태"""
+        now = time.monotonic()
+        retry_in = 0.0
+        if self.state == OPEN:
+            retry_in = max(0.0, self.recovery_timeout - (now - self._opened_at))
+        return {
+            "state": self.state,
+            "recent_failures": sum(1 for t in self._failures if now - t <= self.window),
+            "failure_threshold": self.failure_threshold,
+            "retry_in": round(retry_in, 1),
+            "total_failures": self.total_failures,
+            "total_rejected": self.total_rejected,
+            "times_opened": self.times_opened,
+        }
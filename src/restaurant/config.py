@@ -0,0 +1,208 @@
+"""카카오 업스트림 호출 설정
+
+환경변수로 덮어쓸 수 있는 값들을 한 곳에 모아둠 (Railway 변수로 튜닝)
+"""
+
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+# ── 업스트림 주소 ────────────────────────────────────────────
+# 부하 테스트 시 로컬 가짜 서버(loadtest.fake_kakao)로 바꿔서 쿼터 없이 호출
+KAKAO_API_BASE_URL = os.getenv("KAKAO_API_BASE_URL", "https://dapi.kakao.com").rstrip("/")
+KAKAO_PLACE_BASE_URL = os.getenv("KAKAO_PLACE_BASE_URL", "https://place.map.kakao.com").rstrip("/")
+KAKAO_PLACE_API_BASE_URL = os.getenv("KAKAO_PLACE_API_BASE_URL", "https://place-api.map.kakao.com").rstrip("/")
+
+# ── HTTP 커넥션 풀 ──────────────────────────────────────────
+# 전체 동시 커넥션 상한
+HTTP_MAX_CONNECTIONS = _env_int("KAKAO_HTTP_MAX_CONNECTIONS", 100)
+# 유휴 상태로 유지할 keep-alive 커넥션 수
+HTTP_MAX_KEEPALIVE = _env_int("KAKAO_HTTP_MAX_KEEPALIVE", 40)
+# keep-alive 커넥션 유지 시간 (초)
+HTTP_KEEPALIVE_EXPIRY = _env_float("KAKAO_HTTP_KEEPALIVE_EXPIRY", 30.0)
+# 호스트별 동시 요청 상한 (dapi.kakao.com, place.map.kakao.com 등 각각)
+HTTP_MAX_PER_HOST = _env_int("KAKAO_HTTP_MAX_PER_HOST", 30)
+# HTTP/2 사용 여부 (h2 패키지가 설치되어 있을 때만 적용)
+HTTP2_ENABLED = os.getenv("KAKAO_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# ── 타임아웃 프로파일 (초) ───────────────────────────────────
+# 검색/좌표변환 REST API (dapi.kakao.com)
+SEARCH_CONNECT_TIMEOUT = _env_float("KAKAO_SEARCH_CONNECT_TIMEOUT", 2.0)
+SEARCH_READ_TIMEOUT = _env_float("KAKAO_SEARCH_READ_TIMEOUT", 5.0)
+# 플레이스 페이지/패널 (place.map.kakao.com, place-api.map.kakao.com)
+PLACE_CONNECT_TIMEOUT = _env_float("KAKAO_PLACE_CONNECT_TIMEOUT", 2.0)
+PLACE_READ_TIMEOUT = _env_float("KAKAO_PLACE_READ_TIMEOUT", 5.0)
+# og:image 추출용 HTML 페이지 (카드 이미지라 더 짧게)
+PLACE_IMAGE_READ_TIMEOUT = _env_float("KAKAO_PLACE_IMAGE_READ_TIMEOUT", 3.0)
+
+# ── 검색 결과 캐시 (search_keyword / search_nearby) ──────────
+# 좌표 스냅 격자 크기 (m) — 같은 격자 안의 요청은 같은 캐시 항목 사용
+SEARCH_CACHE_CELL_M = _env_float("KAKAO_SEARCH_CACHE_CELL_M", 150.0)
+# 결과가 있는 응답 / 빈 응답 TTL (초)
+SEARCH_CACHE_TTL = _env_float("KAKAO_SEARCH_CACHE_TTL", 600.0)
+SEARCH_CACHE_NEGATIVE_TTL = _env_float("KAKAO_SEARCH_CACHE_NEGATIVE_TTL", 120.0)
+# 최대 캐시 항목 수 (LRU)
+SEARCH_CACHE_MAX_ENTRIES = _env_int("KAKAO_SEARCH_CACHE_MAX_ENTRIES", 5000)
+# 다음 페이지 미리 가져오기 (opt-in) — 검색 N페이지 응답 후 N+1페이지와 이미지를 백그라운드로 캐시
+SEARCH_PREFETCH_ENABLED = os.getenv("KAKAO_SEARCH_PREFETCH", "false").lower() in ("1", "true", "yes")
+# 동시에 진행하는 프리페치 작업 수 (넘으면 새 프리페치는 건너뜀)
+SEARCH_PREFETCH_MAX_INFLIGHT = _env_int("KAKAO_SEARCH_PREFETCH_MAX_INFLIGHT", 4)
+
+# ── og:image 캐시 ────────────────────────────────────────────
+# 이미지 URL TTL (초) — 대표 이미지는 거의 바뀌지 않음
+IMAGE_CACHE_TTL = _env_float("KAKAO_IMAGE_CACHE_TTL", 24 * 3600.0)
+# 추출 실패/이미지 없음 TTL (초) — 일시적 타임아웃이 영구히 남지 않도록 짧게
+IMAGE_CACHE_NEGATIVE_TTL = _env_float("KAKAO_IMAGE_CACHE_NEGATIVE_TTL", 600.0)
+IMAGE_CACHE_MAX_ENTRIES = _env_int("KAKAO_IMAGE_CACHE_MAX_ENTRIES", 20000)
+IMAGE_CACHE_MAX_BYTES = _env_int("KAKAO_IMAGE_CACHE_MAX_BYTES", 8 * 1024 * 1024)
+
+# ── 플레이스 메타데이터 영구 저장소 (DB) ─────────────────────
+PLACE_STORE_ENABLED = os.getenv("KAKAO_PLACE_STORE", "true").lower() in ("1", "true", "yes")
+# 항목별 최대 보존 기간 (초) — 지나면 다시 카카오에서 가져옴
+PLACE_STORE_IMAGE_MAX_AGE = _env_float("KAKAO_PLACE_STORE_IMAGE_MAX_AGE", 7 * 24 * 3600.0)
+PLACE_STORE_REVIEWS_MAX_AGE = _env_float("KAKAO_PLACE_STORE_REVIEWS_MAX_AGE", 6 * 3600.0)
+PLACE_STORE_INFO_MAX_AGE = _env_float("KAKAO_PLACE_STORE_INFO_MAX_AGE", 6 * 3600.0)
+# 만료 행 정리(compaction) 주기 (초)
+PLACE_STORE_COMPACT_INTERVAL = _env_float("KAKAO_PLACE_STORE_COMPACT_INTERVAL", 3600.0)
+# og:image 스트리밍 추출 시 최대 읽기 바이트 (이 안에서 못 찾으면 포기)
+IMAGE_SCAN_MAX_BYTES = _env_int("KAKAO_IMAGE_SCAN_MAX_BYTES", 256 * 1024)
+# fetch_place_images 배치 동시 요청 수
+IMAGE_BATCH_CONCURRENCY = _env_int("KAKAO_IMAGE_BATCH_CONCURRENCY", 8)
+
+# ── 서킷 브레이커 / 재시도 ────────────────────────────────────
+# 롤링 윈도우(초) 안에서 실패가 임계치 이상이면 브레이커 OPEN
+BREAKER_FAILURE_THRESHOLD = _env_int("KAKAO_BREAKER_FAILURE_THRESHOLD", 5)
+BREAKER_WINDOW = _env_float("KAKAO_BREAKER_WINDOW", 30.0)
+# OPEN 유지 시간 (초) — 지나면 HALF_OPEN으로 probe 요청 허용
+BREAKER_RECOVERY_TIMEOUT = _env_float("KAKAO_BREAKER_RECOVERY_TIMEOUT", 15.0)
+BREAKER_HALF_OPEN_CALLS = _env_int("KAKAO_BREAKER_HALF_OPEN_CALLS", 1)
+# 멱등 GET 재시도 횟수 (첫 요청 제외, 연결 실패/5xx만) 및 지수 백오프 (full jitter)
+RETRY_MAX_ATTEMPTS = _env_int("KAKAO_RETRY_MAX_ATTEMPTS", 1)
+RETRY_BASE_DELAY = _env_float("KAKAO_RETRY_BASE_DELAY", 0.1)
+RETRY_MAX_DELAY = _env_float("KAKAO_RETRY_MAX_DELAY", 1.0)
+
+# ── 아웃바운드 호출 예산 (REST 키 쿼터 / 초당 제한) ─────────────
+# 카카오 REST 키 초당 요청 수 (검색/좌표변환)
+REST_RATE_PER_SEC = _env_float("KAKAO_REST_RATE_PER_SEC", 30.0)
+# 플레이스 페이지 스크래핑 초당 요청 수 (리뷰/영업정보/이미지)
+PLACE_RATE_PER_SEC = _env_float("KAKAO_PLACE_RATE_PER_SEC", 50.0)
+# 카카오 REST 키 일일 쿼터 (0이면 무제한)
+REST_DAILY_QUOTA = _env_int("KAKAO_REST_DAILY_QUOTA", 100000)
+# 일일 사용량 DB 기록 주기 (초)
+QUOTA_FLUSH_INTERVAL = _env_float("KAKAO_QUOTA_FLUSH_INTERVAL", 30.0)
+
+# ── 리뷰 캐시 (fetch_place_reviews, stale-while-revalidate) ─
+# 매장별 리뷰 집계 행(review_stats)도 같은 soft/hard TTL 적용
+# soft TTL(초)이 지나면 캐시를 그대로 응답하고 백그라운드로 갱신
+REVIEW_CACHE_SOFT_TTL = _env_float("KAKAO_REVIEW_CACHE_SOFT_TTL", 15 * 60.0)
+# hard TTL(초)이 지나면 캐시를 버리고 다시 가져옴 (최대 허용 지연)
+REVIEW_CACHE_HARD_TTL = _env_float("KAKAO_REVIEW_CACHE_HARD_TTL", 6 * 3600.0)
+REVIEW_CACHE_MAX_ENTRIES = _env_int("KAKAO_REVIEW_CACHE_MAX_ENTRIES", 5000)
+REVIEW_CACHE_MAX_BYTES = _env_int("KAKAO_REVIEW_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+# 동시에 진행하는 백그라운드 갱신 수 (넘으면 이번에는 건너뜀)
+REVIEW_REFRESH_CONCURRENCY = _env_int("KAKAO_REVIEW_REFRESH_CONCURRENCY", 4)
+
+# ── 리뷰 증분 동기화 (reviews 테이블 + 매장별 집계) ──────────
+# 백그라운드 동기화 루프 사용 여부 (기본 꺼짐 — 켜면 주기적으로 place 예산을 씀)
+REVIEW_SYNC_ENABLED = os.getenv("KAKAO_REVIEW_SYNC", "false").lower() in ("1", "true", "yes")
+# 동기화 주기 (초) / 한 번에 동기화하는 매장 수 / 동시 매장 수
+REVIEW_SYNC_INTERVAL = _env_float("KAKAO_REVIEW_SYNC_INTERVAL", 10 * 60.0)
+REVIEW_SYNC_BATCH = _env_int("KAKAO_REVIEW_SYNC_BATCH", 50)
+REVIEW_SYNC_CONCURRENCY = _env_int("KAKAO_REVIEW_SYNC_CONCURRENCY", 2)
+# 매장별 재동기화 간격 (초) — 마지막 동기화 후 이 시간이 지난 매장만 대상
+REVIEW_SYNC_MIN_AGE = _env_float("KAKAO_REVIEW_SYNC_MIN_AGE", 6 * 3600.0)
+# 매장 하나를 동기화할 때 따라가는 최대 페이지 수 (이전 커서에 닿으면 그 전에 멈춤)
+REVIEW_SYNC_MAX_PAGES = _env_int("KAKAO_REVIEW_SYNC_MAX_PAGES", 5)
+
+# ── 리뷰 키워드 배치 (python -m restaurant.keyword_batch) ────
+# 한 번에 읽어서 처리/기록하는 리뷰 수 (체크포인트 단위)
+KEYWORD_BATCH_CHUNK_SIZE = _env_int("KEYWORD_BATCH_CHUNK_SIZE", 2000)
+# 형태소 분석 프로세스 수 (0이면 CPU 코어 수)
+KEYWORD_BATCH_WORKERS = _env_int("KEYWORD_BATCH_WORKERS", 0)
+# 추천 키워드 점수용 매장 × 키워드 행렬을 DB에서 다시 읽는 주기 (초)
+KEYWORD_MATRIX_REFRESH_INTERVAL = _env_float("KEYWORD_MATRIX_REFRESH_INTERVAL", 10 * 60.0)
+
+# ── 추천 결과 캐시 (/api/recommend 후보 목록) ─────────────────
+# (음식 유형, 격자, 반경 구간)별로 평점/이미지까지 붙은 후보 목록을 캐시 — 거리만 요청 좌표로 다시 계산
+RECOMMEND_CACHE_ENABLED = os.getenv("RECOMMEND_CACHE", "true").lower() in ("1", "true", "yes")
+# 격자 크기 (m) — 이 안의 사용자는 같은 후보 목록을 공유
+RECOMMEND_CACHE_CELL_M = _env_float("RECOMMEND_CACHE_CELL_M", 300.0)
+RECOMMEND_CACHE_TTL = _env_float("RECOMMEND_CACHE_TTL", 120.0)
+# 후보가 없었던 결과의 TTL (초)
+RECOMMEND_CACHE_NEGATIVE_TTL = _env_float("RECOMMEND_CACHE_NEGATIVE_TTL", 30.0)
+RECOMMEND_CACHE_MAX_ENTRIES = _env_int("RECOMMEND_CACHE_MAX_ENTRIES", 2000)
+
+# ── 추천 보조 음식 유형 선행 검색 (speculative) ────────────────
+# 주 유형과 보조 유형 검색을 동시에 시작 (기본 꺼짐, 요청에서 more_options=true면 항상 시도)
+RECOMMEND_SPECULATIVE = os.getenv("RECOMMEND_SPECULATIVE", "false").lower() in ("1", "true", "yes")
+# 동시에 진행하는 선행 검색 수 상한 — 넘거나 REST 예산이 BACKGROUND 여유분 밑이면 선행 검색 안 함
+RECOMMEND_SPECULATIVE_MAX_INFLIGHT = _env_int("RECOMMEND_SPECULATIVE_MAX_INFLIGHT", 8)
+
+# ── 추천 응답 마감 시간 (엔드포인트별, 0이면 제한 없음) ──────────
+# 마감까지 끝나지 않은 리뷰/이미지 조회는 기다리지 않고(백그라운드로 계속 → 캐시 채움)
+# 해당 매장은 거리 점수만으로 응답 (partial 표시)
+RECOMMEND_DEADLINE = _env_float("RECOMMEND_DEADLINE", 2.5)
+RECOMMEND_STREAM_DEADLINE = _env_float("RECOMMEND_STREAM_DEADLINE", 6.0)
+
+# ── 추천 후보 지연 보강 ──────────────────────────────────
+# 거리 + 저장/캐시된 평점으로 먼저 순위를 매기고 상위 K개만 리뷰/이미지 조회
+# 나머지는 /api/recommend/more 요청 때 보강 (0이면 전부 바로 보강)
+RECOMMEND_ENRICH_TOP_K = _env_int("RECOMMEND_ENRICH_TOP_K", 5)
+
+# ── 영업정보 캐시 (fetch_place_info) ─────────────────────────
+# 다음 영업 상태 변화(오픈/브레이크/마감)나 자정(KST)까지 유효, 단 이 값을 넘지 않음 (초)
+INFO_CACHE_MAX_TTL = _env_float("KAKAO_INFO_CACHE_MAX_TTL", 6 * 3600.0)
+# 영업시간을 파싱할 수 없는 매장의 TTL (초)
+INFO_CACHE_UNSCHEDULED_TTL = _env_float("KAKAO_INFO_CACHE_UNSCHEDULED_TTL", 30 * 60.0)
+# 응답이 비어 있는 매장의 TTL (초)
+INFO_CACHE_NEGATIVE_TTL = _env_float("KAKAO_INFO_CACHE_NEGATIVE_TTL", 10 * 60.0)
+INFO_CACHE_MAX_ENTRIES = _env_int("KAKAO_INFO_CACHE_MAX_ENTRIES", 5000)
+# 요일별 영업 구간 (영업 중 여부 로컬 계산용) 보관 기간 (초)
+SCHEDULE_CACHE_TTL = _env_float("KAKAO_SCHEDULE_CACHE_TTL", 7 * 24 * 3600.0)
+
+# ── 좌표 → 지역 변환 (coord2region) ──────────────────────────
+# geohash 격자 정밀도 (7 ≈ 150m) — 같은 격자 요청은 캐시 공유
+REGION_GEOHASH_PRECISION = _env_int("KAKAO_REGION_GEOHASH_PRECISION", 7)
+REGION_CACHE_TTL = _env_float("KAKAO_REGION_CACHE_TTL", 24 * 3600.0)
+REGION_CACHE_MAX_ENTRIES = _env_int("KAKAO_REGION_CACHE_MAX_ENTRIES", 20000)
+# 업스트림 실패 시 로컬 인덱스에서 이 거리 안의 가장 가까운 동을 사용 (m)
+REGION_FALLBACK_MAX_M = _env_float("KAKAO_REGION_FALLBACK_MAX_M", 3000.0)
+
+# ── 매장 상세 일괄 조회 (POST /api/restaurants/batch) ────────
+# 동시에 상세를 가져오는 매장 수
+BATCH_CONCURRENCY = _env_int("KAKAO_BATCH_CONCURRENCY", 10)
+
+# ── 매장 ID 인덱스 (검색 결과 → 상세 조회) ──────────────────
+# 메모리 인덱스 최대 매장 수 / 추정 메모리 상한
+PLACE_INDEX_MAX_ENTRIES = _env_int("KAKAO_PLACE_INDEX_MAX_ENTRIES", 20000)
+PLACE_INDEX_MAX_BYTES = _env_int("KAKAO_PLACE_INDEX_MAX_BYTES", 32 * 1024 * 1024)
+# 레코드 보존 기간 (초) — 메모리/DB 공통, 다시 검색되면 갱신
+PLACE_INDEX_TTL = _env_float("KAKAO_PLACE_INDEX_TTL", 7 * 24 * 3600.0)
+
+# ── 영역 스캐너 (격자 분할 전체 수집) ───────────────────────
+# 동시에 조회하는 격자 수
+SCAN_CONCURRENCY = _env_int("KAKAO_SCAN_CONCURRENCY", 4)
+# 이보다 작은 격자는 더 나누지 않음 (m) — 45건 넘어도 그대로 수집
+SCAN_MIN_CELL_M = _env_float("KAKAO_SCAN_MIN_CELL_M", 50.0)
+# 격자 조회 실패(예산 부족 포함) 시 재시도 횟수와 첫 대기 시간 (초, 매번 2배)
+SCAN_MAX_RETRIES = _env_int("KAKAO_SCAN_MAX_RETRIES", 3)
+SCAN_RETRY_DELAY = _env_float("KAKAO_SCAN_RETRY_DELAY", 1.0)
+
+# ── 로컬 매장 미러 (인메모리 공간 인덱스) ───────────────────
+# 영역 스캔으로 완전 수집된 지역은 이 기간(초) 동안 카카오 대신 로컬에서 응답
+MIRROR_ENABLED = os.getenv("KAKAO_MIRROR", "true").lower() in ("1", "true", "yes")
+MIRROR_MAX_AGE = _env_float("KAKAO_MIRROR_MAX_AGE", 24 * 3600.0)
+MIRROR_MAX_ENTRIES = _env_int("KAKAO_MIRROR_MAX_ENTRIES", 200000)
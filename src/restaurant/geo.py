@@ -0,0 +1,73 @@
+"""좌표 계산 유틸 (거리, 격자 스냅)"""
+
+import math
+
+EARTH_RADIUS_M = 6_371_000
+# 위도 1도당 거리 (m)
+METERS_PER_DEG_LAT = 111_320
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> int:
+    """두 좌표 사이 거리 (m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return int(round(2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))))
+
+
+def snap_to_cell(lat: float, lng: float, cell_m: float) -> tuple[tuple[int, int], float, float]:
+    """좌표를 cell_m 크기 격자에 스냅
+
+    Returns:
+        ((격자 행, 격자 열), 격자 중심 위도, 격자 중심 경도)
+    """
+    dlat = cell_m / METERS_PER_DEG_LAT
+    row = math.floor(lat / dlat)
+    center_lat = (row + 0.5) * dlat
+    # 경도 간격은 격자 행 중심 위도 기준으로 계산 (같은 행은 같은 간격)
+    dlng = cell_m / (METERS_PER_DEG_LAT * max(math.cos(math.radians(center_lat)), 1e-6))
+    col = math.floor(lng / dlng)
+    center_lng = (col + 0.5) * dlng
+    return (row, col), round(center_lat, 6), round(center_lng, 6)
+
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(lat: float, lng: float, precision: int = 7) -> str:
+    """좌표 → geohash 문자열 (precision 7 ≈ 150m, 6 ≈ 1.2km × 0.6km)"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bit, ch, even = 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                ch = (ch << 1) | 1
+                lng_lo = mid
+            else:
+                ch <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_lo = mid
+            else:
+                ch <<= 1
+                lat_hi = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_GEOHASH_BASE32[ch])
+            bit, ch = 0, 0
+    return "".join(chars)
+
+
+def bbox_around(lat: float, lng: float, radius_m: float) -> tuple[float, float, float, float]:
+    """좌표 중심 반경을 덮는 사각형 (최소 경도, 최소 위도, 최대 경도, 최대 위도)"""
+    dlat = radius_m / METERS_PER_DEG_LAT
+    dlng = radius_m / (METERS_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+    return lng - dlng, lat - dlat, lng + dlng, lat + dlat
@@ -0,0 +1,268 @@
+"""카카오 아웃바운드 호출 예산 관리 (프로세스 전역)
+
+- 토큰 버킷: 초당 요청 수 제한 (REST 키 / 플레이스 스크래핑 각각)
+- 일일 쿼터: REST 키 호출 수를 KST 날짜별로 DB에 기록 (재시작 후에도 유지)
+- 우선순위: 사용자 검색 > 리뷰/영업정보 > 이미지 > 백그라운드 작업
+  낮은 우선순위는 버킷/쿼터의 여유분을 남겨두고, 예산이 부족하면 건너뜀
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from enum import IntEnum
+from zoneinfo import ZoneInfo
+
+from database.connection import SessionLocal
+from database.models import ApiQuotaUsage
+
+from . import config
+
+
+class Priority(IntEnum):
+    """아웃바운드 요청 우선순위 (값이 작을수록 높음)"""
+    USER = 0        # 사용자 검색, 좌표→지역
+    ENRICH = 1      # 리뷰, 영업정보
+    IMAGE = 2       # og:image 스크래핑
+    BACKGROUND = 3  # 프리페치, 워밍업, 크롤링
+
+
+# 우선순위별 버킷 예약분 (이 비율만큼은 상위 우선순위용으로 남겨둠)
+_BUCKET_RESERVE = {
+    Priority.USER: 0.0,
+    Priority.ENRICH: 0.1,
+    Priority.IMAGE: 0.3,
+    Priority.BACKGROUND: 0.5,
+}
+# 우선순위별 토큰 대기 한도 (초) — 넘으면 건너뜀
+_MAX_WAIT = {
+    Priority.USER: 1.0,
+    Priority.ENRICH: 0.5,
+    Priority.IMAGE: 0.2,
+    Priority.BACKGROUND: 0.0,
+}
+# 우선순위별 최소 잔여 일일 쿼터 비율 — 이보다 적게 남으면 건너뜀
+_QUOTA_FLOOR = {
+    Priority.USER: 0.0,
+    Priority.ENRICH: 0.05,
+    Priority.IMAGE: 0.2,
+    Priority.BACKGROUND: 0.4,
+}
+
+_KST = ZoneInfo("Asia/Seoul")
+_QUOTA_API = "kakao_rest"
+
+# 호출 맥락의 우선순위 (프리페치 등 백그라운드 작업에서 낮춤)
+_priority_override: ContextVar[Priority | None] = ContextVar("kakao_priority", default=None)
+
+
+class BudgetExceededError(Exception):
+    """호출 예산 부족으로 요청을 보내지 않음"""
+
+    def __init__(self, bucket: str, priority: Priority, reason: str):
+        super().__init__(f"{bucket} budget exceeded for {priority.name} ({reason})")
+        self.bucket = bucket
+        self.priority = priority
+        self.reason = reason
+
+
+@contextmanager
+def outbound_priority(priority: Priority):
+    """이 블록 안의 카카오 호출 우선순위를 낮춤 (예: 백그라운드 프리페치)"""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def effective_priority(default: Priority) -> Priority:
+    """엔드포인트 기본 우선순위와 호출 맥락 중 더 낮은 쪽"""
+    override = _priority_override.get()
+    return default if override is None else max(default, override)
+
+
+class TokenBucket:
+    """초당 요청 수 제한 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self, reserve: float = 0.0) -> float:
+        """토큰 1개 사용 시도
+
+        Returns:
+            0이면 성공, 아니면 토큰이 생길 때까지 기다려야 하는 시간 (초)
+        """
+        self._refill()
+        floor = self.capacity * reserve
+        if self.tokens - 1 >= floor:
+            self.tokens -= 1
+            return 0.0
+        return (floor + 1 - self.tokens) / self.rate
+
+
+class OutboundGovernor:
+    """버킷 + 일일 쿼터 + 우선순위 기반 호출 허가"""
+
+    def __init__(self):
+        self.buckets = {
+            "rest": TokenBucket(config.REST_RATE_PER_SEC),
+            "place": TokenBucket(config.PLACE_RATE_PER_SEC),
+        }
+        self.daily_quota = config.REST_DAILY_QUOTA
+        self._day = self._today()
+        self._used = 0
+        self._unflushed = 0
+        self._carry: tuple[str, int] | None = None  # 날짜가 바뀌며 못 기록한 전날 (날짜, 사용량)
+        self._loaded = False
+        self.granted = {p.name: 0 for p in Priority}
+        self.skipped = {p.name: 0 for p in Priority}
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(_KST).strftime("%Y-%m-%d")
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            # 마지막 주기 기록 이후 전날 사용분은 다음 flush에서 전날 날짜로 기록
+            if self._loaded and self._unflushed:
+                self._carry = (self._day, self._used)
+            self._day = today
+            self._used = 0
+            self._unflushed = 0
+
+    @property
+    def quota_remaining(self) -> int:
+        self._roll_day()
+        return max(0, self.daily_quota - self._used)
+
+    @property
+    def remaining_ratio(self) -> float:
+        """남은 일일 쿼터 비율 (쿼터 0 = 무제한으로 간주)"""
+        if self.daily_quota <= 0:
+            return 1.0
+        return self.quota_remaining / self.daily_quota
+
+    def admits(self, bucket: str, priority: Priority) -> bool:
+        """지금 바로 허가될지 미리 확인 (토큰/쿼터는 차감하지 않음)
+
+        프리페치처럼 건너뛰어도 되는 작업을 시작 전에 포기할 때 사용
+        """
+        floor = _QUOTA_FLOOR[priority]
+        if (bucket == "rest" or floor > 0) and self.remaining_ratio <= floor:
+            return False
+        token_bucket = self.buckets[bucket]
+        token_bucket._refill()
+        return token_bucket.tokens - 1 >= token_bucket.capacity * _BUCKET_RESERVE[priority]
+
+    async def acquire(self, bucket: str, priority: Priority) -> None:
+        """호출 허가 (예산 부족 시 BudgetExceededError)
+
+        bucket: "rest"(REST 키, 일일 쿼터 차감) | "place"(스크래핑)
+        """
+        # 쿼터가 바닥나면 낮은 우선순위부터 차단
+        # (이미지처럼 쿼터를 쓰지 않는 요청도 검색 쪽 여유를 위해 함께 건너뜀)
+        floor = _QUOTA_FLOOR[priority]
+        if (bucket == "rest" or floor > 0) and self.remaining_ratio <= floor:
+            self.skipped[priority.name] += 1
+            raise BudgetExceededError(bucket, priority, "daily quota")
+
+        deadline = time.monotonic() + _MAX_WAIT[priority]
+        token_bucket = self.buckets[bucket]
+        while True:
+            wait = token_bucket.try_take(_BUCKET_RESERVE[priority])
+            if wait == 0.0:
+                break
+            if time.monotonic() + wait > deadline:
+                self.skipped[priority.name] += 1
+                raise BudgetExceededError(bucket, priority, "rate limit")
+            await asyncio.sleep(wait)
+
+        if bucket == "rest":
+            self._used += 1
+            self._unflushed += 1
+        self.granted[priority.name] += 1
+
+    # ── 일일 사용량 영구 저장 ──────────────────────────────────
+    def _load_sync(self) -> None:
+        if self._loaded:
+            return
+        with SessionLocal() as db:
+            row = db.get(ApiQuotaUsage, (self._day, _QUOTA_API))
+            # 로드 전에 이미 사용한 분량은 유지
+            self._used += row.count if row else 0
+        self._loaded = True
+
+    def _flush_sync(self, day: str, count: int) -> None:
+        with SessionLocal() as db:
+            row = db.get(ApiQuotaUsage, (day, _QUOTA_API))
+            if row is None:
+                db.add(ApiQuotaUsage(day=day, api=_QUOTA_API, count=count))
+            else:
+                row.count = count
+            db.commit()
+
+    async def load(self) -> None:
+        """오늘 사용량을 DB에서 불러옴 (앱 시작 시)"""
+        self._roll_day()
+        try:
+            await asyncio.to_thread(self._load_sync)
+        except Exception as e:
+            print(f"Quota load error: {e}")
+
+    async def flush(self) -> None:
+        """사용량 DB 기록"""
+        self._roll_day()
+        if self._carry is not None:
+            try:
+                await asyncio.to_thread(self._flush_sync, *self._carry)
+                self._carry = None
+            except Exception as e:
+                print(f"Quota flush error: {e}")
+        if not self._loaded or not self._unflushed:
+            return
+        day, count, pending = self._day, self._used, self._unflushed
+        try:
+            await asyncio.to_thread(self._flush_sync, day, count)
+            self._unflushed -= pending
+        except Exception as e:
+            print(f"Quota flush error: {e}")
+
+    async def run_flush(self, interval: float = config.QUOTA_FLUSH_INTERVAL) -> None:
+        """주기적 사용량 기록 루프 (lifespan에서 백그라운드 Task로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+    def snapshot(self) -> dict:
+        """남은 예산 (관리자 API용)"""
+        remaining = self.quota_remaining
+        for b in self.buckets.values():
+            b._refill()
+        return {
+            "day": self._day,
+            "daily_quota": self.daily_quota,
+            "used": self._used,
+            "remaining": remaining,
+            "remaining_ratio": round(self.remaining_ratio, 4),
+            "buckets": {
+                name: {"rate_per_sec": b.rate, "capacity": b.capacity, "tokens": round(b.tokens, 1)}
+                for name, b in self.buckets.items()
+            },
+            "granted": dict(self.granted),
+            "skipped": dict(self.skipped),
+        }
+
+
+governor = OutboundGovernor()
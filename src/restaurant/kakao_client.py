@@ -3,12 +3,225 @@
 import os
 import re
 import random
+import time
 import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
 import httpx
 
-KAKAO_KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
-KAKAO_CATEGORY_URL = "https://dapi.kakao.com/v2/local/search/category.json"
-KAKAO_COORD2REGION_URL = "https://dapi.kakao.com/v2/local/geo/coord2regioncode.json"
+from . import config, place_index, place_store, review_store
+from .cache import TTLCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .governor import BudgetExceededError, Priority, effective_priority, governor, outbound_priority
+from .open_hours import KST, is_open_at, next_transition, parse_weekly_schedule
+from .local_mirror import mirror
+from .region import RegionIndex
+from .geo import bbox_around, geohash_encode, haversine_m, snap_to_cell
+from .singleflight import SingleFlight
+
+KAKAO_KEYWORD_URL = f"{config.KAKAO_API_BASE_URL}/v2/local/search/keyword.json"
+KAKAO_CATEGORY_URL = f"{config.KAKAO_API_BASE_URL}/v2/local/search/category.json"
+KAKAO_COORD2REGION_URL = f"{config.KAKAO_API_BASE_URL}/v2/local/geo/coord2regioncode.json"
+
+# 타임아웃 프로파일
+SEARCH_TIMEOUT = httpx.Timeout(
+    config.SEARCH_READ_TIMEOUT, connect=config.SEARCH_CONNECT_TIMEOUT
+)
+PLACE_TIMEOUT = httpx.Timeout(
+    config.PLACE_READ_TIMEOUT, connect=config.PLACE_CONNECT_TIMEOUT
+)
+PLACE_IMAGE_TIMEOUT = httpx.Timeout(
+    config.PLACE_IMAGE_READ_TIMEOUT, connect=config.PLACE_CONNECT_TIMEOUT
+)
+
+# 공유 HTTP 클라이언트 (lifespan에서 열고 닫음)
+_http_client: httpx.AsyncClient | None = None
+# 호스트별 동시 요청 제한
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """커넥션 풀 설정이 적용된 AsyncClient 생성"""
+    http2 = config.HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=SEARCH_TIMEOUT,
+    )
+
+
+async def open_http_client() -> None:
+    """공유 HTTP 클라이언트 열기 (앱 시작 시)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 닫기 (앱 종료 시)"""
+    global _http_client
+    for task in [*_prefetch_tasks.values(), *_review_refreshes.values()]:
+        task.cancel()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _host_semaphores.clear()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 반환 (lifespan 밖에서 호출되면 lazy 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+    return _http_client
+
+
+@asynccontextmanager
+async def _host_slot(url: str):
+    """호스트별 동시 요청 수 제한"""
+    host = urlsplit(url).netloc
+    sem = _host_semaphores.get(host)
+    if sem is None:
+        sem = _host_semaphores[host] = asyncio.Semaphore(config.HTTP_MAX_PER_HOST)
+    async with sem:
+        yield
+
+
+# 엔드포인트별 서킷 브레이커
+_breakers: dict[str, CircuitBreaker] = {
+    name: CircuitBreaker(
+        name,
+        failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+        window=config.BREAKER_WINDOW,
+        recovery_timeout=config.BREAKER_RECOVERY_TIMEOUT,
+        half_open_max_calls=config.BREAKER_HALF_OPEN_CALLS,
+    )
+    for name in ("keyword", "category", "coord2region", "place_reviews", "place_info", "place_image")
+}
+
+# 엔드포인트별 호출 예산 버킷과 기본 우선순위
+_ENDPOINT_BUDGET: dict[str, tuple[str, Priority]] = {
+    "keyword": ("rest", Priority.USER),
+    "category": ("rest", Priority.USER),
+    "coord2region": ("rest", Priority.USER),
+    "place_reviews": ("place", Priority.ENRICH),
+    "place_info": ("place", Priority.ENRICH),
+    "place_image": ("place", Priority.IMAGE),
+}
+
+# 업스트림 장애로 보는 상태 코드 (브레이커 실패로 기록)
+_FAILURE_STATUS = {429, 500, 502, 503, 504}
+# 재시도하는 경우: 5xx와 연결 단계 실패만
+# (읽기 타임아웃은 재시도하면 장애 중 최악 지연이 두 배가 되고, 429는 재시도해도 부하만 늘어남)
+_RETRY_STATUS = {500, 502, 503, 504}
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _retry_delay(attempt: int) -> float:
+    """지수 백오프 + full jitter"""
+    cap = min(config.RETRY_MAX_DELAY, config.RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+async def _admit(endpoint: str) -> None:
+    """브레이커 + 호출 예산 확인 (거부 시 예외 → 호출 측 fallback)"""
+    if not _breakers[endpoint].allow():
+        raise CircuitOpenError(endpoint)
+    bucket, priority = _ENDPOINT_BUDGET[endpoint]
+    await governor.acquire(bucket, effective_priority(priority))
+
+
+async def _get(
+    url: str,
+    *,
+    endpoint: str,
+    headers: dict,
+    params: dict | None = None,
+    timeout: httpx.Timeout = SEARCH_TIMEOUT,
+    follow_redirects: bool = False,
+) -> httpx.Response:
+    """공유 풀을 통한 GET 요청 (서킷 브레이커 + 호출 예산 + 지터 재시도)
+
+    브레이커가 열려 있거나 예산이 없으면 예외 — 호출 측 fallback으로 처리됨
+    재시도는 연결 실패/5xx만 (읽기 타임아웃은 바로 실패)
+    """
+    breaker = _breakers[endpoint]
+    attempt = 0
+    while True:
+        await _admit(endpoint)
+        try:
+            async with _host_slot(url):
+                response = await get_http_client().get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
+                    follow_redirects=follow_redirects,
+                )
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if not isinstance(e, _RETRY_ERRORS) or attempt >= config.RETRY_MAX_ATTEMPTS:
+                raise
+        else:
+            if response.status_code not in _FAILURE_STATUS:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if response.status_code not in _RETRY_STATUS or attempt >= config.RETRY_MAX_ATTEMPTS:
+                return response
+        await asyncio.sleep(_retry_delay(attempt))
+        attempt += 1
+
+
+@asynccontextmanager
+async def _stream(
+    url: str,
+    *,
+    endpoint: str,
+    headers: dict,
+    timeout: httpx.Timeout,
+    follow_redirects: bool = False,
+):
+    """공유 풀을 통한 스트리밍 GET (본문을 다 읽지 않고 닫을 수 있음)
+
+    본문을 읽는 도중 실패할 수 있어 재시도 없이 브레이커만 적용
+    """
+    breaker = _breakers[endpoint]
+    await _admit(endpoint)
+    try:
+        async with _host_slot(url):
+            async with get_http_client().stream(
+                "GET",
+                url,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+            ) as response:
+                if response.status_code in _FAILURE_STATUS:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                yield response
+    except httpx.TransportError:
+        breaker.record_failure()
+        raise
+
+
+def breaker_states() -> dict:
+    """엔드포인트별 브레이커 상태 (모니터링용)"""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
+
+
+def _kakao_auth_headers() -> dict:
+    return {"Authorization": f"KakaoAK {os.getenv('KAKAO_REST_API_KEY')}"}
+
 
 # 지역별 좌표 (위도, 경도)
 LOCATION_COORDS = {
@@ -61,7 +274,8 @@ def _parse_place(place: dict) -> dict:
         "place_url": place.get("place_url", ""),
         "lat": float(place["y"]),
         "lng": float(place["x"]),
-        "distance": int(place.get("distance", 0)),
+        # 좌표 없이(rect만으로) 검색하면 distance가 빈 문자열
+        "distance": int(place.get("distance") or 0),
     }
 
 
@@ -105,6 +319,160 @@ def _get_mock_results(query: str = "", size: int = 5) -> list[dict]:
     return results
 
 
+# 검색 결과 캐시 (목업 결과는 절대 저장하지 않음)
+_search_cache = TTLCache(
+    maxsize=config.SEARCH_CACHE_MAX_ENTRIES,
+    ttl=config.SEARCH_CACHE_TTL,
+    negative_ttl=config.SEARCH_CACHE_NEGATIVE_TTL,
+)
+
+
+# 동시에 들어온 동일 업스트림 요청 합치기
+_flight = SingleFlight()
+
+
+def _normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (공백 정리, 소문자)"""
+    return " ".join(query.split()).lower()
+
+
+def _snap_search_area(lat: float, lng: float, radius: int) -> tuple[tuple[int, int], float, float, int]:
+    """좌표를 격자 중심으로 스냅하고, 원래 반경을 덮도록 반경을 넓힘
+
+    Returns:
+        (격자, 중심 위도, 중심 경도, 업스트림 조회 반경)
+    """
+    cell, center_lat, center_lng = snap_to_cell(lat, lng, config.SEARCH_CACHE_CELL_M)
+    # 격자 중심 ↔ 실제 좌표 최대 오차(반 대각선)만큼 반경 확장 (카카오 최대 20km)
+    padding = int(config.SEARCH_CACHE_CELL_M * 0.71) + 1
+    return cell, center_lat, center_lng, min(radius + padding, 20000)
+
+
+def _localize_result(
+    result: dict,
+    lat: float | None,
+    lng: float | None,
+    radius: int,
+    sort_by_distance: bool,
+    page: int = 1,
+) -> dict:
+    """캐시된 결과를 요청 좌표 기준으로 변환 (거리 재계산, 반경 밖 제거)
+
+    캐시 항목이 공유되므로 항상 복사본을 반환.
+    모든 페이지가 같은 (격자 중심 + 넓힌 반경) 조회를 잘라 쓰므로 페이지 사이 중복/누락은 없음.
+    meta는 넓힌 조회 기준이라 반경 밖 매장이 빠진 만큼 다시 계산:
+    - is_end: 넓힌 조회가 끝났으면 요청 반경도 끝 (아니면 남은 페이지에 반경 안 매장이 있을 수 있음)
+    - total_count: 1페이지가 마지막이면 정확한 개수, 아니면 이 페이지에서 남은 비율로 추정
+    """
+    upstream = result["documents"]
+    documents = [dict(d) for d in upstream]
+    meta = dict(result["meta"])
+    if lat is not None and lng is not None:
+        for doc in documents:
+            doc["distance"] = haversine_m(lat, lng, doc["lat"], doc["lng"])
+        documents = [d for d in documents if d["distance"] <= radius]
+        if sort_by_distance:
+            documents.sort(key=lambda d: d["distance"])
+        if len(documents) < len(upstream):
+            if meta["is_end"] and page == 1:
+                meta["total_count"] = len(documents)
+            else:
+                estimate = round(meta["total_count"] * len(documents) / len(upstream))
+                meta["total_count"] = max(estimate, len(documents))
+    return {"documents": documents, "meta": meta}
+
+
+async def _fetch_search(url: str, params: dict, label: str) -> dict | None:
+    """카카오 검색 API 호출 (실패 시 None — 호출 측에서 목업으로 대체)"""
+    try:
+        response = await _get(
+            url,
+            endpoint=label,
+            headers=_kakao_auth_headers(),
+            params=params,
+            timeout=SEARCH_TIMEOUT,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            documents = [_parse_place(p) for p in data.get("documents", [])]
+            meta = data.get("meta", {})
+            return {
+                "documents": documents,
+                "meta": {
+                    "total_count": meta.get("total_count", len(documents)),
+                    "is_end": meta.get("is_end", True),
+                },
+            }
+        else:
+            print(f"Kakao {label} API error: {response.status_code}")
+    except Exception as e:
+        print(f"Kakao {label} API error: {e}")
+    return None
+
+
+# 진행 중인 검색의 우선순위 (캐시 키 -> 먼저 시작한 호출의 우선순위)
+_search_inflight_priority: dict[tuple, Priority] = {}
+
+
+async def _search_with_cache(cache_key: tuple, url: str, params: dict, label: str) -> dict | None:
+    """캐시 미스 시 업스트림 조회 (동일 키 동시 요청은 한 번만 호출)
+
+    공유 요청은 먼저 시작한 호출의 우선순위로 나감 → 더 낮은 우선순위(BACKGROUND 프리페치 등)
+    요청에 합쳐졌다가 실패하면(예산 거부 등) 내 우선순위로 한 번 다시 보냄
+    """
+    priority = effective_priority(_ENDPOINT_BUDGET[label][1])
+    shared = _search_inflight_priority.get(cache_key)
+    if shared is None:
+        _search_inflight_priority[cache_key] = priority
+
+    async def fetch() -> dict | None:
+        result = await _fetch_search(url, params, label)
+        if result is not None:
+            _search_cache.set(cache_key, result, negative=not result["documents"])
+            place_index.add_many(result["documents"])
+            if config.MIRROR_ENABLED:
+                mirror.add_many(result["documents"], params["category_group_code"])
+        return result
+
+    try:
+        result = await _flight.do(cache_key, fetch)
+    finally:
+        if shared is None:
+            _search_inflight_priority.pop(cache_key, None)
+    if result is None and shared is not None and shared > priority:
+        _prefetch_counters["reissued"] += 1
+        result = await _flight.do(cache_key, fetch)
+    return result
+
+
+def _keyword_request(
+    query: str,
+    lat: float | None,
+    lng: float | None,
+    radius: int,
+    page: int,
+    size: int,
+    category_code: str,
+) -> tuple[tuple, dict]:
+    """키워드 검색 캐시 키와 업스트림 파라미터"""
+    params: dict = {
+        "query": query,
+        "category_group_code": category_code,
+        "sort": "accuracy",
+        "page": page,
+        "size": size,
+    }
+    cell = None
+    if lat is not None and lng is not None:
+        cell, center_lat, center_lng, query_radius = _snap_search_area(lat, lng, radius)
+        params["y"] = str(center_lat)
+        params["x"] = str(center_lng)
+        params["radius"] = query_radius
+
+    cache_key = ("keyword", _normalize_query(query), category_code, radius, page, size, cell)
+    return cache_key, params
+
+
 async def search_keyword(
     query: str,
     lat: float | None = None,
@@ -123,40 +491,14 @@ async def search_keyword(
         mocks = _get_mock_results(query, size)
         return {"documents": mocks, "meta": {"total_count": len(mocks), "is_end": True}}
 
-    params: dict = {
-        "query": query,
-        "category_group_code": category_code,
-        "sort": "accuracy",
-        "page": page,
-        "size": size,
-    }
-    if lat is not None and lng is not None:
-        params["y"] = str(lat)
-        params["x"] = str(lng)
-        params["radius"] = radius
+    cache_key, params = _keyword_request(query, lat, lng, radius, page, size, category_code)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return _localize_result(cached, lat, lng, radius, sort_by_distance=False, page=page)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                KAKAO_KEYWORD_URL,
-                headers={"Authorization": f"KakaoAK {os.getenv('KAKAO_REST_API_KEY')}"},
-                params=params,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                documents = [_parse_place(p) for p in data.get("documents", [])]
-                meta = data.get("meta", {})
-                return {
-                    "documents": documents,
-                    "meta": {
-                        "total_count": meta.get("total_count", len(documents)),
-                        "is_end": meta.get("is_end", True),
-                    },
-                }
-            else:
-                print(f"Kakao keyword API error: {response.status_code}")
-        except Exception as e:
-            print(f"Kakao keyword API error: {e}")
+    result = await _search_with_cache(cache_key, KAKAO_KEYWORD_URL, params, "keyword")
+    if result is not None:
+        return _localize_result(result, lat, lng, radius, sort_by_distance=False, page=page)
 
     mocks = _get_mock_results(query, size)
     return {"documents": mocks, "meta": {"total_count": len(mocks), "is_end": True}}
@@ -179,101 +521,301 @@ async def search_nearby(
         mocks = _get_mock_results("", size)
         return {"documents": mocks, "meta": {"total_count": len(mocks), "is_end": True}}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                KAKAO_CATEGORY_URL,
-                headers={"Authorization": f"KakaoAK {os.getenv('KAKAO_REST_API_KEY')}"},
-                params={
-                    "category_group_code": category_code,
-                    "y": str(lat),
-                    "x": str(lng),
-                    "radius": radius,
-                    "sort": "distance",
-                    "page": page,
-                    "size": size,
-                },
-            )
-            if response.status_code == 200:
-                data = response.json()
-                documents = [_parse_place(p) for p in data.get("documents", [])]
-                meta = data.get("meta", {})
-                return {
-                    "documents": documents,
-                    "meta": {
-                        "total_count": meta.get("total_count", len(documents)),
-                        "is_end": meta.get("is_end", True),
-                    },
-                }
-            else:
-                print(f"Kakao category API error: {response.status_code}")
-        except Exception as e:
-            print(f"Kakao category API error: {e}")
+    local = search_local(lat, lng, radius, category_code=category_code)
+    if local is not None:
+        start = (page - 1) * size
+        return {
+            "documents": local[start:start + size],
+            "meta": {"total_count": len(local), "is_end": start + size >= len(local)},
+        }
+
+    cell, center_lat, center_lng, query_radius = _snap_search_area(lat, lng, radius)
+    cache_key = ("category", category_code, radius, page, size, cell)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return _localize_result(cached, lat, lng, radius, sort_by_distance=True, page=page)
+
+    result = await _search_with_cache(
+        cache_key,
+        KAKAO_CATEGORY_URL,
+        {
+            "category_group_code": category_code,
+            "y": str(center_lat),
+            "x": str(center_lng),
+            "radius": query_radius,
+            "sort": "distance",
+            "page": page,
+            "size": size,
+        },
+        "category",
+    )
+    if result is not None:
+        return _localize_result(result, lat, lng, radius, sort_by_distance=True, page=page)
 
     mocks = _get_mock_results("", size)
     return {"documents": mocks, "meta": {"total_count": len(mocks), "is_end": True}}
 
 
+async def search_rect(
+    rect: tuple[float, float, float, float],
+    query: str | None = None,
+    category_code: str = "FD6",
+    page: int = 1,
+    size: int = 15,
+) -> dict | None:
+    """사각형 영역 검색 (영역 스캐너용)
+
+    rect: (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+    query가 있으면 키워드 검색, 없으면 카테고리 검색.
+    목업으로 대체하지 않고 업스트림 실패/예산 부족 시 None — 호출 측에서 재시도
+    """
+    if not os.getenv("KAKAO_REST_API_KEY"):
+        return None
+
+    rect_param = ",".join(f"{v:.6f}" for v in rect)
+    params: dict = {
+        "category_group_code": category_code,
+        "rect": rect_param,
+        "page": page,
+        "size": size,
+    }
+    if query:
+        params["query"] = query
+        url, label = KAKAO_KEYWORD_URL, "keyword"
+        cache_key = ("keyword", _normalize_query(query), category_code, rect_param, page, size)
+    else:
+        url, label = KAKAO_CATEGORY_URL, "category"
+        cache_key = ("category", category_code, rect_param, page, size)
+
+    result = _search_cache.get(cache_key)
+    if result is None:
+        result = await _search_with_cache(cache_key, url, params, label)
+    if result is None:
+        return None
+    return _localize_result(result, None, None, 0, sort_by_distance=False)
+
+
+# 진행 중인 다음 페이지 프리페치 (캐시 키 -> Task)
+_prefetch_tasks: dict[tuple, asyncio.Task] = {}
+# reissued: 프리페치에 합쳐졌다가 거부돼서 사용자 우선순위로 다시 보낸 검색 수
+_prefetch_counters = {"scheduled": 0, "completed": 0, "skipped": 0, "cancelled": 0, "reissued": 0}
+
+
+def prefetch_next_page(
+    query: str,
+    lat: float | None,
+    lng: float | None,
+    radius: int,
+    page: int,
+    size: int,
+    category_code: str = "FD6",
+) -> None:
+    """검색 page 응답 직후 page+1과 그 이미지를 백그라운드로 캐시에 채움
+
+    BACKGROUND 우선순위로 호출 — 예산이 부족하거나 프리페치가 밀려 있으면 건너뜀
+    """
+    if not config.SEARCH_PREFETCH_ENABLED or not os.getenv("KAKAO_REST_API_KEY"):
+        return
+    cache_key, params = _keyword_request(query, lat, lng, radius, page + 1, size, category_code)
+    if cache_key in _prefetch_tasks or cache_key in _search_cache:
+        return
+    if (
+        len(_prefetch_tasks) >= config.SEARCH_PREFETCH_MAX_INFLIGHT
+        or not governor.admits("rest", Priority.BACKGROUND)
+    ):
+        _prefetch_counters["skipped"] += 1
+        return
+
+    async def _run() -> None:
+        with outbound_priority(Priority.BACKGROUND):
+            result = await _search_with_cache(cache_key, KAKAO_KEYWORD_URL, params, "keyword")
+            if result is None:
+                _prefetch_counters["cancelled"] += 1
+                return
+            for doc in result["documents"]:
+                if doc["id"] in _image_cache:
+                    continue
+                # 이미지 버킷 여유가 없으면 나머지는 사용자 요청 때 가져옴
+                if not governor.admits("place", Priority.BACKGROUND):
+                    _prefetch_counters["cancelled"] += 1
+                    return
+                await fetch_place_image(doc["id"])
+        _prefetch_counters["completed"] += 1
+
+    task = asyncio.create_task(_run())
+    _prefetch_tasks[cache_key] = task
+    task.add_done_callback(lambda _: _prefetch_tasks.pop(cache_key, None))
+    _prefetch_counters["scheduled"] += 1
+
+
+def prefetch_stats() -> dict:
+    """다음 페이지 프리페치 통계"""
+    return {
+        "enabled": config.SEARCH_PREFETCH_ENABLED,
+        "inflight": len(_prefetch_tasks),
+        **_prefetch_counters,
+    }
+
+
+# 로컬 미러 응답 (결과 있음 / 커버됐지만 조건에 맞는 매장 없음) / 커버리지 부족으로 카카오 호출 수
+_mirror_counters = {"served": 0, "empty": 0, "stale": 0}
+
+
+def search_local(
+    lat: float,
+    lng: float,
+    radius: int,
+    keywords: list[str] | None = None,
+    category_code: str = "FD6",
+) -> list[dict] | None:
+    """로컬 미러에서 반경 검색 (가까운 순)
+
+    영역이 영역 스캔으로 완전 수집되지 않았거나 MIRROR_MAX_AGE보다 오래됐으면 None
+    → 호출 측에서 카카오 검색으로 대체 (`is not None`으로 확인)
+    커버된 영역에 조건에 맞는 매장이 없으면 [] (그대로 빈 결과로 응답)
+    """
+    if not config.MIRROR_ENABLED:
+        return None
+    if not mirror.covers(bbox_around(lat, lng, radius), category_code, config.MIRROR_MAX_AGE):
+        _mirror_counters["stale"] += 1
+        return None
+    places = mirror.query_radius(lat, lng, radius, category_code, keywords)
+    _mirror_counters["served" if places else "empty"] += 1
+    return places
+
+
+def mirror_stats() -> dict:
+    """로컬 미러 통계 (로컬 응답 수, 커버리지 부족으로 카카오 호출한 수 등)"""
+    return {**mirror.stats(), **_mirror_counters}
+
+
+def search_cache_stats() -> dict:
+    """검색 캐시 통계 (hit/miss 등)"""
+    return _search_cache.stats()
+
+
+def image_cache_stats() -> dict:
+    """og:image 캐시 통계 (hit/miss/eviction, 메모리)"""
+    return _image_cache.stats()
+
+
+def info_cache_stats() -> dict:
+    """영업정보 캐시 통계"""
+    return {**_info_cache.stats(), "schedules": len(_schedule_cache)}
+
+
+def place_index_stats() -> dict:
+    """매장 ID 인덱스 통계"""
+    return place_index.stats()
+
+
+def singleflight_stats() -> dict:
+    """업스트림 요청 합치기 통계 (합쳐진 호출 수 등)"""
+    return _flight.stats()
+
+
+# 좌표 → 지역 캐시 (geohash 격자 단위)
+_region_cache = TTLCache(
+    maxsize=config.REGION_CACHE_MAX_ENTRIES,
+    ttl=config.REGION_CACHE_TTL,
+)
+# 동 중심점 인덱스 (업스트림 장애/쿼터 소진 시 fallback)
+_region_index = RegionIndex()
+for _name, _coords in LOCATION_COORDS.items():
+    _region_index.add(
+        _coords["lat"],
+        _coords["lng"],
+        {
+            "region_1depth": "서울특별시",
+            "region_2depth": f"{_name}구",
+            "region_3depth": f"{_name}동",
+            "display_name": f"{_name}",
+        },
+        seed=True,
+    )
+_region_counters = {"upstream": 0, "fallback": 0}
+
+_DEFAULT_REGION = {
+    "region_1depth": "서울특별시",
+    "region_2depth": "강남구",
+    "region_3depth": "역삼동",
+    "display_name": "강남구 역삼동",
+}
+
+
+def _fallback_region(lat: float, lng: float) -> dict:
+    """로컬 인덱스에서 가장 가까운 동 (없으면 기본 지역)"""
+    _region_counters["fallback"] += 1
+    return _region_index.nearest(lat, lng, config.REGION_FALLBACK_MAX_M) or dict(_DEFAULT_REGION)
+
+
 async def coord2region(lat: float, lng: float) -> dict | None:
     """좌표 → 지역명 변환
 
     Returns:
         {"region_1depth": "서울특별시", "region_2depth": "강남구", "region_3depth": "역삼동", "display_name": "강남구 역삼동"}
     """
-    def _mock_region(lat: float, lng: float) -> dict:
-        """좌표로 대략적 지역 추정 (목업)"""
-        for name, coords in LOCATION_COORDS.items():
-            if abs(lat - coords["lat"]) < 0.02 and abs(lng - coords["lng"]) < 0.02:
-                return {
-                    "region_1depth": "서울특별시",
-                    "region_2depth": f"{name}구",
-                    "region_3depth": f"{name}동",
-                    "display_name": f"{name}",
+    if not os.getenv("KAKAO_REST_API_KEY"):
+        return _fallback_region(lat, lng)
+
+    cell = geohash_encode(lat, lng, config.REGION_GEOHASH_PRECISION)
+    cached = _region_cache.get(cell)
+    if cached is not None:
+        return dict(cached)
+
+    region = await _flight.do(("region", cell), lambda: _fetch_region(lat, lng, cell))
+    return dict(region) if region else _fallback_region(lat, lng)
+
+
+async def _fetch_region(lat: float, lng: float, cell: str) -> dict | None:
+    try:
+        response = await _get(
+            KAKAO_COORD2REGION_URL,
+            endpoint="coord2region",
+            headers=_kakao_auth_headers(),
+            params={"x": str(lng), "y": str(lat)},
+            timeout=SEARCH_TIMEOUT,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            documents = data.get("documents", [])
+            region = None
+            for doc in documents:
+                if doc.get("region_type") == "H":
+                    region = doc
+                    break
+            if not region and documents:
+                region = documents[0]
+
+            if region:
+                r1 = region.get("region_1depth_name", "")
+                r2 = region.get("region_2depth_name", "")
+                r3 = region.get("region_3depth_name", "")
+                result = {
+                    "region_1depth": r1,
+                    "region_2depth": r2,
+                    "region_3depth": r3,
+                    "display_name": f"{r2} {r3}".strip(),
                 }
-        return {
-            "region_1depth": "서울특별시",
-            "region_2depth": "강남구",
-            "region_3depth": "역삼동",
-            "display_name": "강남구 역삼동",
-        }
+                _region_counters["upstream"] += 1
+                _region_cache.set(cell, result)
+                _region_index.add(lat, lng, result)
+                return result
+        else:
+            print(f"Kakao coord2region API error: {response.status_code}")
+    except Exception as e:
+        print(f"Kakao coord2region API error: {e}")
 
-    if not os.getenv("KAKAO_REST_API_KEY"):
-        return _mock_region(lat, lng)
+    return None
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                KAKAO_COORD2REGION_URL,
-                headers={"Authorization": f"KakaoAK {os.getenv('KAKAO_REST_API_KEY')}"},
-                params={"x": str(lng), "y": str(lat)},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                documents = data.get("documents", [])
-                region = None
-                for doc in documents:
-                    if doc.get("region_type") == "H":
-                        region = doc
-                        break
-                if not region and documents:
-                    region = documents[0]
-
-                if region:
-                    r1 = region.get("region_1depth_name", "")
-                    r2 = region.get("region_2depth_name", "")
-                    r3 = region.get("region_3depth_name", "")
-                    return {
-                        "region_1depth": r1,
-                        "region_2depth": r2,
-                        "region_3depth": r3,
-                        "display_name": f"{r2} {r3}".strip(),
-                    }
-            else:
-                print(f"Kakao coord2region API error: {response.status_code}")
-        except Exception as e:
-            print(f"Kakao coord2region API error: {e}")
 
-    return _mock_region(lat, lng)
+def region_stats() -> dict:
+    """좌표 → 지역 변환 캐시/인덱스 통계"""
+    return {
+        **_region_cache.stats(),
+        **_region_counters,
+        "indexed_regions": len(_region_index),
+    }
 
 
 def _mask_name(name: str) -> str:
@@ -288,66 +830,297 @@ def _mask_name(name: str) -> str:
     return name[0] + "*" * (len(name) - 2) + name[-1]
 
 
+async def get_place(place_id: str, lat: float | None = None, lng: float | None = None) -> dict | None:
+    """place_id로 매장 조회 (검색 결과로 쌓인 인덱스에서, 업스트림 호출 없음)
+
+    좌표가 있으면 해당 좌표 기준 distance를 계산, 없으면 0
+    """
+    record = await place_index.get(place_id)
+    if record is None:
+        return None
+    record["distance"] = (
+        haversine_m(lat, lng, record["lat"], record["lng"])
+        if lat is not None and lng is not None
+        else 0
+    )
+    return record
+
+
+# 리뷰 캐시 (place_id -> (결과, 가져온 시각 epoch)) — stale-while-revalidate
+# soft TTL이 지나면 캐시를 그대로 주고 백그라운드 갱신, hard TTL이 지나면 만료
+_review_cache = TTLCache(
+    maxsize=config.REVIEW_CACHE_MAX_ENTRIES,
+    ttl=config.REVIEW_CACHE_HARD_TTL,
+    max_bytes=config.REVIEW_CACHE_MAX_BYTES,
+)
+# 진행 중인 백그라운드 갱신 (place_id -> Task)
+_review_refreshes: dict[str, asyncio.Task] = {}
+_review_counters = {"fresh_hits": 0, "stale_hits": 0, "refreshed": 0, "refresh_failed": 0, "refresh_skipped": 0}
+
+
+def _cache_reviews(place_id: str, result: dict, fetched_at: float) -> None:
+    """가져온 시각 기준으로 hard TTL까지만 캐시"""
+    ttl = config.REVIEW_CACHE_HARD_TTL - (time.time() - fetched_at)
+    _review_cache.set(place_id, (result, fetched_at), ttl=ttl)
+
+
+def _refresh_reviews_later(place_id: str) -> None:
+    """soft TTL이 지난 리뷰를 백그라운드로 갱신 (동시 갱신 수 제한, 넘으면 다음 요청 때 다시 시도)"""
+    if place_id in _review_refreshes:
+        return
+    if len(_review_refreshes) >= config.REVIEW_REFRESH_CONCURRENCY:
+        _review_counters["refresh_skipped"] += 1
+        return
+
+    async def _refresh() -> None:
+        with outbound_priority(Priority.BACKGROUND):
+            result = await _fetch_reviews_upstream(place_id)
+        _review_counters["refreshed" if result is not None else "refresh_failed"] += 1
+
+    task = asyncio.create_task(_refresh())
+    _review_refreshes[place_id] = task
+    task.add_done_callback(lambda _: _review_refreshes.pop(place_id, None))
+
+
+def cached_rating(place_id: str) -> float | None:
+    """캐시된 리뷰의 평균 평점 (캐시에 없으면 None, 업스트림 호출·통계 반영 없음)"""
+    entry = _review_cache.peek(place_id)
+    if entry is None:
+        return None
+    return entry[0].get("avg_score", 0.0)
+
+
+async def review_stats(place_ids: list[str]) -> dict[str, dict]:
+    """매장별 리뷰 집계 일괄 조회 (리뷰 캐시와 같은 stale-while-revalidate)
+
+    soft TTL이 지난 집계 행은 그대로 쓰고 백그라운드로 갱신, hard TTL이 지난 행은 없는 것으로 취급
+
+    Returns:
+        {place_id: {"avg_score": float, "total_count": int, "stale": bool}}
+    """
+    stats = await review_store.load_stats(place_ids)
+    for place_id, row in stats.items():
+        if not row["stale"]:
+            continue
+        # 리뷰 캐시가 더 최신이면 그 평점 사용 (집계 행 저장이 꺼져 있어도 매번 갱신하지 않도록)
+        entry = _review_cache.peek(place_id)
+        if entry is not None and time.time() - entry[1] <= config.REVIEW_CACHE_SOFT_TTL:
+            row.update(avg_score=entry[0].get("avg_score", 0.0), total_count=entry[0].get("total_count", 0), stale=False)
+        else:
+            _refresh_reviews_later(place_id)
+    return stats
+
+
 async def fetch_place_reviews(place_id: str) -> dict:
     """카카오 플레이스에서 리뷰 데이터 가져오기
 
+    캐시가 soft TTL을 넘었으면 캐시를 바로 반환하고 백그라운드로 갱신
+
     Returns:
         {"reviews": [...], "total_count": int, "avg_score": float}
     """
     if place_id.startswith("mock_"):
         return {"reviews": [], "total_count": 0, "avg_score": 0}
 
+    entry = _review_cache.get(place_id)
+    if entry is not None:
+        result, fetched_at = entry
+        if time.time() - fetched_at > config.REVIEW_CACHE_SOFT_TTL:
+            _review_counters["stale_hits"] += 1
+            _refresh_reviews_later(place_id)
+        else:
+            _review_counters["fresh_hits"] += 1
+        return result
+
+    return await _flight.do(("reviews", place_id), lambda: _fetch_place_reviews(place_id))
+
+
+async def _fetch_place_reviews(place_id: str) -> dict:
+    stored = None
+    entry = await place_store.load_entry(place_id, "reviews")
+    if entry is not None:
+        stored, updated_at = entry
+        fetched_at = updated_at.replace(tzinfo=timezone.utc).timestamp()
+        age = time.time() - fetched_at
+        # hard TTL 안이면 저장본으로 바로 응답 (soft TTL 지났으면 백그라운드 갱신)
+        if age <= config.REVIEW_CACHE_HARD_TTL:
+            _cache_reviews(place_id, stored, fetched_at)
+            if age > config.REVIEW_CACHE_SOFT_TTL:
+                _refresh_reviews_later(place_id)
+            return stored
+
+    result = await _fetch_reviews_upstream(place_id)
+    if result is None:
+        # 업스트림 실패 시 hard TTL을 넘긴 저장본이라도 빈 결과보다 나음
+        return stored or {"reviews": [], "total_count": 0, "avg_score": 0}
+    return result
+
+
+async def _fetch_reviews_upstream(place_id: str) -> dict | None:
+    """리뷰 첫 페이지 조회 후 캐시/저장 (실패 시 None — 기존 캐시 유지)"""
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"https://place.map.kakao.com/main/v/{place_id}",
-                headers={
-                    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15",
-                    "Referer": f"https://place.map.kakao.com/m/{place_id}",
-                },
-                timeout=5.0,
-                follow_redirects=True,
-            )
-            if resp.status_code != 200:
-                return {"reviews": [], "total_count": 0, "avg_score": 0}
-
-            data = resp.json()
-
-            # comment 섹션에서 리뷰 추출
-            comment = data.get("comment") or {}
-            comment_list = comment.get("list") or []
-            score_cnt = comment.get("scorecnt", 0)
-            score_sum = comment.get("scoresum", 0)
-            avg_score = round(score_sum / score_cnt, 1) if score_cnt > 0 else 0
-
-            reviews = []
-            for item in comment_list:
-                # 사진 URL 추출
-                photos = []
-                for photo in (item.get("photoList") or []):
-                    url = photo.get("url") or photo.get("photoUrl") or ""
-                    if url:
-                        if url.startswith("//"):
-                            url = "https:" + url
-                        photos.append(url)
-
-                reviews.append({
-                    "username": _mask_name(item.get("username", "익명")),
-                    "point": item.get("point", 0),
-                    "date": item.get("date", ""),
-                    "contents": item.get("contents", ""),
-                    "photos": photos,
-                })
+        resp = await _get(
+            f"{config.KAKAO_PLACE_BASE_URL}/main/v/{place_id}",
+            endpoint="place_reviews",
+            headers={
+                "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15",
+                "Referer": f"https://place.map.kakao.com/m/{place_id}",
+            },
+            timeout=PLACE_TIMEOUT,
+            follow_redirects=True,
+        )
+        if resp.status_code != 200:
+            return None
 
-            return {
-                "reviews": reviews,
-                "total_count": score_cnt or len(reviews),
-                "avg_score": avg_score,
-            }
+        data = resp.json()
+
+        # comment 섹션에서 리뷰 추출
+        comment = data.get("comment") or {}
+        comment_list = comment.get("list") or []
+        score_cnt = comment.get("scorecnt", 0)
+        score_sum = comment.get("scoresum", 0)
+        avg_score = round(score_sum / score_cnt, 1) if score_cnt > 0 else 0
+
+        reviews = []
+        for item in comment_list:
+            # 사진 URL 추출
+            photos = []
+            for photo in (item.get("photoList") or []):
+                url = photo.get("url") or photo.get("photoUrl") or ""
+                if url:
+                    if url.startswith("//"):
+                        url = "https:" + url
+                    photos.append(url)
+
+            reviews.append({
+                "username": _mask_name(item.get("username", "익명")),
+                "point": item.get("point", 0),
+                "date": item.get("date", ""),
+                "contents": item.get("contents", ""),
+                "photos": photos,
+            })
+
+        result = {
+            "reviews": reviews,
+            "total_count": score_cnt or len(reviews),
+            "avg_score": avg_score,
+        }
+        _cache_reviews(place_id, result, time.time())
+        place_store.save(place_id, "reviews", result)
+        if config.PLACE_STORE_ENABLED:
+            place_store.submit(review_store.record_page_sync, place_id, comment_list, score_cnt, score_sum)
+        return result
 
     except Exception as e:
         print(f"Kakao place reviews error: {e}")
-        return {"reviews": [], "total_count": 0, "avg_score": 0}
+        return None
+
+
+async def fetch_comment_page(
+    place_id: str,
+    after_id: str | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> tuple[int, dict, dict] | None:
+    """리뷰 원본 페이지 조회 (증분 동기화용, 캐시 안 거침)
+
+    after_id가 없으면 첫 페이지(main), 있으면 그 리뷰 다음 페이지(commentlist)
+    etag/last_modified를 주면 조건부 요청 — 변경 없으면 상태 304
+
+    Returns:
+        (상태 코드, comment 섹션, 응답 검증자 {"etag", "last_modified"}) / 실패 시 None
+    """
+    if after_id is None:
+        url = f"{config.KAKAO_PLACE_BASE_URL}/main/v/{place_id}"
+    else:
+        url = f"{config.KAKAO_PLACE_BASE_URL}/commentlist/v/{place_id}/{after_id}"
+    headers = {
+        "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15",
+        "Referer": f"https://place.map.kakao.com/m/{place_id}",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        resp = await _get(
+            url,
+            endpoint="place_reviews",
+            headers=headers,
+            timeout=PLACE_TIMEOUT,
+            follow_redirects=True,
+        )
+        validators = {
+            "etag": resp.headers.get("etag"),
+            "last_modified": resp.headers.get("last-modified"),
+        }
+        if resp.status_code == 304:
+            return 304, {}, validators
+        if resp.status_code != 200:
+            return None
+        return 200, resp.json().get("comment") or {}, validators
+    except Exception as e:
+        print(f"Kakao comment page error: {e}")
+        return None
+
+
+def review_cache_stats() -> dict:
+    """리뷰 캐시 통계 (soft TTL 전/후 hit, 백그라운드 갱신 수)"""
+    return {**_review_cache.stats(), **_review_counters, "refreshing": len(_review_refreshes)}
+
+
+# 영업정보 캐시 (다음 영업 상태 변화 시각 또는 자정까지 유효)
+_info_cache = TTLCache(
+    maxsize=config.INFO_CACHE_MAX_ENTRIES,
+    ttl=config.INFO_CACHE_MAX_TTL,
+    negative_ttl=config.INFO_CACHE_NEGATIVE_TTL,
+)
+# 요일별 영업 구간 (place_id -> WeeklySchedule) — "지금 영업 중?" 로컬 계산용
+_schedule_cache = TTLCache(
+    maxsize=config.INFO_CACHE_MAX_ENTRIES,
+    ttl=config.SCHEDULE_CACHE_TTL,
+)
+
+
+def _info_expires_at(schedule, fetched_at: datetime) -> datetime:
+    """영업정보 유효 시각: 다음 상태 변화, 최대 TTL, 다음 자정(KST) 중 가장 이른 때
+
+    hours의 today 표시와 "내일 11:00 오픈" 같은 상태 문구는 날짜 기준이라 자정이 지나면 틀려짐
+    """
+    if schedule is not None:
+        expires_at = fetched_at + timedelta(seconds=config.INFO_CACHE_MAX_TTL)
+        transition = next_transition(schedule, fetched_at)
+        if transition is not None:
+            expires_at = min(expires_at, transition)
+    else:
+        expires_at = fetched_at + timedelta(seconds=config.INFO_CACHE_UNSCHEDULED_TTL)
+    midnight = (fetched_at.astimezone(KST) + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return min(expires_at, midnight)
+
+
+def _cache_info(place_id: str, info: dict, fetched_at: datetime) -> bool:
+    """영업정보를 다음 상태 변화 시각(또는 자정)까지 캐시 (이미 만료된 정보면 False)"""
+    schedule = parse_weekly_schedule(info.get("hours") or [])
+    if schedule is not None:
+        _schedule_cache.set(place_id, schedule)
+    expires_at = _info_expires_at(schedule, fetched_at)
+
+    ttl = (expires_at - datetime.now(KST)).total_seconds()
+    if ttl <= 0:
+        return False
+    negative = not info.get("status") and not info.get("hours")
+    if negative:
+        ttl = min(ttl, config.INFO_CACHE_NEGATIVE_TTL)
+    _info_cache.set(place_id, info, negative=negative, ttl=ttl)
+    return True
+
+
+def is_place_open(place_id: str, now: datetime | None = None) -> bool | None:
+    """캐시된 영업시간으로 영업 중 여부 계산 (정보 없으면 None, 업스트림 호출 없음)"""
+    schedule = _schedule_cache.get(place_id)
+    if schedule is None:
+        return None
+    return is_open_at(schedule, now or datetime.now(KST))
 
 
 async def fetch_place_info(place_id: str) -> dict:
@@ -356,121 +1129,192 @@ async def fetch_place_info(place_id: str) -> dict:
     Returns:
         {"status": str, "status_desc": str, "hours": [...], "homepage": str}
     """
+    if place_id.startswith("mock_"):
+        return {"status": "", "status_desc": "", "hours": [], "homepage": ""}
+
+    cached = _info_cache.get(place_id)
+    if cached is not None:
+        return cached
+
+    return await _flight.do(("info", place_id), lambda: _fetch_place_info(place_id))
+
+
+async def _fetch_place_info(place_id: str) -> dict:
     empty = {"status": "", "status_desc": "", "hours": [], "homepage": ""}
 
-    if place_id.startswith("mock_"):
-        return empty
+    # 저장된 정보는 저장 이후 영업 상태가 바뀌지 않았을 때만 사용
+    entry = await place_store.load_entry(place_id, "info")
+    if entry is not None:
+        stored, updated_at = entry
+        if _cache_info(place_id, stored, updated_at.replace(tzinfo=timezone.utc)):
+            return stored
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"https://place-api.map.kakao.com/places/panel3/{place_id}",
-                headers={
-                    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15",
-                    "Origin": "https://place.map.kakao.com",
-                    "Referer": f"https://place.map.kakao.com/{place_id}",
-                    "appVersion": "6.6.0",
-                    "pf": "MW",
-                },
-                timeout=5.0,
-                follow_redirects=True,
-            )
-            if resp.status_code != 200:
-                return empty
-
-            data = resp.json()
-
-            # 영업 상태
-            open_hours = data.get("open_hours") or {}
-            headline = open_hours.get("headline") or {}
-            status = headline.get("display_text", "")
-            status_desc = headline.get("display_text_info", "")
-
-            # 주간 영업시간
-            hours = []
-            week = open_hours.get("week_from_today") or {}
-            for period in (week.get("week_periods") or []):
-                for day in (period.get("days") or []):
-                    label = day.get("day_of_the_week_desc", "")
-                    on = day.get("on_days")
-                    if on:
-                        time_str = on.get("start_end_time_desc", "")
-                        breaks = on.get("break_times_desc") or []
-                        hours.append({
-                            "day": label,
-                            "time": time_str,
-                            "break_time": breaks[0] if breaks else "",
-                            "off": False,
-                            "today": day.get("is_highlight", False),
-                        })
-                    else:
-                        hours.append({
-                            "day": label,
-                            "time": day.get("off_days_desc", "휴무일"),
-                            "break_time": "",
-                            "off": True,
-                            "today": day.get("is_highlight", False),
-                        })
-
-            # 홈페이지
-            summary = data.get("summary") or {}
-            homepages = summary.get("homepages") or []
-            homepage = homepages[0] if homepages else ""
+        resp = await _get(
+            f"{config.KAKAO_PLACE_API_BASE_URL}/places/panel3/{place_id}",
+            endpoint="place_info",
+            headers={
+                "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15",
+                "Origin": "https://place.map.kakao.com",
+                "Referer": f"https://place.map.kakao.com/{place_id}",
+                "appVersion": "6.6.0",
+                "pf": "MW",
+            },
+            timeout=PLACE_TIMEOUT,
+            follow_redirects=True,
+        )
+        if resp.status_code != 200:
+            return empty
 
-            return {
-                "status": status,
-                "status_desc": status_desc,
-                "hours": hours,
-                "homepage": homepage,
-            }
+        data = resp.json()
+
+        # 영업 상태
+        open_hours = data.get("open_hours") or {}
+        headline = open_hours.get("headline") or {}
+        status = headline.get("display_text", "")
+        status_desc = headline.get("display_text_info", "")
+
+        # 주간 영업시간
+        hours = []
+        week = open_hours.get("week_from_today") or {}
+        for period in (week.get("week_periods") or []):
+            for day in (period.get("days") or []):
+                label = day.get("day_of_the_week_desc", "")
+                on = day.get("on_days")
+                if on:
+                    time_str = on.get("start_end_time_desc", "")
+                    breaks = on.get("break_times_desc") or []
+                    hours.append({
+                        "day": label,
+                        "time": time_str,
+                        "break_time": breaks[0] if breaks else "",
+                        "off": False,
+                        "today": day.get("is_highlight", False),
+                    })
+                else:
+                    hours.append({
+                        "day": label,
+                        "time": day.get("off_days_desc", "휴무일"),
+                        "break_time": "",
+                        "off": True,
+                        "today": day.get("is_highlight", False),
+                    })
+
+        # 홈페이지
+        summary = data.get("summary") or {}
+        homepages = summary.get("homepages") or []
+        homepage = homepages[0] if homepages else ""
+
+        result = {
+            "status": status,
+            "status_desc": status_desc,
+            "hours": hours,
+            "homepage": homepage,
+        }
+        _cache_info(place_id, result, datetime.now(KST))
+        place_store.save(place_id, "info", result)
+        return result
 
     except Exception as e:
         print(f"Kakao place info error: {e}")
         return empty
 
 
-# og:image 캐시 (place_id -> image_url)
-_image_cache: dict[str, str] = {}
+# og:image 캐시 (place_id -> image_url, 실패는 ""로 짧게 저장)
+_image_cache = TTLCache(
+    maxsize=config.IMAGE_CACHE_MAX_ENTRIES,
+    ttl=config.IMAGE_CACHE_TTL,
+    negative_ttl=config.IMAGE_CACHE_NEGATIVE_TTL,
+    max_bytes=config.IMAGE_CACHE_MAX_BYTES,
+)
 
 
 async def fetch_place_image(place_id: str) -> str:
     """카카오 플레이스 페이지에서 og:image 추출"""
-    if place_id in _image_cache:
-        return _image_cache[place_id]
+    cached = _image_cache.get(place_id)
+    if cached is not None:
+        return cached
 
     if place_id.startswith("mock_"):
         return ""
 
+    return await _flight.do(("image", place_id), lambda: _fetch_place_image(place_id))
+
+
+_OG_IMAGE_RE = re.compile(rb'og:image["\s]+content="([^"]+)"')
+_HEAD_END_RE = re.compile(rb"</head\s*>", re.IGNORECASE)
+# 청크 경계에 걸친 태그를 놓치지 않도록 이전 청크 끝부분을 남겨둠
+_SCAN_OVERLAP = 512
+
+
+async def _scan_og_image(response: httpx.Response) -> str:
+    """응답 본문을 청크 단위로 읽으며 og:image 탐색
+
+    찾거나 </head>에 도달하면 즉시 중단 (나머지 본문은 받지 않음)
+    """
+    buffer = b""
+    scanned = 0
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        scanned += len(chunk)
+        match = _OG_IMAGE_RE.search(buffer)
+        if match:
+            return match.group(1).decode("utf-8", "ignore")
+        if _HEAD_END_RE.search(buffer) or scanned >= config.IMAGE_SCAN_MAX_BYTES:
+            return ""
+        buffer = buffer[-_SCAN_OVERLAP:]
+    return ""
+
+
+async def _fetch_place_image(place_id: str) -> str:
+    stored = await place_store.load(place_id, "image")
+    if stored:
+        _image_cache.set(place_id, stored)
+        return stored
+
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"https://place.map.kakao.com/{place_id}",
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=3.0,
-                follow_redirects=True,
-            )
-            if resp.status_code == 200:
-                match = re.search(r'og:image["\s]+content="([^"]+)"', resp.text)
-                if match:
-                    url = match.group(1)
-                    if url.startswith("//"):
-                        url = "https:" + url
-                    _image_cache[place_id] = url
-                    return url
+        async with _stream(
+            f"{config.KAKAO_PLACE_BASE_URL}/{place_id}",
+            endpoint="place_image",
+            headers={"User-Agent": "Mozilla/5.0"},
+            timeout=PLACE_IMAGE_TIMEOUT,
+            follow_redirects=True,
+        ) as resp:
+            url = await _scan_og_image(resp) if resp.status_code == 200 else ""
+        if url:
+            if url.startswith("//"):
+                url = "https:" + url
+            _image_cache.set(place_id, url)
+            place_store.save(place_id, "image", url)
+            return url
+    except (CircuitOpenError, BudgetExceededError):
+        # 일시적으로 건너뛴 것이므로 실패로 캐시하지 않음
+        return ""
     except Exception:
         pass
 
-    _image_cache[place_id] = ""
+    _image_cache.set(place_id, "", negative=True)
     return ""
 
 
 async def fetch_place_images(place_ids: list[str]) -> dict[str, str]:
-    """여러 place_id의 og:image를 병렬로 추출"""
+    """여러 place_id의 og:image를 병렬로 추출 (중복 제거, 동시 요청 수 제한)"""
+    unique_ids = list(dict.fromkeys(place_ids))
+    sem = asyncio.Semaphore(config.IMAGE_BATCH_CONCURRENCY)
+
+    async def _one(pid: str) -> str:
+        # 캐시 hit은 세마포어 없이 바로 반환
+        cached = _image_cache.get(pid)
+        if cached is not None:
+            return cached
+        async with sem:
+            return await fetch_place_image(pid)
+
     results = await asyncio.gather(
-        *[fetch_place_image(pid) for pid in place_ids],
+        *[_one(pid) for pid in unique_ids],
         return_exceptions=True,
     )
     return {
         pid: (url if isinstance(url, str) else "")
-        for pid, url in zip(place_ids, results)
+        for pid, url in zip(unique_ids, results)
     }
@@ -0,0 +1,168 @@
+"""리뷰 키워드 추출 배치 (PRD BE-02)
+
+reviews 테이블의 미처리 리뷰(keywords가 NULL)를 청크 단위로 읽어
+형태소 분석 → 불용어 제거 → 대표 키워드 카운팅 → restaurant_keywords에 누적
+
+- 청크: ID 순으로 KEYWORD_BATCH_CHUNK_SIZE건씩, 현재 청크를 분석하는 동안 다음 청크를 읽음
+- 분석: CPU 코어 수만큼 프로세스 풀 (프로세스마다 KoNLPy 분석기, 없으면 어절 단위)
+- 기록: 청크마다 리뷰별 keywords, 매장별 카운트(bulk upsert), 체크포인트를 한 트랜잭션으로 커밋
+  → 중간에 죽어도 이미 센 리뷰는 다시 세지 않음 (재실행 안전, 동시에 두 개 돌리지는 않음)
+- 처리 속도(reviews/s) 출력
+
+사용법 (매일 새벽 3시 cron, DATABASE_URL 환경변수 필요):
+    cd src && python -m restaurant.keyword_batch
+    cd src && python -m restaurant.keyword_batch --full   # 체크포인트 무시하고 처음부터 미처리분 보충
+"""
+
+import argparse
+import math
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from database.connection import SessionLocal, engine, init_db
+from database.models import BatchCheckpoint, RestaurantKeyword, Review
+
+from . import config
+from .keywords import analyzer_name, extract_many, init_analyzer
+
+CHECKPOINT_NAME = "review_keywords"
+
+
+def _load_checkpoint() -> int:
+    with SessionLocal() as db:
+        row = db.get(BatchCheckpoint, CHECKPOINT_NAME)
+        return row.last_id if row else 0
+
+
+def _read_chunk(after_id: int, limit: int) -> list[tuple[int, str, str]]:
+    """(리뷰 ID, place_id, 본문) — 미처리 리뷰만 ID 순"""
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Review.id, Review.place_id, Review.content)
+            .where(Review.id > after_id, Review.keywords.is_(None))
+            .order_by(Review.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in rows]
+
+
+def _upsert_counts(db, counts: Counter, now: datetime) -> None:
+    """매장별 키워드 카운트 누적 (PostgreSQL/SQLite는 ON CONFLICT 한 번에)"""
+    rows = [
+        {"restaurant_id": place_id, "keyword": keyword, "count": count, "updated_at": now}
+        for (place_id, keyword), count in counts.items()
+    ]
+    if not rows:
+        return
+    if engine.dialect.name in ("postgresql", "sqlite"):
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        table = RestaurantKeyword.__table__
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.restaurant_id, table.c.keyword],
+            set_={"count": table.c.count + stmt.excluded.count, "updated_at": stmt.excluded.updated_at},
+        )
+        db.execute(stmt, rows)
+        return
+    for row in rows:
+        existing = db.get(RestaurantKeyword, (row["restaurant_id"], row["keyword"]))
+        if existing is None:
+            db.add(RestaurantKeyword(**row))
+        else:
+            existing.count += row["count"]
+            existing.updated_at = now
+
+
+def _write_chunk(rows: list[tuple[int, str, str]], results: list[list[str]]) -> int:
+    """청크 결과 기록 + 체크포인트 전진 (한 트랜잭션, 갱신한 매장-키워드 수 반환)"""
+    now = datetime.utcnow()
+    counts: Counter = Counter()
+    for (_, place_id, _), found in zip(rows, results):
+        for keyword in found:
+            counts[(place_id, keyword)] += 1
+
+    with SessionLocal() as db:
+        db.execute(
+            update(Review),
+            [{"id": review_id, "keywords": found} for (review_id, _, _), found in zip(rows, results)],
+        )
+        _upsert_counts(db, counts, now)
+        checkpoint = db.get(BatchCheckpoint, CHECKPOINT_NAME)
+        if checkpoint is None:
+            checkpoint = BatchCheckpoint(name=CHECKPOINT_NAME, last_id=0, processed=0)
+            db.add(checkpoint)
+        checkpoint.last_id = max(checkpoint.last_id or 0, rows[-1][0])
+        checkpoint.processed = (checkpoint.processed or 0) + len(rows)
+        checkpoint.updated_at = now
+        db.commit()
+    return len(counts)
+
+
+def run(
+    chunk_size: int = config.KEYWORD_BATCH_CHUNK_SIZE,
+    workers: int = config.KEYWORD_BATCH_WORKERS,
+    full: bool = False,
+    use_konlpy: bool = True,
+) -> dict:
+    """미처리 리뷰를 모두 처리하고 요약 반환"""
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    processed = 0
+    pairs = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_analyzer, initargs=(use_konlpy,)) as pool:
+        analyzer = pool.submit(analyzer_name).result()
+        rows = _read_chunk(0 if full else _load_checkpoint(), chunk_size)
+        while rows:
+            texts = [content for _, _, content in rows]
+            # 워커당 여러 조각으로 나눠서 느린 조각 하나가 청크 전체를 붙잡지 않게
+            size = max(1, math.ceil(len(texts) / (workers * 4)))
+            futures = [pool.submit(extract_many, texts[i:i + size]) for i in range(0, len(texts), size)]
+            # 분석하는 동안 다음 청크 읽기
+            next_rows = _read_chunk(rows[-1][0], chunk_size)
+            results = [found for future in futures for found in future.result()]
+            pairs += _write_chunk(rows, results)
+
+            processed += len(rows)
+            elapsed = time.perf_counter() - started
+            print(f"  ~{rows[-1][0]}: {processed}건 ({processed / elapsed:.0f} reviews/s)")
+            rows = next_rows
+
+    elapsed = time.perf_counter() - started
+    return {
+        "processed": processed,
+        "keyword_updates": pairs,
+        "elapsed_sec": round(elapsed, 2),
+        "reviews_per_sec": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        "workers": workers,
+        "analyzer": analyzer,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 키워드 추출 배치 (PRD BE-02)")
+    parser.add_argument("--chunk-size", type=int, default=config.KEYWORD_BATCH_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=config.KEYWORD_BATCH_WORKERS, help="0이면 CPU 코어 수")
+    parser.add_argument("--full", action="store_true", help="체크포인트 무시하고 처음부터 미처리 리뷰를 찾음")
+    parser.add_argument("--no-konlpy", action="store_true", help="형태소 분석 없이 어절 단위로 처리")
+    args = parser.parse_args()
+
+    init_db()
+    summary = run(args.chunk_size, args.workers, args.full, not args.no_konlpy)
+    print(
+        f"✅ 키워드 배치 완료: {summary['processed']}건 / {summary['elapsed_sec']}s "
+        f"→ {summary['reviews_per_sec']} reviews/s "
+        f"(워커 {summary['workers']}, 분석기 {summary['analyzer']}, 매장-키워드 갱신 {summary['keyword_updates']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
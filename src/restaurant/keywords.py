@@ -0,0 +1,116 @@
+"""리뷰 키워드 추출 (형태소 분석 + 대표 키워드 사전)
+
+리뷰 본문을 토큰으로 나누고 불용어를 뺀 뒤, 대표 키워드 사전(맵다/든든/깔끔/시원 …)의
+변형 표현과 맞춰서 리뷰별 언급 키워드를 셈
+
+- 형태소 분석: KoNLPy Okt (어간 추출) — konlpy 또는 JVM이 없으면 한글 어절 단위로 대체
+- 매칭: 토큰이 변형 표현으로 시작하면 해당 대표 키워드 ("매콤하다" → 맵다)
+- 부정: 바로 뒤 토큰이 "않-"이거나 바로 앞 토큰이 "안/못"이면 세지 않음 ("맵지 않아요")
+- 리뷰 하나에서 같은 키워드는 한 번만 셈 (한 리뷰가 도배해도 1회)
+"""
+
+import re
+
+# 대표 키워드 → 변형 표현 (토큰 접두어)
+LEXICON: dict[str, tuple[str, ...]] = {
+    "맵다": ("맵", "매운", "매워", "매콤", "매꼼"),
+    "얼큰": ("얼큰", "얼큼"),
+    "해장": ("해장",),
+    "국물": ("국물",),
+    "든든": ("든든",),
+    "푸짐": ("푸짐", "넉넉"),
+    "깔끔": ("깔끔", "깨끗"),
+    "시원": ("시원",),
+    "담백": ("담백",),
+    "뜨끈": ("뜨끈", "따끈", "뜨뜻", "따뜻"),
+    "가볍다": ("가볍", "가벼", "산뜻"),
+    "건강": ("건강",),
+    "신선": ("신선", "싱싱"),
+    "고소": ("고소",),
+    "달콤": ("달콤", "달달"),
+    "바삭": ("바삭",),
+    "부드럽다": ("부드럽", "부드러"),
+    "친절": ("친절",),
+    "가성비": ("가성비",),
+    "느끼": ("느끼",),
+}
+
+# 분석에서 빼는 토큰 (조사/부사/일반 동사/맛집 리뷰 상투어)
+STOPWORDS = frozenset({
+    "것", "수", "거", "곳", "집", "때", "저", "제", "이", "그", "좀", "더", "또", "다시",
+    "진짜", "정말", "너무", "완전", "그냥", "약간", "조금", "많이", "아주", "매우", "엄청",
+    "하다", "있다", "없다", "되다", "이다", "같다", "보다", "먹다", "가다", "오다", "주다",
+    "여기", "맛집", "음식", "메뉴", "가게", "사장", "사장님", "그리고", "근데", "하지만",
+    "요", "은", "는", "가", "을", "를", "에", "도", "만", "와", "과",
+})
+
+_NEGATORS = ("안", "못")
+_WORD_RE = re.compile(r"[가-힣]+")
+
+# 첫 글자 → (변형 표현, 대표 키워드) — 토큰마다 전체 사전을 훑지 않도록
+_BY_FIRST_CHAR: dict[str, list[tuple[str, str]]] = {}
+for _keyword, _variants in LEXICON.items():
+    for _variant in _variants:
+        _BY_FIRST_CHAR.setdefault(_variant[0], []).append((_variant, _keyword))
+
+# 프로세스별 형태소 분석기 (init_analyzer에서 설정, None이면 어절 단위)
+_okt = None
+
+
+def init_analyzer(use_konlpy: bool = True) -> bool:
+    """형태소 분석기 준비 (KoNLPy 사용 가능하면 True, 아니면 어절 단위로 대체)
+
+    배치의 프로세스 풀 initializer로도 쓰임 (JVM은 프로세스마다 따로 뜸)
+    """
+    global _okt
+    _okt = None
+    if not use_konlpy:
+        return False
+    try:
+        from konlpy.tag import Okt
+        _okt = Okt()
+    except Exception:
+        return False
+    return True
+
+
+def tokenize(text: str) -> list[str]:
+    """형태소 분석 토큰 (명사/형용사/동사 어간 + 부정 부사) — 분석기 없으면 한글 어절
+
+    Okt는 "안 맵다"의 "안"을 VerbPrefix로 붙이므로 품사와 상관없이 부정 부사는 남김
+    """
+    if _okt is not None:
+        return [
+            word for word, tag in _okt.pos(text, stem=True)
+            if tag in ("Noun", "Adjective", "Verb") or word in _NEGATORS
+        ]
+    return _WORD_RE.findall(text)
+
+
+def extract_keywords(text: str) -> list[str]:
+    """리뷰 한 건의 대표 키워드 목록 (중복 없음, 사전 순서)"""
+    tokens = tokenize(text)
+    found: set[str] = set()
+    for i, token in enumerate(tokens):
+        if token in STOPWORDS:
+            continue
+        for variant, keyword in _BY_FIRST_CHAR.get(token[0], ()):
+            if keyword in found or not token.startswith(variant):
+                continue
+            negated = (
+                (i + 1 < len(tokens) and tokens[i + 1].startswith("않"))
+                or (i > 0 and tokens[i - 1] in _NEGATORS)
+            )
+            if not negated:
+                found.add(keyword)
+    return [keyword for keyword in LEXICON if keyword in found]
+
+
+def extract_many(texts: list[str]) -> list[list[str]]:
+    """여러 리뷰 일괄 추출 (프로세스 풀 작업 단위)"""
+    return [extract_keywords(text) for text in texts]
+
+
+def analyzer_name() -> str:
+    """현재 프로세스의 분석 방식 ("konlpy" / "regex")"""
+    return "konlpy" if _okt is not None else "regex"
@@ -0,0 +1,211 @@
+"""로컬 매장 미러 (인메모리 공간 인덱스)
+
+검색 결과와 영역 스캐너(area_scanner) 수집 결과를 격자 버킷에 보관 →
+반경/사각형 + 카테고리/키워드 조회를 업스트림 호출 없이 처리
+
+- 격자: 약 500m 크기 위경도 버킷, 조회는 걸치는 버킷만 거리 계산
+- 커버리지: 스캐너가 빠짐없이 수집한 격자만 "완전"으로 표시 (카테고리 그룹별 수집 시각)
+  → 조회 영역의 모든 격자가 커버되고 MIRROR_MAX_AGE 이내일 때만 로컬 응답
+- 일반 검색 결과는 레코드만 갱신 (커버리지는 만들지 않음)
+"""
+
+import math
+import time
+from typing import Iterator
+
+from . import config
+from .geo import METERS_PER_DEG_LAT, bbox_around
+
+# 격자 버킷 크기 (도) — 위도 기준 약 550m
+_CELL_DEG = 0.005
+# 격자 경계에 맞춘 좌표의 부동소수점 오차 허용치 (격자 단위)
+_EPSILON = 1e-6
+
+# 레코드 관리용 필드 (조회 결과에서는 제외, search_text는 키워드 매칭용 정규화 문자열)
+_INTERNAL_FIELDS = ("category_group", "observed_at", "search_text")
+
+# (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+Rect = tuple[float, float, float, float]
+
+
+def _cell(lat: float, lng: float) -> tuple[int, int]:
+    return math.floor(lat / _CELL_DEG), math.floor(lng / _CELL_DEG)
+
+
+def _cells_touching(rect: Rect) -> list[tuple[int, int]]:
+    """사각형과 겹치는 모든 격자"""
+    min_lng, min_lat, max_lng, max_lat = rect
+    row0, col0 = _cell(min_lat, min_lng)
+    row1, col1 = _cell(max_lat, max_lng)
+    return [(r, c) for r in range(row0, row1 + 1) for c in range(col0, col1 + 1)]
+
+
+def _cells_inside(rect: Rect) -> list[tuple[int, int]]:
+    """사각형 안에 완전히 들어가는 격자 (align_to_cells 결과의 경계 격자도 포함)"""
+    min_lng, min_lat, max_lng, max_lat = rect
+    row0 = math.ceil(min_lat / _CELL_DEG - _EPSILON)
+    col0 = math.ceil(min_lng / _CELL_DEG - _EPSILON)
+    row1 = math.floor(max_lat / _CELL_DEG + _EPSILON)
+    col1 = math.floor(max_lng / _CELL_DEG + _EPSILON)
+    return [(r, c) for r in range(row0, row1) for c in range(col0, col1)]
+
+
+def align_to_cells(rect: Rect) -> Rect:
+    """사각형을 격자 경계까지 바깥쪽으로 넓힘 (스캔 결과가 격자 단위로 빠짐없이 커버되도록)"""
+    min_lng, min_lat, max_lng, max_lat = rect
+    return (
+        math.floor(min_lng / _CELL_DEG) * _CELL_DEG,
+        math.floor(min_lat / _CELL_DEG) * _CELL_DEG,
+        math.ceil(max_lng / _CELL_DEG) * _CELL_DEG,
+        math.ceil(max_lat / _CELL_DEG) * _CELL_DEG,
+    )
+
+
+def _normalize(text: str) -> str:
+    return "".join(text.split()).lower()
+
+
+class LocalMirror:
+    """매장 레코드 격자 인덱스 + 커버리지(수집 완료 격자) 관리"""
+
+    def __init__(self, max_entries: int = config.MIRROR_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # place_id -> 레코드 (distance 제외, category_group/observed_at 포함)
+        self._records: dict[str, dict] = {}
+        # 격자 -> place_id 집합
+        self._buckets: dict[tuple[int, int], set[str]] = {}
+        # (카테고리 그룹, 격자) -> 완전 수집 시각 (epoch 초)
+        self._coverage: dict[tuple[str, tuple[int, int]], float] = {}
+        self.dropped = 0   # 용량 초과로 받지 않은 레코드 수
+        self.removed = 0   # 재수집 때 사라진(폐업 등) 레코드 수
+        self.queries = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add_many(self, documents: list[dict], category_group: str) -> None:
+        """검색/수집 결과 반영 (같은 ID는 덮어씀)"""
+        now = time.time()
+        for doc in documents:
+            place_id = doc["id"]
+            old = self._records.get(place_id)
+            if old is None and len(self._records) >= self.max_entries:
+                self.dropped += 1
+                continue
+            record = {k: v for k, v in doc.items() if k not in ("distance", "image_url")}
+            record["category_group"] = category_group
+            record["observed_at"] = now
+            record["search_text"] = _normalize(record["name"] + " " + record.get("full_category", ""))
+            if old is not None:
+                self._buckets[_cell(old["lat"], old["lng"])].discard(place_id)
+            self._records[place_id] = record
+            self._buckets.setdefault(_cell(record["lat"], record["lng"]), set()).add(place_id)
+
+    def mark_covered(self, rect: Rect, category_group: str, since: float) -> None:
+        """rect 안을 빠짐없이 수집했음을 표시
+
+        since(수집 시작 시각) 이후 다시 보이지 않은 레코드는 사라진 매장으로 보고 제거
+        """
+        now = time.time()
+        for cell in _cells_inside(rect):
+            for place_id in list(self._buckets.get(cell, ())):
+                record = self._records[place_id]
+                if record["category_group"] == category_group and record["observed_at"] < since:
+                    self._buckets[cell].discard(place_id)
+                    del self._records[place_id]
+                    self.removed += 1
+            self._coverage[(category_group, cell)] = now
+
+    def covers(self, rect: Rect, category_group: str, max_age: float) -> bool:
+        """rect와 겹치는 모든 격자가 max_age 이내에 완전 수집됐는지"""
+        oldest = time.time() - max_age
+        return all(
+            self._coverage.get((category_group, cell), 0.0) >= oldest
+            for cell in _cells_touching(rect)
+        )
+
+    def _matches(self, record: dict, category_group: str | None, keywords: list[str]) -> bool:
+        if category_group is not None and record["category_group"] != category_group:
+            return False
+        if not keywords:
+            return True
+        return any(kw in record["search_text"] for kw in keywords)
+
+    def _candidates(
+        self,
+        rect: Rect,
+        category_group: str | None,
+        keywords: list[str] | None,
+    ) -> Iterator[dict]:
+        self.queries += 1
+        min_lng, min_lat, max_lng, max_lat = rect
+        kws = [_normalize(k) for k in keywords or ()]
+        for cell in _cells_touching(rect):
+            for place_id in self._buckets.get(cell, ()):
+                record = self._records[place_id]
+                if (
+                    min_lat <= record["lat"] <= max_lat
+                    and min_lng <= record["lng"] <= max_lng
+                    and self._matches(record, category_group, kws)
+                ):
+                    yield record
+
+    @staticmethod
+    def _public(record: dict) -> dict:
+        public = record.copy()
+        for key in _INTERNAL_FIELDS:
+            del public[key]
+        return public
+
+    def query_rect(
+        self,
+        rect: Rect,
+        category_group: str | None = None,
+        keywords: list[str] | None = None,
+    ) -> list[dict]:
+        """사각형 안의 매장 (복사본, distance 없음)"""
+        return [self._public(r) for r in self._candidates(rect, category_group, keywords)]
+
+    def query_radius(
+        self,
+        lat: float,
+        lng: float,
+        radius: int,
+        category_group: str | None = None,
+        keywords: list[str] | None = None,
+    ) -> list[dict]:
+        """반경 안의 매장 (복사본, 거리 계산 후 가까운 순)
+
+        거리는 등장방형 근사 (수 km 반경에서 haversine과 수 m 이내 차이)
+        """
+        ky = METERS_PER_DEG_LAT
+        kx = METERS_PER_DEG_LAT * math.cos(math.radians(lat))
+        limit = radius * radius
+        hits = []
+        for record in self._candidates(bbox_around(lat, lng, radius), category_group, keywords):
+            dy = (record["lat"] - lat) * ky
+            dx = (record["lng"] - lng) * kx
+            d2 = dx * dx + dy * dy
+            if d2 <= limit:
+                hits.append((d2, record))
+        hits.sort(key=lambda h: h[0])
+        return [
+            {**self._public(record), "distance": int(round(math.sqrt(d2)))}
+            for d2, record in hits
+        ]
+
+    def stats(self) -> dict:
+        now = time.time()
+        fresh = sum(1 for t in self._coverage.values() if now - t <= config.MIRROR_MAX_AGE)
+        return {
+            "places": len(self._records),
+            "max_entries": self.max_entries,
+            "covered_cells": len(self._coverage),
+            "fresh_cells": fresh,
+            "queries": self.queries,
+            "dropped": self.dropped,
+            "removed": self.removed,
+        }
+
+
+mirror = LocalMirror()
@@ -0,0 +1,131 @@
+"""영업시간 파싱 및 영업 상태 계산
+
+fetch_place_info의 hours 목록을 요일별 영업 구간으로 압축해서,
+"지금 영업 중?"과 "다음 상태 변화 시각"을 추가 요청 없이 계산
+"""
+
+import re
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+KST = ZoneInfo("Asia/Seoul")
+
+_WEEKDAYS = "월화수목금토일"
+_DAY_MINUTES = 24 * 60
+_WEEK_MINUTES = 7 * _DAY_MINUTES
+_TIME_RANGE_RE = re.compile(r"(\d{1,2}):(\d{2})\s*~\s*(\d{1,2}):(\d{2})")
+
+# 요일(0=월 ~ 6=일)별 영업 구간 [(시작 분, 종료 분), ...]
+# 종료가 자정을 넘기면 1440 이상, 휴무일은 빈 목록, 정보 없음은 None
+WeeklySchedule = tuple[tuple[tuple[int, int], ...] | None, ...]
+
+
+def _parse_range(text: str) -> tuple[int, int] | None:
+    match = _TIME_RANGE_RE.search(text or "")
+    if not match:
+        return None
+    h1, m1, h2, m2 = (int(g) for g in match.groups())
+    start, end = h1 * 60 + m1, h2 * 60 + m2
+    if end <= start:
+        end += _DAY_MINUTES  # 자정 넘어 영업 (예: 17:00 ~ 02:00)
+    return start, end
+
+
+def _subtract(span: tuple[int, int], cut: tuple[int, int]) -> list[tuple[int, int]]:
+    start, end = span
+    b_start, b_end = cut
+    if b_end <= start or b_start >= end:
+        return [span]
+    parts = []
+    if b_start > start:
+        parts.append((start, b_start))
+    if b_end < end:
+        parts.append((b_end, end))
+    return parts
+
+
+def parse_weekly_schedule(hours: list[dict]) -> WeeklySchedule | None:
+    """fetch_place_info의 hours → 요일별 영업 구간 (파싱 가능한 요일이 없으면 None)"""
+    days: list[tuple[tuple[int, int], ...] | None] = [None] * 7
+    parsed_any = False
+    for item in hours:
+        label = item.get("day", "")
+        if not label or label[0] not in _WEEKDAYS:
+            continue
+        weekday = _WEEKDAYS.index(label[0])
+        if item.get("off"):
+            days[weekday] = ()
+            parsed_any = True
+            continue
+        time_text = item.get("time", "")
+        if "24시간" in time_text:
+            span = (0, _DAY_MINUTES)
+        else:
+            span = _parse_range(time_text)
+        if span is None:
+            continue
+        spans = [span]
+        cut = _parse_range(item.get("break_time", ""))
+        if cut is not None:
+            # 브레이크타임이 영업 시작보다 이르면 다음날 새벽 구간으로 간주
+            if cut[0] < span[0]:
+                cut = (cut[0] + _DAY_MINUTES, cut[1] + _DAY_MINUTES)
+            spans = _subtract(span, cut)
+        days[weekday] = tuple(spans)
+        parsed_any = True
+    return tuple(days) if parsed_any else None
+
+
+def _week_minute(now: datetime) -> int:
+    now = now.astimezone(KST)
+    return now.weekday() * _DAY_MINUTES + now.hour * 60 + now.minute
+
+
+def _week_intervals(schedule: WeeklySchedule) -> list[tuple[int, int]]:
+    """주 단위 분(0 ~ 10079)으로 펼친 영업 구간 (주 경계를 넘으면 둘로 나눔)"""
+    intervals = []
+    for weekday, spans in enumerate(schedule):
+        for start, end in spans or ():
+            start += weekday * _DAY_MINUTES
+            end += weekday * _DAY_MINUTES
+            if end > _WEEK_MINUTES:
+                intervals.append((start, _WEEK_MINUTES))
+                intervals.append((0, end - _WEEK_MINUTES))
+            else:
+                intervals.append((start, end))
+    return intervals
+
+
+def is_open_at(schedule: WeeklySchedule, now: datetime) -> bool | None:
+    """해당 시각 영업 여부 (오늘 영업시간 정보가 없으면 None)"""
+    minute = _week_minute(now)
+    if any(start <= minute < end for start, end in _week_intervals(schedule)):
+        return True
+    if schedule[minute // _DAY_MINUTES] is None:
+        return None
+    return False
+
+
+def _boundaries(schedule: WeeklySchedule) -> list[int]:
+    """상태가 실제로 바뀌는 시각 (주 단위 분)
+
+    맞닿은 구간의 이음매(주 경계에서 나눈 구간, 24시간 영업일 사이 자정)는 변화가 아니므로 제외
+    """
+    starts, ends = set(), set()
+    for start, end in _week_intervals(schedule):
+        starts.add(start % _WEEK_MINUTES)
+        ends.add(end % _WEEK_MINUTES)
+    return sorted(starts ^ ends)
+
+
+def next_transition(schedule: WeeklySchedule, now: datetime) -> datetime | None:
+    """다음 상태 변화 시각 (오픈/브레이크/마감), 구간 정보가 없으면 None"""
+    points = _boundaries(schedule)
+    if not points:
+        return None
+    minute = _week_minute(now)
+    later = [p for p in points if p > minute]
+    delta = (later[0] - minute) if later else (points[0] + _WEEK_MINUTES - minute)
+    base = now.astimezone(KST).replace(second=0, microsecond=0)
+    return base + timedelta(minutes=delta)
+
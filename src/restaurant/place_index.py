@@ -0,0 +1,97 @@
+"""매장 ID 인덱스
+
+검색/주변/추천 결과로 받은 매장 레코드(_parse_place 결과)를 place_id로 보관 →
+상세 조회(GET /api/restaurants/{place_id})가 카카오 재검색 없이 바로 응답
+
+- 메모리: 크기 제한 LRU (TTL은 PLACE_INDEX_TTL, 다시 검색되면 갱신)
+- DB(place_records): 바뀐 레코드만 검색 결과 단위로 백그라운드 저장, 메모리 미스 시 조회
+- distance는 요청 좌표 기준 값이라 저장하지 않음 (조회 시 다시 계산)
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+
+from database.connection import SessionLocal
+from database.models import PlaceRecord
+
+from . import config, place_store
+from .cache import TTLCache
+
+_index = TTLCache(
+    maxsize=config.PLACE_INDEX_MAX_ENTRIES,
+    ttl=config.PLACE_INDEX_TTL,
+    max_bytes=config.PLACE_INDEX_MAX_BYTES,
+)
+# 같은 place_id 동시 upsert 충돌 방지
+_write_lock = threading.Lock()
+_counters = {"db_hits": 0, "db_misses": 0, "writes": 0}
+
+
+def _strip(doc: dict) -> dict:
+    return {k: v for k, v in doc.items() if k not in ("distance", "image_url")}
+
+
+def _save_many_sync(records: list[dict]) -> None:
+    now = datetime.utcnow()
+    with _write_lock, SessionLocal() as db:
+        for record in records:
+            row = db.get(PlaceRecord, record["id"])
+            if row is None:
+                row = PlaceRecord(place_id=record["id"])
+                db.add(row)
+            row.record_json = json.dumps(record, ensure_ascii=False)
+            row.updated_at = now
+        db.commit()
+
+
+def _load_sync(place_id: str) -> dict | None:
+    with SessionLocal() as db:
+        row = db.get(PlaceRecord, place_id)
+        if row is None:
+            return None
+        if datetime.utcnow() - row.updated_at > timedelta(seconds=config.PLACE_INDEX_TTL):
+            return None
+        return json.loads(row.record_json)
+
+
+def add_many(documents: list[dict]) -> None:
+    """검색 결과 매장들을 인덱스에 반영 (바뀐 레코드만 DB에 한 번에 저장)"""
+    changed = []
+    for doc in documents:
+        record = _strip(doc)
+        if _index.peek(record["id"]) != record:
+            changed.append(record)
+        _index.set(record["id"], record)
+    if changed and config.PLACE_STORE_ENABLED:
+        _counters["writes"] += len(changed)
+        place_store.submit(_save_many_sync, changed)
+
+
+async def get(place_id: str) -> dict | None:
+    """place_id로 매장 레코드 조회 (메모리 → DB, 없으면 None)
+
+    반환값은 복사본 (distance 없음)
+    """
+    record = _index.get(place_id)
+    if record is not None:
+        return dict(record)
+    if not config.PLACE_STORE_ENABLED:
+        return None
+    try:
+        record = await asyncio.to_thread(_load_sync, place_id)
+    except Exception as e:
+        print(f"Place index load error: {e}")
+        return None
+    if record is None:
+        _counters["db_misses"] += 1
+        return None
+    _counters["db_hits"] += 1
+    _index.set(place_id, record)
+    return dict(record)
+
+
+def stats() -> dict:
+    """인덱스 통계 (메모리 hit/miss, DB 조회/저장 수)"""
+    return {**_index.stats(), **_counters}
@@ -0,0 +1,154 @@
+"""플레이스 메타데이터 영구 저장소
+
+og:image URL, 리뷰 요약, 영업시간 등 플레이스 단위 데이터를 DB(place_metadata)에
+write-through로 저장 → 재시작/배포 직후에도 카카오 재스크래핑 없이 응답 가능
+
+- 조회: 플레이스별로 처음 필요할 때 DB에서 읽음 (lazy)
+- 저장: 업스트림 성공 시 백그라운드로 기록 (요청 지연 없음)
+- 만료: 항목별 갱신 시각 기준, 오래된 행은 주기적으로 정리(compaction)
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from sqlalchemy import delete, text
+
+from database.connection import SessionLocal, engine
+from database.models import PlaceMetadata, PlaceRecord
+
+from . import config
+
+# 항목 → (갱신 시각 컬럼, 최대 보존 기간)
+_FIELDS: dict[str, tuple[str, float]] = {
+    "image": ("image_updated_at", config.PLACE_STORE_IMAGE_MAX_AGE),
+    "reviews": ("reviews_updated_at", config.PLACE_STORE_REVIEWS_MAX_AGE),
+    "info": ("info_updated_at", config.PLACE_STORE_INFO_MAX_AGE),
+}
+
+# 같은 place_id 동시 upsert 충돌 방지
+_write_lock = threading.Lock()
+# 진행 중인 백그라운드 저장 작업 (GC 방지 + 종료 시 flush)
+_pending: set[asyncio.Task] = set()
+
+
+def _load_sync(place_id: str, field: str) -> tuple[Any, datetime] | None:
+    updated_col, max_age = _FIELDS[field]
+    with SessionLocal() as db:
+        row = db.get(PlaceMetadata, place_id)
+        if row is None:
+            return None
+        updated_at = getattr(row, updated_col)
+        if updated_at is None or datetime.utcnow() - updated_at > timedelta(seconds=max_age):
+            return None
+        if field == "image":
+            value = row.image_url
+        elif field == "reviews":
+            value = json.loads(row.reviews_json) if row.reviews_json else None
+        else:
+            value = json.loads(row.info_json) if row.info_json else None
+        return (value, updated_at) if value is not None else None
+
+
+def _save_sync(place_id: str, field: str, value: Any) -> None:
+    now = datetime.utcnow()
+    with _write_lock, SessionLocal() as db:
+        row = db.get(PlaceMetadata, place_id)
+        if row is None:
+            row = PlaceMetadata(place_id=place_id)
+            db.add(row)
+        if field == "image":
+            row.image_url = value
+        elif field == "reviews":
+            row.reviews_json = json.dumps(value, ensure_ascii=False)
+            row.avg_score = value.get("avg_score", 0)
+            row.review_count = value.get("total_count", 0)
+        else:
+            row.info_json = json.dumps(value, ensure_ascii=False)
+        setattr(row, _FIELDS[field][0], now)
+        row.updated_at = now
+        db.commit()
+
+
+async def load_entry(place_id: str, field: str) -> tuple[Any, datetime] | None:
+    """저장된 항목과 갱신 시각(UTC) 조회 (없거나 만료됐으면 None)"""
+    if not config.PLACE_STORE_ENABLED:
+        return None
+    try:
+        return await asyncio.to_thread(_load_sync, place_id, field)
+    except Exception as e:
+        print(f"Place store load error: {e}")
+        return None
+
+
+async def load(place_id: str, field: str) -> Any | None:
+    """저장된 항목 조회 (없거나 만료됐으면 None)
+
+    field: "image" | "reviews" | "info"
+    """
+    entry = await load_entry(place_id, field)
+    return entry[0] if entry else None
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> None:
+    """동기 DB 쓰기를 백그라운드 스레드로 실행 (flush 대상에 포함)"""
+
+    async def _write():
+        try:
+            await asyncio.to_thread(fn, *args)
+        except Exception as e:
+            print(f"Place store save error: {e}")
+
+    task = asyncio.create_task(_write())
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+def save(place_id: str, field: str, value: Any) -> None:
+    """항목 저장 (백그라운드 write-through)"""
+    if not config.PLACE_STORE_ENABLED:
+        return
+    submit(_save_sync, place_id, field, value)
+
+
+async def flush() -> None:
+    """대기 중인 저장 작업 완료 대기 (앱 종료 시)"""
+    if _pending:
+        await asyncio.gather(*list(_pending), return_exceptions=True)
+
+
+def _compact_sync() -> int:
+    # 모든 항목이 만료된 행 = 마지막 갱신이 가장 긴 보존 기간보다 오래된 행
+    cutoff = datetime.utcnow() - timedelta(seconds=max(age for _, age in _FIELDS.values()))
+    with _write_lock, SessionLocal() as db:
+        result = db.execute(delete(PlaceMetadata).where(PlaceMetadata.updated_at < cutoff))
+        db.commit()
+        removed = result.rowcount or 0
+        record_cutoff = datetime.utcnow() - timedelta(seconds=config.PLACE_INDEX_TTL)
+        result = db.execute(delete(PlaceRecord).where(PlaceRecord.updated_at < record_cutoff))
+        db.commit()
+        removed += result.rowcount or 0
+    if removed and engine.dialect.name == "sqlite":
+        # 삭제된 페이지 반환 (파일 크기 축소)
+        with engine.connect() as conn:
+            conn.execute(text("VACUUM"))
+    return removed
+
+
+async def compact() -> int:
+    """만료 행 삭제 (삭제 수 반환)"""
+    return await asyncio.to_thread(_compact_sync)
+
+
+async def run_compaction(interval: float = config.PLACE_STORE_COMPACT_INTERVAL) -> None:
+    """주기적 compaction 루프 (lifespan에서 백그라운드 Task로 실행)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await compact()
+            if removed:
+                print(f"🧹 플레이스 캐시 정리: {removed}건 삭제")
+        except Exception as e:
+            print(f"Place store compaction error: {e}")
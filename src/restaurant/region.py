@@ -0,0 +1,68 @@
+"""행정동 중심점 로컬 인덱스
+
+카카오 coord2region 응답을 받을 때마다 해당 좌표를 동별 중심점에 누적하고,
+업스트림이 죽었거나 쿼터가 없을 때 가장 가까운 동을 즉시 반환
+"""
+
+import math
+
+from .geo import haversine_m
+
+# 격자 버킷 크기 (도) — 약 5km
+_BUCKET_DEG = 0.05
+
+
+def _bucket(lat: float, lng: float) -> tuple[int, int]:
+    return math.floor(lat / _BUCKET_DEG), math.floor(lng / _BUCKET_DEG)
+
+
+class RegionIndex:
+    """동 중심점 격자 인덱스 (최근접 동 검색)"""
+
+    def __init__(self):
+        # (1depth, 2depth, 3depth) -> [위도 합, 경도 합, 관측 수, region dict, 시드 여부]
+        self._regions: dict[tuple[str, str, str], list] = {}
+        # 격자 버킷 -> 동 키 집합
+        self._buckets: dict[tuple[int, int], set[tuple[str, str, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def _centroid(self, key: tuple[str, str, str]) -> tuple[float, float]:
+        sum_lat, sum_lng, count = self._regions[key][:3]
+        return sum_lat / count, sum_lng / count
+
+    def add(self, lat: float, lng: float, region: dict, seed: bool = False) -> None:
+        """관측 좌표를 동 중심점에 반영
+
+        seed=True는 미리 넣어둔 대략적인 지역 — 실제 관측된 동이 근처에 있으면 그쪽을 우선
+        """
+        key = (region["region_1depth"], region["region_2depth"], region["region_3depth"])
+        entry = self._regions.get(key)
+        if entry is None:
+            self._regions[key] = [lat, lng, 1, dict(region), seed]
+        else:
+            old_bucket = _bucket(*self._centroid(key))
+            entry[0] += lat
+            entry[1] += lng
+            entry[2] += 1
+            entry[4] = entry[4] and seed
+            self._buckets[old_bucket].discard(key)
+        self._buckets.setdefault(_bucket(*self._centroid(key)), set()).add(key)
+
+    def nearest(self, lat: float, lng: float, max_distance_m: float) -> dict | None:
+        """가장 가까운 동 (max_distance_m 밖이면 None)"""
+        row, col = _bucket(lat, lng)
+        candidates = [
+            key
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            for key in self._buckets.get((row + dr, col + dc), ())
+        ]
+        best, best_rank = None, (True, max_distance_m)
+        for key in candidates:
+            dist = haversine_m(lat, lng, *self._centroid(key))
+            rank = (self._regions[key][4], dist)
+            if dist <= max_distance_m and rank <= best_rank:
+                best, best_rank = key, rank
+        return dict(self._regions[best][3]) if best else None
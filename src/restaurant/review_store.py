@@ -0,0 +1,228 @@
+"""리뷰 저장소 (reviews 테이블 + 매장별 집계 행)
+
+카카오 플레이스 리뷰를 개별 행으로 쌓고(docs/data-collection.md의 reviews 스키마),
+매장별 평균 별점/별점 수를 place_review_stats에 한 행으로 유지
+
+- 증분: 매장별로 마지막으로 본 가장 최신 리뷰(커서)를 기억 → 그보다 새 리뷰만 저장
+- 커서는 가져온 리뷰가 이전 커서까지 이어질 때만 전진 (중간 구멍 방지)
+  → 못 닿았으면 이어받을 지점(resume)을 기록해 다음 동기화가 남은 구간부터 읽음
+- 집계 행은 추천 점수 계산 시 매장별 리뷰 호출 대신 한 번의 DB 조회로 사용
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import or_, select
+
+from database.connection import SessionLocal
+from database.models import PlaceRecord, PlaceReviewStats, Review
+
+from . import config
+
+# 같은 매장 동시 동기화(라이브 조회 + 동기화 루프) 충돌 방지
+_write_lock = threading.Lock()
+
+_DATE_RE = re.compile(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})")
+
+
+def parse_review_date(text: str) -> date | None:
+    """카카오 리뷰 날짜 파싱 (예: "2024.03.05.")"""
+    match = _DATE_RE.search(text or "")
+    if not match:
+        return None
+    try:
+        return date(*(int(g) for g in match.groups()))
+    except ValueError:
+        return None
+
+
+def source_id(item: dict) -> str:
+    """리뷰 원본 ID (commentid, 없으면 작성자/날짜/내용 해시)"""
+    comment_id = item.get("commentid")
+    if comment_id:
+        return str(comment_id)
+    raw = f"{item.get('username', '')}|{item.get('date', '')}|{item.get('contents', '')}"
+    return "h" + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def load_cursor_sync(place_id: str) -> dict | None:
+    """마지막 동기화 상태 (커서 + 조건부 요청용 검증자)"""
+    with SessionLocal() as db:
+        row = db.get(PlaceReviewStats, place_id)
+        if row is None:
+            return None
+        return {
+            "latest_source_id": row.latest_source_id,
+            "latest_review_date": row.latest_review_date,
+            "resume_source_id": row.resume_source_id,
+            "resume_review_date": row.resume_review_date,
+            "resume_after_id": row.resume_after_id,
+            "etag": row.etag,
+            "last_modified": row.last_modified,
+        }
+
+
+def new_items(items: list[dict], cursor: dict | None) -> tuple[list[dict], bool]:
+    """최신순 리뷰 목록에서 커서보다 새 리뷰만 골라냄
+
+    Returns:
+        (새 리뷰 목록, 커서에 닿았는지 — 커서가 없으면 항상 True)
+    """
+    if not cursor or not cursor["latest_source_id"]:
+        return items, True
+    latest_id = cursor["latest_source_id"]
+    latest_date = cursor["latest_review_date"]
+    fresh = []
+    for item in items:
+        if source_id(item) == latest_id:
+            return fresh, True
+        item_date = parse_review_date(item.get("date", ""))
+        if latest_date and item_date and item_date < latest_date:
+            # 커서 리뷰가 삭제된 경우 — 날짜로 경계 판단
+            return fresh, True
+        fresh.append(item)
+    return fresh, False
+
+
+def ingest_sync(
+    place_id: str,
+    items: list[dict],
+    score_count: int,
+    score_sum: float,
+    reached_cursor: bool,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    head: dict | None = None,
+    resume_after_id: str | None = None,
+) -> int:
+    """리뷰 저장 + 집계 행 갱신 (새로 저장한 리뷰 수 반환)
+
+    items는 최신순, head는 이번에 본 가장 최신 리뷰 (없으면 items[0]).
+    reached_cursor가 True일 때만 커서를 head로 전진하고 동기화 시각/검증자를 기록
+    (검증자를 먼저 저장하면 다음 조건부 요청이 304로 남은 구간을 건너뜀).
+    못 닿았고 resume_after_id가 있으면 이어받을 지점으로 기록 → 다음 동기화 루프가 남은 구간을 채움
+    """
+    if head is None and items:
+        head = items[0]
+    now = datetime.utcnow()
+    with _write_lock, SessionLocal() as db:
+        stats = db.get(PlaceReviewStats, place_id)
+        if stats is None:
+            stats = PlaceReviewStats(place_id=place_id, stored_count=0)
+            db.add(stats)
+
+        ids = [source_id(item) for item in items]
+        existing = set()
+        if ids:
+            existing = set(db.scalars(
+                select(Review.source_id).where(Review.place_id == place_id, Review.source_id.in_(ids))
+            ))
+        inserted = 0
+        for sid, item in zip(ids, items):
+            if sid in existing or not item.get("contents"):
+                continue
+            existing.add(sid)
+            db.add(Review(
+                place_id=place_id,
+                source_id=sid,
+                content=item["contents"],
+                rating=item.get("point") or None,
+                review_date=parse_review_date(item.get("date", "")),
+            ))
+            inserted += 1
+
+        if score_count:
+            stats.score_count = score_count
+            stats.avg_score = round(score_sum / score_count, 1)
+        elif stats.score_count is None:
+            stats.score_count, stats.avg_score = 0, 0.0
+        stats.stored_count = (stats.stored_count or 0) + inserted
+        if reached_cursor:
+            if head is not None:
+                stats.latest_source_id = source_id(head)
+                stats.latest_review_date = parse_review_date(head.get("date", ""))
+            stats.resume_source_id = stats.resume_review_date = stats.resume_after_id = None
+            stats.synced_at = now
+            if etag is not None:
+                stats.etag = etag
+            if last_modified is not None:
+                stats.last_modified = last_modified
+        elif resume_after_id is not None and head is not None:
+            stats.resume_source_id = source_id(head)
+            stats.resume_review_date = parse_review_date(head.get("date", ""))
+            stats.resume_after_id = resume_after_id
+        stats.updated_at = now
+        db.commit()
+        return inserted
+
+
+def record_page_sync(place_id: str, items: list[dict], score_count: int, score_sum: float) -> int:
+    """리뷰 첫 페이지 반영 (라이브 조회 경로) — 커서보다 새 리뷰만 저장"""
+    fresh, reached = new_items(items, load_cursor_sync(place_id))
+    return ingest_sync(place_id, fresh, score_count, score_sum, reached)
+
+
+def touch_sync(place_id: str) -> None:
+    """변경 없음(304) — 동기화 시각만 갱신"""
+    with _write_lock, SessionLocal() as db:
+        stats = db.get(PlaceReviewStats, place_id)
+        if stats is not None:
+            stats.synced_at = stats.updated_at = datetime.utcnow()
+            db.commit()
+
+
+def due_places_sync(limit: int) -> list[str]:
+    """동기화 대상 매장 (인덱스에 있는 매장 중 한 번도 안 했거나 오래된 순)"""
+    cutoff = datetime.utcnow() - timedelta(seconds=config.REVIEW_SYNC_MIN_AGE)
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(PlaceRecord.place_id)
+            .outerjoin(PlaceReviewStats, PlaceReviewStats.place_id == PlaceRecord.place_id)
+            .where(or_(PlaceReviewStats.synced_at.is_(None), PlaceReviewStats.synced_at < cutoff))
+            .order_by(PlaceReviewStats.synced_at.is_not(None), PlaceReviewStats.synced_at)
+            .limit(limit)
+        )
+        return [place_id for (place_id,) in rows]
+
+
+def _load_stats_sync(place_ids: list[str]) -> dict[str, dict]:
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=config.REVIEW_CACHE_HARD_TTL)
+    with SessionLocal() as db:
+        rows = db.scalars(
+            select(PlaceReviewStats).where(
+                PlaceReviewStats.place_id.in_(place_ids),
+                PlaceReviewStats.updated_at >= cutoff,
+            )
+        )
+        return {
+            row.place_id: {
+                "avg_score": row.avg_score,
+                "total_count": row.score_count,
+                "stale": (now - row.updated_at).total_seconds() > config.REVIEW_CACHE_SOFT_TTL,
+            }
+            for row in rows
+        }
+
+
+async def load_stats(place_ids: list[str]) -> dict[str, dict]:
+    """매장별 집계 일괄 조회 (실패 시 빈 dict)
+
+    리뷰 캐시와 같은 신선도 기준: hard TTL이 지난 행은 제외,
+    soft TTL이 지난 행은 stale=True로 반환 (호출 측에서 백그라운드 갱신 —
+    kakao_client.review_stats)
+
+    Returns:
+        {place_id: {"avg_score": float, "total_count": int, "stale": bool}}
+    """
+    place_ids = [pid for pid in place_ids if not pid.startswith("mock_")]
+    if not place_ids:
+        return {}
+    try:
+        return await asyncio.to_thread(_load_stats_sync, place_ids)
+    except Exception as e:
+        print(f"Review stats load error: {e}")
+        return {}
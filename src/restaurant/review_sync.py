@@ -0,0 +1,135 @@
+"""리뷰 증분 동기화 작업
+
+매장 ID 인덱스(place_records)에 쌓인 매장을 오래된 순으로 골라
+마지막으로 본 리뷰(커서)보다 새 리뷰만 가져와 reviews 테이블과 집계 행에 반영
+
+- 첫 페이지는 조건부 요청(If-None-Match / If-Modified-Since, 업스트림이 검증자를 줄 때만)
+  → 304면 동기화 시각만 갱신
+- 첫 페이지가 전부 새 리뷰면 다음 페이지를 따라감 (커서에 닿거나 REVIEW_SYNC_MAX_PAGES까지)
+- 상한/중간 실패로 커서에 못 닿으면 커서는 그대로 두고 이어받을 지점을 기록 →
+  다음 주기는 새 리뷰를 읽은 뒤 끊긴 지점부터 이어서 읽음 (커서까지 구멍 없이 이어질 때만 전진)
+- 처음 동기화하는 매장은 REVIEW_SYNC_MAX_PAGES까지만 과거 리뷰를 채움
+- BACKGROUND 우선순위 → 사용자 요청 예산을 침범하지 않음
+"""
+
+import asyncio
+
+from . import config
+from .governor import Priority, outbound_priority
+from .kakao_client import fetch_comment_page
+from .review_store import due_places_sync, ingest_sync, load_cursor_sync, new_items, touch_sync
+
+_counters = {"runs": 0, "synced": 0, "unchanged": 0, "failed": 0, "pages": 0, "reviews_added": 0}
+
+
+async def sync_place(place_id: str) -> bool:
+    """매장 하나 동기화 (실패 시 False — 커서는 그대로 두고 다음 주기에 다시 시도)"""
+    cursor = await asyncio.to_thread(load_cursor_sync, place_id)
+    resume_after = cursor["resume_after_id"] if cursor else None
+    first = await fetch_comment_page(
+        place_id,
+        # 이어받을 구간이 남았으면 조건부 요청 안 함 (304면 남은 구간을 못 채움)
+        etag=cursor["etag"] if cursor and not resume_after else None,
+        last_modified=cursor["last_modified"] if cursor and not resume_after else None,
+    )
+    if first is None:
+        _counters["failed"] += 1
+        return False
+    status, comment, validators = first
+    _counters["pages"] += 1
+    if status == 304:
+        await asyncio.to_thread(touch_sync, place_id)
+        _counters["unchanged"] += 1
+        return True
+
+    score_count = comment.get("scorecnt", 0)
+    score_sum = comment.get("scoresum", 0)
+    items = comment.get("list") or []
+    head = items[0] if items else None
+    backfill = not cursor or not cursor["latest_source_id"]
+    # 지난 주기에 끊긴 구간이 있으면 먼저 그때 본 가장 최신 리뷰까지 읽고 끊긴 지점으로 건너뜀
+    resume_cursor = {
+        "latest_source_id": cursor["resume_source_id"],
+        "latest_review_date": cursor["resume_review_date"],
+    } if resume_after else None
+    target = resume_cursor or cursor
+    collected, reached = new_items(items, target)
+    pages = 1
+    stopped_at = None  # 다 못 읽고 멈췄으면 다음에 읽을 페이지의 기준 commentid
+    # 커서에 닿을 때까지(처음이면 최대 페이지까지) 다음 페이지를 따라감
+    while True:
+        if reached and resume_cursor is not None and target is resume_cursor:
+            target, after_id = cursor, resume_after
+        elif (reached and not backfill) or not comment.get("hasNext") or not items:
+            break
+        else:
+            after_id = items[-1].get("commentid")
+        if not after_id:
+            break
+        if pages >= config.REVIEW_SYNC_MAX_PAGES:
+            # 처음이면 더 오래된 구간은 포기, 아니면 여기서 끊고 다음 주기에 이어서
+            stopped_at, reached = str(after_id), backfill
+            break
+        page = await fetch_comment_page(place_id, after_id=str(after_id))
+        if page is None or page[0] != 200:
+            # 중간 실패 — 받은 만큼만 저장하고 다음 주기에 이어서
+            stopped_at, reached = str(after_id), backfill
+            break
+        comment = page[1]
+        items = comment.get("list") or []
+        fresh, reached = new_items(items, target)
+        collected.extend(fresh)
+        pages += 1
+        _counters["pages"] += 1
+
+    added = await asyncio.to_thread(
+        ingest_sync,
+        place_id,
+        collected,
+        score_count,
+        score_sum,
+        reached,
+        validators["etag"],
+        validators["last_modified"],
+        head,
+        stopped_at,
+    )
+    _counters["synced"] += 1
+    _counters["reviews_added"] += added
+    return True
+
+
+async def sync_once(limit: int = config.REVIEW_SYNC_BATCH) -> int:
+    """동기화 대상 매장을 한 번 처리 (처리한 매장 수 반환)"""
+    place_ids = await asyncio.to_thread(due_places_sync, limit)
+    semaphore = asyncio.Semaphore(max(1, config.REVIEW_SYNC_CONCURRENCY))
+
+    async def _one(place_id: str) -> None:
+        async with semaphore:
+            try:
+                await sync_place(place_id)
+            except Exception as e:
+                _counters["failed"] += 1
+                print(f"Review sync error ({place_id}): {e}")
+
+    with outbound_priority(Priority.BACKGROUND):
+        await asyncio.gather(*[_one(pid) for pid in place_ids])
+    _counters["runs"] += 1
+    return len(place_ids)
+
+
+async def run_sync(interval: float = config.REVIEW_SYNC_INTERVAL) -> None:
+    """주기적 동기화 루프 (lifespan에서 백그라운드 Task로 실행)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            count = await sync_once()
+            if count:
+                print(f"📝 리뷰 동기화: {count}곳")
+        except Exception as e:
+            print(f"Review sync error: {e}")
+
+
+def stats() -> dict:
+    """동기화 통계 (모니터링용)"""
+    return {"enabled": config.REVIEW_SYNC_ENABLED, **_counters}
@@ -1,6 +1,12 @@
 """맛집 API 요청/응답 스키마"""
 
-from pydantic import BaseModel
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field, StringConstraints
+
+# 카카오 place_id (숫자) 또는 mock 모드 ID (mock_{순번}_{난수}, 업스트림 없이 로컬 응답)
+# — 업스트림 URL 경로와 DB 키(String(50))에 그대로 쓰이므로 형식 제한
+PlaceId = Annotated[str, StringConstraints(pattern=r"^(?:\d{1,20}|mock_\d{1,5}_\d{1,5})$")]
 
 
 class KakaoRestaurant(BaseModel):
@@ -61,6 +67,7 @@ class PlaceInfoResponse(BaseModel):
     status_desc: str = ""     # "내일 08:00 오픈"
     hours: list[BusinessHour] = []
     homepage: str = ""
+    is_open: bool | None = None  # 캐시된 영업시간 기준 현재 영업 여부 (정보 없으면 None)
 
 
 class RegionInfo(BaseModel):
@@ -69,3 +76,31 @@ class RegionInfo(BaseModel):
     region_2depth: str     # "강남구"
     region_3depth: str     # "역삼동"
     display_name: str      # "강남구 역삼동"
+
+
+class BatchPlaceRequest(BaseModel):
+    """여러 매장 상세 일괄 조회 요청"""
+    place_ids: list[PlaceId] = Field(..., min_length=1, max_length=30)
+    fields: list[Literal["info", "reviews", "image"]] = ["info", "reviews", "image"]
+
+
+class PlaceDetails(BaseModel):
+    """매장 상세 (요청한 항목만 채워짐)"""
+    id: str
+    info: PlaceInfoResponse | None = None
+    reviews: ReviewResponse | None = None
+    image_url: str | None = None
+
+
+class BatchPlaceResponse(BaseModel):
+    """매장 상세 일괄 조회 응답 (요청 순서 유지)"""
+    places: list[PlaceDetails]
+
+
+class AreaScanRequest(BaseModel):
+    """영역 전체 매장 수집 요청 (좌표 중심 반경을 덮는 사각형)"""
+    lat: float
+    lng: float
+    radius: int = Field(2000, ge=100, le=10000)  # m
+    query: str | None = None   # 없으면 카테고리 검색
+    category_code: str = "FD6"
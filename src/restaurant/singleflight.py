@@ -0,0 +1,46 @@
+"""동일 요청 합치기 (single-flight)
+
+같은 키로 동시에 들어온 호출은 하나의 업스트림 요청 결과를 함께 기다림
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """진행 중인 요청을 키별로 공유
+
+    - 업스트림 요청은 별도 Task로 실행되고, 호출자는 shield로 기다림
+      → 기다리던 호출자 하나가 취소돼도 다른 호출자/요청은 영향 없음
+    - 요청이 끝나면(성공/실패 모두) 키를 지우므로 에러가 다음 호출에 남지 않음
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0        # 실제로 실행된 업스트림 요청 수
+        self.coalesced = 0    # 진행 중인 요청에 합쳐진 호출 수
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+            self.calls += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
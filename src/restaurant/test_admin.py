@@ -0,0 +1,69 @@
+"""관리자 API 인증 테스트 (키 미설정 시 닫힘)"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from chatbot.rate_limit import limiter
+
+from .admin import router
+
+app = FastAPI()
+app.state.limiter = limiter
+app.include_router(router)
+
+
+def _request(
+    method: str, path: str, headers: dict | None = None, body: dict | None = None
+) -> httpx.Response:
+    body = body or {"lat": 37.5, "lng": 127.0}
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.request(method, path, headers=headers, json=body)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("headers", [None, {"X-Admin-Key": ""}, {"X-Admin-Key": "anything"}])
+def test_admin_api_is_closed_without_configured_key(kakao, headers):
+    assert _request("GET", "/api/admin/kakao", headers).status_code == 404
+    assert _request("GET", "/api/admin/kakao/budget", headers).status_code == 404
+
+
+def test_scan_is_closed_without_configured_key(kakao):
+    """키가 없으면 수집 API도 404, 업스트림 호출 없음"""
+    response = _request("POST", "/api/admin/kakao/scan", {"X-Admin-Key": "secret"})
+    assert response.status_code == 404
+    assert kakao.calls == []
+
+
+def test_scan_opens_when_key_is_configured_later(kakao, monkeypatch):
+    """라우트는 항상 등록 → 실행 중에 키를 설정해도 바로 사용 가능"""
+    monkeypatch.setenv("ADMIN_API_KEY", "secret")
+    kakao.handler = lambda request: httpx.Response(
+        200, json={"documents": [], "meta": {"total_count": 0, "is_end": True}}
+    )
+    response = _request(
+        "POST",
+        "/api/admin/kakao/scan",
+        {"X-Admin-Key": "secret"},
+        {"lat": 37.5, "lng": 127.0, "radius": 100, "query": "국밥"},
+    )
+    assert response.status_code == 200
+    assert json.loads(response.text.splitlines()[-1])["done"] is True
+    assert kakao.calls
+
+
+@pytest.mark.parametrize("headers", [None, {"X-Admin-Key": "wrong"}, {"X-Admin-Key": "secre"}])
+def test_wrong_or_missing_key_is_forbidden(kakao, monkeypatch, headers):
+    monkeypatch.setenv("ADMIN_API_KEY", "secret")
+    assert _request("GET", "/api/admin/kakao/budget", headers).status_code == 403
+
+
+def test_matching_key_is_allowed(kakao, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "secret")
+    response = _request("GET", "/api/admin/kakao/budget", {"X-Admin-Key": "secret"})
+    assert response.status_code == 200
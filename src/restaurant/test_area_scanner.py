@@ -0,0 +1,76 @@
+"""영역 스캐너 격자 분할 / 로컬 미러 반영 테스트"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from . import config
+from .area_scanner import AreaScanner
+from .local_mirror import mirror
+
+# 약 1km × 1km 영역 (미러 격자 정렬을 피하려고 키워드 스캔)
+RECT = (127.0, 37.5, 127.0113, 37.509)
+
+
+def _rect_pages(request: httpx.Request) -> httpx.Response:
+    """영역 폭이 넓으면 45건 초과, 4분할한 격자는 격자당 매장 1개"""
+    min_lng, min_lat, max_lng, max_lat = map(float, request.url.params["rect"].split(","))
+    if max_lng - min_lng > 0.01:
+        docs, meta = [], {"total_count": 200, "is_end": False}
+    else:
+        docs, meta = [_doc(min_lng, min_lat)], {"total_count": 1, "is_end": True}
+    return httpx.Response(200, json={"documents": docs, "meta": meta})
+
+
+def _doc(lng: float, lat: float) -> dict:
+    return {
+        "id": f"{lng:.4f}-{lat:.4f}",
+        "place_name": "매장",
+        "category_name": "음식점 > 한식",
+        "x": str(lng),
+        "y": str(lat),
+        "distance": "",
+    }
+
+
+def _scan(scanner: AreaScanner) -> list[dict]:
+    async def run():
+        return [place async for place in scanner.run()]
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def mirror_calls(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    monkeypatch.setattr(mirror, "add_many", lambda *args: calls.append("add_many"))
+    monkeypatch.setattr(mirror, "mark_covered", lambda *args: calls.append("mark_covered"))
+    return calls
+
+
+def test_splits_cells_over_45_results(kakao, mirror_calls):
+    kakao.handler = _rect_pages
+    scanner = AreaScanner(RECT, query="국밥", concurrency=2)
+    places = _scan(scanner)
+    assert len(places) == 4
+    assert scanner.stats()["splits"] == 1
+    assert scanner.stats()["cells"] == 5
+
+
+def test_mirror_untouched_when_disabled(kakao, mirror_calls, monkeypatch):
+    """KAKAO_MIRROR=false면 캐시 hit 결과도, 커버리지 표시도 미러에 쓰지 않음"""
+    monkeypatch.setattr(config, "MIRROR_ENABLED", False)
+    kakao.handler = _rect_pages
+    scanner = AreaScanner(RECT)
+    _scan(scanner)
+    # 같은 영역을 다시 스캔하면 전부 검색 캐시 hit
+    _scan(AreaScanner(RECT))
+    assert scanner.complete
+    assert mirror_calls == []
+
+
+def test_complete_category_scan_marks_mirror_coverage(kakao, mirror_calls, monkeypatch):
+    monkeypatch.setattr(config, "MIRROR_ENABLED", True)
+    kakao.handler = _rect_pages
+    _scan(AreaScanner(RECT))
+    assert mirror_calls[-1] == "mark_covered"
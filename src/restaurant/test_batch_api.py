@@ -0,0 +1,108 @@
+"""매장 상세 일괄 조회 API 테스트 (/api/restaurants/batch)"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from chatbot.rate_limit import limiter
+
+from . import config
+from .api import router
+
+app = FastAPI()
+app.state.limiter = limiter
+app.include_router(router)
+
+
+def _image_page(request: httpx.Request) -> httpx.Response:
+    place_id = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, text=f'<head><meta property="og:image" content="//img/{place_id}.jpg"></head>')
+
+
+def _post(path: str, body: dict) -> httpx.Response:
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(path, json=body)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("place_id", ["../admin", "12a", "", "1" * 21, "mock_", "mock_1_../x"])
+def test_rejects_malformed_place_ids(kakao, place_id):
+    """숫자가 아닌 ID는 업스트림 URL/DB 키로 쓰이기 전에 422"""
+    response = _post("/api/restaurants/batch", {"place_ids": ["1001", place_id], "fields": ["image"]})
+    assert response.status_code == 422
+    assert kakao.calls == []
+
+
+def test_accepts_mock_mode_place_ids(kakao):
+    """mock 검색 결과의 ID도 조회 가능 (업스트림 호출 없이 빈 값)"""
+    response = _post(
+        "/api/restaurants/batch", {"place_ids": ["mock_0_1234"], "fields": ["image", "reviews"]}
+    )
+    assert response.status_code == 200
+    place = response.json()["places"][0]
+    assert place["id"] == "mock_0_1234"
+    assert place["image_url"] == ""
+    assert place["reviews"]["reviews"] == []
+    assert kakao.calls == []
+
+
+def test_keeps_request_order_and_collapses_duplicates(kakao):
+    kakao.handler = _image_page
+    response = _post("/api/restaurants/batch", {"place_ids": ["2002", "2001", "2002"], "fields": ["image"]})
+    assert response.status_code == 200
+    places = response.json()["places"]
+    assert [p["id"] for p in places] == ["2002", "2001"]
+    assert places[0]["image_url"] == "https://img/2002.jpg"
+    assert places[0]["info"] is None and places[0]["reviews"] is None
+    assert len(kakao.calls) == 2
+
+
+def test_stream_emits_one_line_per_place(kakao):
+    kakao.handler = _image_page
+    response = _post("/api/restaurants/batch/stream", {"place_ids": ["3001", "3002"], "fields": ["image"]})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(p["id"] for p in lines) == ["3001", "3002"]
+
+
+def test_client_disconnect_cancels_queued_places(kakao, monkeypatch):
+    """클라이언트가 끊으면 아직 시작하지 않은 매장 조회는 보내지 않음"""
+    monkeypatch.setattr(config, "BATCH_CONCURRENCY", 1)
+
+    async def slow_page(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.3)
+        return _image_page(request)
+
+    kakao.handler = slow_page
+    body = json.dumps({"place_ids": ["4001", "4002", "4003"], "fields": ["image"]}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/api/restaurants/batch", "raw_path": b"/api/restaurants/batch",
+        "root_path": "", "query_string": b"", "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000), "server": ("test", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        await app(scope, receive, send)
+        # 진행 중이던 첫 매장 조회가 끝나고도 나머지가 시작되지 않는지 확인
+        await asyncio.sleep(0.5)
+
+    asyncio.run(run())
+    # 끊긴 클라이언트에는 응답을 보내지 않음
+    assert sent == []
+    assert len(kakao.calls) == 1
@@ -0,0 +1,70 @@
+"""LRU + TTL 캐시 테스트 (og:image 캐시 포함)"""
+
+import asyncio
+
+import httpx
+
+from . import cache as cache_module
+from . import kakao_client
+from .cache import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _frozen_clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_evicts_least_recently_used_entry():
+    """maxsize 초과 시 가장 오래 안 쓴 항목부터 제거 (get은 최근 사용으로 갱신)"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_max_bytes_bounds_memory():
+    """추정 메모리가 max_bytes를 넘으면 항목 수와 관계없이 제거"""
+    cache = TTLCache(maxsize=100, ttl=60, max_bytes=250, sizeof=lambda value: 100)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x")
+    assert len(cache) == 1
+    assert cache.bytes <= 250
+
+
+def test_negative_entries_expire_sooner(monkeypatch):
+    """빈/실패 결과는 negative_ttl로 먼저 만료"""
+    clock = _frozen_clock(monkeypatch)
+    cache = TTLCache(maxsize=10, ttl=60, negative_ttl=5)
+    cache.set("found", "url")
+    cache.set("missing", "", negative=True)
+
+    clock.now += 10
+    assert cache.get("missing") is None
+    assert cache.get("found") == "url"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 1)
+
+
+def test_place_image_is_fetched_once(kakao):
+    """og:image는 한 번 가져오면 캐시에서 응답"""
+    kakao.handler = lambda request: httpx.Response(
+        200, text='<html><head><meta property="og:image" content="//img.example/a.jpg"></head></html>'
+    )
+
+    async def run():
+        return [await kakao_client.fetch_place_image("image-test-1") for _ in range(3)]
+
+    assert asyncio.run(run()) == ["https://img.example/a.jpg"] * 3
+    assert len(kakao.calls) == 1
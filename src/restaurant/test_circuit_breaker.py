@@ -0,0 +1,68 @@
+"""서킷 브레이커 롤링 윈도우 / 상태 전이 테스트"""
+
+import pytest
+
+from . import circuit_breaker as cb_module
+from .circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cb_module.time, "monotonic", clock)
+    return clock
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker("test", failure_threshold=3, window=10.0, recovery_timeout=5.0)
+
+
+def test_opens_on_failures_mixed_with_successes(clock):
+    """부분 장애: 성공이 사이사이 있어도 윈도우 안 실패가 임계치에 닿으면 열림"""
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+        breaker.record_success()
+        clock.now += 1
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_failures_outside_window_do_not_count(clock):
+    """윈도우를 벗어난 실패는 빠짐"""
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+        clock.now += 6
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["recent_failures"] == 1
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    """recovery_timeout 뒤 probe 1건만 통과 — 성공하면 CLOSED(실패 기록 초기화), 실패하면 다시 OPEN"""
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["recent_failures"] == 0
+
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 3
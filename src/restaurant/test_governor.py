@@ -0,0 +1,94 @@
+"""아웃바운드 호출 예산 (토큰 버킷 + 일일 쿼터 + 우선순위) 테스트"""
+
+import asyncio
+
+import pytest
+
+from database.connection import SessionLocal
+from database.models import ApiQuotaUsage
+
+from .governor import (
+    BudgetExceededError,
+    OutboundGovernor,
+    Priority,
+    TokenBucket,
+    effective_priority,
+    outbound_priority,
+)
+
+
+def _governor(tokens: float, capacity: float = 10, quota: int = 0) -> OutboundGovernor:
+    gov = OutboundGovernor()
+    gov.buckets["rest"] = TokenBucket(rate=0.001, burst=capacity)
+    gov.buckets["rest"].tokens = tokens
+    gov.daily_quota = quota
+    return gov
+
+
+def test_background_keeps_reserve_for_user_requests():
+    """버킷이 절반 아래면 BACKGROUND는 건너뛰고 USER는 통과"""
+    gov = _governor(tokens=5)
+    assert not gov.admits("rest", Priority.BACKGROUND)
+    with pytest.raises(BudgetExceededError):
+        asyncio.run(gov.acquire("rest", Priority.BACKGROUND))
+
+    asyncio.run(gov.acquire("rest", Priority.USER))
+    assert gov.granted["USER"] == 1
+    assert gov.skipped["BACKGROUND"] == 1
+
+
+def test_daily_quota_floor_blocks_lower_priorities_first():
+    """남은 쿼터가 40% 이하면 BACKGROUND 차단, USER는 0까지 사용"""
+    gov = _governor(tokens=10, quota=100)
+    gov._used = 60
+    assert not gov.admits("rest", Priority.BACKGROUND)
+    assert gov.admits("rest", Priority.USER)
+
+    gov._used = 100
+    with pytest.raises(BudgetExceededError) as exc:
+        asyncio.run(gov.acquire("rest", Priority.USER))
+    assert exc.value.reason == "daily quota"
+
+
+def test_outbound_priority_only_lowers():
+    """호출 맥락 우선순위는 엔드포인트 기본값보다 낮출 수만 있음"""
+    assert effective_priority(Priority.USER) == Priority.USER
+    with outbound_priority(Priority.BACKGROUND):
+        assert effective_priority(Priority.USER) == Priority.BACKGROUND
+    with outbound_priority(Priority.USER):
+        assert effective_priority(Priority.IMAGE) == Priority.IMAGE
+
+
+def _stored(day: str) -> int | None:
+    with SessionLocal() as db:
+        row = db.get(ApiQuotaUsage, (day, "kakao_rest"))
+        return row.count if row else None
+
+
+def test_load_is_idempotent():
+    """load를 두 번 불러도 저장된 사용량을 한 번만 더함"""
+    gov = _governor(tokens=10, quota=100)
+    gov._day = "2000-01-01"
+    gov._flush_sync(gov._day, 7)
+    gov._used = 2
+
+    gov._load_sync()
+    gov._load_sync()
+    assert gov._used == 9
+
+
+def test_day_rollover_flushes_previous_day(monkeypatch):
+    """자정을 넘기면 마지막 기록 이후의 전날 사용분도 전날 날짜로 기록"""
+    gov = _governor(tokens=10, quota=100)
+    monkeypatch.setattr(OutboundGovernor, "_today", staticmethod(lambda: "2000-01-02"))
+    gov._day = "2000-01-02"
+    gov._loaded = True
+    asyncio.run(gov.acquire("rest", Priority.USER))
+    asyncio.run(gov.flush())
+    asyncio.run(gov.acquire("rest", Priority.USER))
+
+    monkeypatch.setattr(OutboundGovernor, "_today", staticmethod(lambda: "2000-01-03"))
+    assert gov.quota_remaining == 100
+    asyncio.run(gov.flush())
+    assert _stored("2000-01-02") == 2
+    assert _stored("2000-01-03") is None
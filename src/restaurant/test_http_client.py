@@ -0,0 +1,69 @@
+"""공유 HTTP 클라이언트 (커넥션 풀) 수명 관리 테스트"""
+
+import asyncio
+
+from . import config, kakao_client
+
+
+def test_open_reuses_one_client_until_closed(monkeypatch):
+    monkeypatch.setattr(kakao_client, "_http_client", None)
+
+    async def run():
+        await kakao_client.open_http_client()
+        first = kakao_client.get_http_client()
+        await kakao_client.open_http_client()
+        assert kakao_client.get_http_client() is first
+
+        await kakao_client.close_http_client()
+        assert first.is_closed
+        assert kakao_client._http_client is None
+
+    asyncio.run(run())
+
+
+def test_client_outside_lifespan_is_created_lazily(monkeypatch):
+    monkeypatch.setattr(kakao_client, "_http_client", None)
+
+    async def run():
+        client = kakao_client.get_http_client()
+        assert not client.is_closed
+        assert kakao_client.get_http_client() is client
+        await client.aclose()
+        # 닫힌 클라이언트는 다시 만들어서 반환
+        assert kakao_client.get_http_client() is not client
+        await kakao_client.close_http_client()
+
+    asyncio.run(run())
+
+
+def test_close_cancels_background_fetches(monkeypatch):
+    monkeypatch.setattr(kakao_client, "_http_client", None)
+    monkeypatch.setattr(kakao_client, "_prefetch_tasks", {})
+
+    async def run():
+        task = asyncio.create_task(asyncio.sleep(10))
+        kakao_client._prefetch_tasks[("keyword",)] = task
+        await kakao_client.close_http_client()
+        await asyncio.sleep(0)
+        return task.cancelled()
+
+    assert asyncio.run(run())
+
+
+def test_host_slot_caps_concurrent_requests_per_host(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_MAX_PER_HOST", 2)
+    monkeypatch.setattr(kakao_client, "_host_semaphores", {})
+    active, peak = {"a": 0, "b": 0}, {"a": 0, "b": 0}
+
+    async def call(host: str):
+        async with kakao_client._host_slot(f"https://{host}.example/x"):
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+
+    async def run():
+        await asyncio.gather(*(call(host) for host in "aaaaabbb"))
+
+    asyncio.run(run())
+    assert peak == {"a": 2, "b": 2}
@@ -0,0 +1,47 @@
+"""카카오 GET 재시도 정책 테스트 (연결 실패/5xx만 재시도)"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from . import config, kakao_client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(config, "RETRY_MAX_ATTEMPTS", 1)
+    monkeypatch.setattr(config, "RETRY_MAX_DELAY", 0.0)
+
+
+def _get():
+    return asyncio.run(kakao_client._get(
+        kakao_client.KAKAO_KEYWORD_URL, endpoint="keyword", headers={}, params={"query": "국밥"}
+    ))
+
+
+def _raise(error: type[httpx.TransportError]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error("boom", request=request)
+    return handler
+
+
+def test_read_timeout_is_not_retried(kakao):
+    kakao.handler = _raise(httpx.ReadTimeout)
+    with pytest.raises(httpx.ReadTimeout):
+        _get()
+    assert len(kakao.calls) == 1
+
+
+def test_connect_error_is_retried(kakao):
+    kakao.handler = _raise(httpx.ConnectError)
+    with pytest.raises(httpx.ConnectError):
+        _get()
+    assert len(kakao.calls) == 2
+
+
+@pytest.mark.parametrize("status, calls", [(503, 2), (429, 1), (404, 1)])
+def test_only_5xx_responses_are_retried(kakao, status, calls):
+    kakao.handler = lambda request: httpx.Response(status)
+    assert _get().status_code == status
+    assert len(kakao.calls) == calls
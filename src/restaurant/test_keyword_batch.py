@@ -0,0 +1,57 @@
+"""리뷰 키워드 배치 테스트 (대표 키워드 사전/부정 처리, 매장별 누적, 재실행 안전)"""
+
+from sqlalchemy import select
+
+from database.connection import SessionLocal
+from database.models import RestaurantKeyword, Review
+
+from . import keyword_batch
+
+REVIEWS = [
+    "매콤하고 얼큰해서 해장으로 딱",
+    "하나도 안 매워요",
+    "깔끔 깔끔 깔끔하고 매워요",
+    "맵지 않아요 국물은 시원",
+]
+
+
+def _counts(place_id: str) -> dict[str, int]:
+    with SessionLocal() as db:
+        rows = db.scalars(
+            select(RestaurantKeyword).where(RestaurantKeyword.restaurant_id == place_id)
+        )
+        return {row.keyword: row.count for row in rows}
+
+
+def _insert(place_id: str, texts: list[str]) -> None:
+    with SessionLocal() as db:
+        for text in texts:
+            db.add(Review(place_id=place_id, source_id=f"{place_id}-{text}", content=text))
+        db.commit()
+
+
+def test_batch_counts_each_keyword_once_per_review_and_skips_negations():
+    _insert("920001", REVIEWS)
+    keyword_batch.run(chunk_size=2, workers=1, use_konlpy=False)
+
+    assert _counts("920001") == {"맵다": 2, "얼큰": 1, "해장": 1, "깔끔": 1, "국물": 1, "시원": 1}
+    with SessionLocal() as db:
+        stored = db.execute(
+            select(Review.content, Review.keywords).where(Review.place_id == "920001")
+        ).all()
+    assert dict(stored)["하나도 안 매워요"] == []
+
+
+def test_rerun_only_processes_new_reviews():
+    _insert("920002", ["국물이 든든해요"])
+    keyword_batch.run(chunk_size=10, workers=1, use_konlpy=False)
+    _insert("920002", ["든든하고 푸짐"])
+    summary = keyword_batch.run(chunk_size=10, workers=1, use_konlpy=False)
+
+    assert summary["processed"] == 1
+    assert _counts("920002") == {"국물": 1, "든든": 2, "푸짐": 1}
+
+    # 체크포인트를 무시해도 이미 처리한 리뷰(keywords 채워짐)는 다시 세지 않음
+    summary = keyword_batch.run(chunk_size=10, workers=1, full=True, use_konlpy=False)
+    assert summary["processed"] == 0
+    assert _counts("920002") == {"국물": 1, "든든": 2, "푸짐": 1}
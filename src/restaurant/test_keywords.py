@@ -0,0 +1,44 @@
+"""리뷰 키워드 추출 테스트 (변형 표현, 부정, 형태소 분석기 품사 필터)"""
+
+import pytest
+
+from . import keywords
+from .keywords import extract_keywords
+
+
+@pytest.fixture(autouse=True)
+def regex_analyzer(monkeypatch):
+    monkeypatch.setattr(keywords, "_okt", None)
+
+
+class FakeOkt:
+    """KoNLPy Okt.pos(stem=True) 목 — 실제 분석 결과 형태를 그대로 돌려줌"""
+
+    def __init__(self, tagged: list[tuple[str, str]]):
+        self.tagged = tagged
+
+    def pos(self, text: str, stem: bool = False) -> list[tuple[str, str]]:
+        return self.tagged
+
+
+def test_variants_map_to_representative_keyword():
+    assert extract_keywords("국물이 얼큰하고 매콤해서 해장으로 딱") == ["맵다", "얼큰", "해장", "국물"]
+
+
+@pytest.mark.parametrize("text", ["하나도 안 매워요", "전혀 맵지 않아요", "못 매운 맛"])
+def test_negated_mentions_are_not_counted(text):
+    assert extract_keywords(text) == []
+
+
+def test_konlpy_keeps_negation_prefix(monkeypatch):
+    """Okt가 "안"을 VerbPrefix로 붙여도 부정으로 처리"""
+    monkeypatch.setattr(keywords, "_okt", FakeOkt([
+        ("국물", "Noun"), ("이", "Josa"), ("안", "VerbPrefix"), ("맵다", "Adjective"), ("깔끔하다", "Adjective"),
+    ]))
+    assert keywords.tokenize("국물이 안 맵고 깔끔해요") == ["국물", "안", "맵다", "깔끔하다"]
+    assert extract_keywords("국물이 안 맵고 깔끔해요") == ["국물", "깔끔"]
+
+
+def test_konlpy_negation_after_stem(monkeypatch):
+    monkeypatch.setattr(keywords, "_okt", FakeOkt([("맵다", "Adjective"), ("않다", "Verb")]))
+    assert extract_keywords("맵지 않다") == []
@@ -0,0 +1,78 @@
+"""로컬 매장 미러 테스트 (커버리지/만료, 빈 결과와 미커버 구분, 재수집 시 제거)"""
+
+import asyncio
+import time
+
+from . import config, kakao_client
+from .geo import bbox_around
+from .local_mirror import LocalMirror, align_to_cells
+
+LAT, LNG = 37.5012, 127.0012
+
+
+def _doc(place_id: str, meters_north: int, name: str = "순대국밥", category: str = "한식") -> dict:
+    return {
+        "id": place_id,
+        "name": name,
+        "full_category": f"음식점 > {category}",
+        "lat": LAT + meters_north / 111_320,
+        "lng": LNG,
+        "distance": 0,
+    }
+
+
+def _covered(*documents: dict, radius: int = 1000, since: float | None = None) -> LocalMirror:
+    local = LocalMirror()
+    local.add_many(list(documents), "FD6")
+    rect = align_to_cells(bbox_around(LAT, LNG, radius))
+    local.mark_covered(rect, "FD6", since or time.time() - 1)
+    return local
+
+
+def test_coverage_requires_every_touching_cell_and_expires():
+    local = _covered(radius=600)
+    assert local.covers(bbox_around(LAT, LNG, 500), "FD6", max_age=60)
+    assert not local.covers(bbox_around(LAT, LNG, 2000), "FD6", max_age=60)
+    assert not local.covers(bbox_around(LAT, LNG, 500), "CE7", max_age=60)
+    assert not local.covers(bbox_around(LAT, LNG, 500), "FD6", max_age=-1)
+
+
+def test_rescan_removes_places_not_seen_again():
+    local = LocalMirror()
+    local.add_many([_doc("900001", 100), _doc("900002", 200)], "FD6")
+    since = time.time() + 1
+    local.add_many([_doc("900002", 200)], "FD6")
+    local._records["900002"]["observed_at"] = since
+    local.mark_covered(align_to_cells(bbox_around(LAT, LNG, 1000)), "FD6", since)
+
+    assert [p["id"] for p in local.query_radius(LAT, LNG, 1000)] == ["900002"]
+    assert local.removed == 1
+
+
+def test_query_radius_filters_by_distance_and_keyword():
+    local = _covered(_doc("900003", 300), _doc("900004", 100, name="파스타", category="양식"))
+    assert [p["id"] for p in local.query_radius(LAT, LNG, 1000)] == ["900004", "900003"]
+    assert [p["id"] for p in local.query_radius(LAT, LNG, 200)] == ["900004"]
+    hits = local.query_radius(LAT, LNG, 1000, keywords=["순대 국밥"])
+    assert [p["id"] for p in hits] == ["900003"]
+    assert "search_text" not in hits[0] and 290 <= hits[0]["distance"] <= 310
+
+
+def test_search_local_distinguishes_empty_from_uncovered(monkeypatch):
+    """커버된 영역에 맞는 매장이 없으면 [] (업스트림 대체 대상 아님), 미커버/만료는 None"""
+    monkeypatch.setattr(kakao_client, "mirror", _covered(_doc("900005", 100)))
+    monkeypatch.setattr(kakao_client, "_mirror_counters", {"served": 0, "empty": 0, "stale": 0})
+
+    assert kakao_client.search_local(LAT, LNG, 500, keywords=["마라탕"]) == []
+    assert [p["id"] for p in kakao_client.search_local(LAT, LNG, 500)] == ["900005"]
+    assert kakao_client.search_local(LAT, LNG, 5000) is None
+    monkeypatch.setattr(config, "MIRROR_MAX_AGE", -1)
+    assert kakao_client.search_local(LAT, LNG, 500) is None
+    assert kakao_client._mirror_counters == {"served": 1, "empty": 1, "stale": 2}
+
+
+def test_search_nearby_answers_covered_area_without_upstream(kakao, monkeypatch):
+    monkeypatch.setattr(kakao_client, "mirror", _covered(radius=1000))
+    result = asyncio.run(kakao_client.search_nearby(LAT, LNG, radius=500))
+    assert result == {"documents": [], "meta": {"total_count": 0, "is_end": True}}
+    assert kakao.calls == []
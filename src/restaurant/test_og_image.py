@@ -0,0 +1,76 @@
+"""og:image 스트리밍 추출 테스트 (청크 경계, </head>에서 중단, 일괄 조회)"""
+
+import asyncio
+
+import httpx
+
+from . import config, kakao_client
+from .cache import TTLCache
+
+TAG = b'<meta property="og:image" content="//img.kakao/abc.jpg">'
+
+
+class Body:
+    """청크 단위 응답 본문 — 몇 번째 청크까지 읽혔는지 기록"""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.read = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def _scan(chunks: list[bytes]) -> tuple[str, int]:
+    body = Body(chunks)
+    url = asyncio.run(kakao_client._scan_og_image(httpx.Response(200, content=body)))
+    return url, body.read
+
+
+def test_tag_split_across_chunks_is_found():
+    head = b"<html><head>" + b" " * 2000
+    url, _ = _scan([head + TAG[:20], TAG[20:], b"</head><body>" + b"x" * 1000])
+    assert url == "//img.kakao/abc.jpg"
+
+
+def test_stops_reading_once_found():
+    url, read = _scan([b"<head>" + TAG, b"</head>", b"<body>" * 1000, b"<body>" * 1000])
+    assert url == "//img.kakao/abc.jpg"
+    assert read == 1
+
+
+def test_head_end_without_tag_stops_reading():
+    url, read = _scan([b"<head><title>x</title>", b"</HEAD >", b"<body>" + TAG, b"more"])
+    assert url == ""
+    assert read == 2
+
+
+def test_byte_cap_stops_a_page_without_head_end(monkeypatch):
+    monkeypatch.setattr(config, "IMAGE_SCAN_MAX_BYTES", 1024)
+    url, read = _scan([b"x" * 600, b"x" * 600, b"x" * 600, TAG])
+    assert (url, read) == ("", 2)
+
+
+def test_batch_collapses_duplicates_and_normalizes_urls(monkeypatch):
+    requested: list[str] = []
+
+    def page(request: httpx.Request) -> httpx.Response:
+        place_id = request.url.path.rsplit("/", 1)[-1]
+        requested.append(place_id)
+        tag = b'<meta property="og:image" content="//img/%s.jpg">' % place_id.encode()
+        return httpx.Response(200, content=b"<head>" + tag)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(page))
+    monkeypatch.setattr(kakao_client, "_http_client", client)
+    monkeypatch.setattr(kakao_client, "_image_cache", TTLCache(maxsize=100, ttl=60))
+
+    place_ids = ["710001", "710002", "710001", "mock_1_1"]
+    images = asyncio.run(kakao_client.fetch_place_images(place_ids))
+    assert images == {
+        "710001": "https://img/710001.jpg",
+        "710002": "https://img/710002.jpg",
+        "mock_1_1": "",
+    }
+    assert sorted(requested) == ["710001", "710002"]
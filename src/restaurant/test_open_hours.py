@@ -0,0 +1,65 @@
+"""영업시간 파싱 / 상태 변화 시각 테스트 (자정·주 경계 포함)"""
+
+from datetime import datetime
+
+from . import kakao_client
+from .open_hours import KST, is_open_at, next_transition, parse_weekly_schedule
+
+# 2026-10-16 금요일, 2026-10-18 일요일
+FRI, SAT, SUN, MON = 16, 17, 18, 19
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 10, day, hour, minute, tzinfo=KST)
+
+
+def _every_day(time: str, break_time: str = "") -> list[dict]:
+    return [{"day": f"{d}요일", "time": time, "break_time": break_time, "off": False} for d in "월화수목금토일"]
+
+
+def test_late_night_hours_stay_open_past_midnight():
+    """17:00 ~ 02:00 영업은 다음날 새벽까지 영업 중, 마감 시각은 다음날 02:00"""
+    schedule = parse_weekly_schedule(_every_day("17:00 ~ 02:00"))
+    assert is_open_at(schedule, _at(FRI, 23, 30))
+    assert is_open_at(schedule, _at(SAT, 1, 59))
+    assert not is_open_at(schedule, _at(SAT, 2, 0))
+    assert next_transition(schedule, _at(FRI, 23, 30)) == _at(SAT, 2)
+    assert next_transition(schedule, _at(SAT, 3)) == _at(SAT, 17)
+
+
+def test_sunday_night_wraps_into_monday():
+    """일요일 밤 영업이 주 경계(월요일 0시)를 넘어도 이어짐"""
+    hours = [{"day": "일요일", "time": "20:00 ~ 03:00", "break_time": "", "off": False}]
+    schedule = parse_weekly_schedule(hours)
+    assert is_open_at(schedule, _at(MON, 2))
+    assert next_transition(schedule, _at(SUN, 21)) == _at(MON, 3)
+    # 월요일은 정보 없음 → 구간 밖이면 None
+    assert is_open_at(schedule, _at(MON, 12)) is None
+
+
+def test_open_all_week_has_no_transition():
+    """매일 24시간 영업은 자정마다 상태가 바뀌지 않음"""
+    schedule = parse_weekly_schedule(_every_day("24시간 영업"))
+    assert is_open_at(schedule, _at(SUN, 23, 59))
+    assert next_transition(schedule, _at(SUN, 23)) is None
+
+
+def test_break_time_after_midnight_splits_the_night_span():
+    """자정 이후 브레이크타임은 다음날 새벽 구간으로 계산"""
+    schedule = parse_weekly_schedule(_every_day("18:00 ~ 04:00", "01:00 ~ 02:00"))
+    assert is_open_at(schedule, _at(SAT, 0, 30))
+    assert not is_open_at(schedule, _at(SAT, 1, 30))
+    assert next_transition(schedule, _at(SAT, 1, 30)) == _at(SAT, 2)
+
+
+def test_day_off_is_closed_not_unknown():
+    hours = [{"day": "월요일", "time": "휴무일", "break_time": "", "off": True}]
+    assert is_open_at(parse_weekly_schedule(hours), _at(MON, 12)) is False
+
+
+def test_info_cache_expires_at_midnight():
+    """today 표시/"내일 …" 문구가 바뀌므로 다음 상태 변화가 멀어도 자정(KST)에 만료"""
+    schedule = parse_weekly_schedule(_every_day("11:00 ~ 22:00"))
+    assert kakao_client._info_expires_at(schedule, _at(FRI, 23)) == _at(SAT, 0)
+    assert kakao_client._info_expires_at(schedule, _at(FRI, 20)) == _at(FRI, 22)
+    assert kakao_client._info_expires_at(None, _at(FRI, 23, 50)) == _at(SAT, 0)
@@ -0,0 +1,75 @@
+"""매장 ID 인덱스 테스트 (메모리 → DB, 바뀐 레코드만 저장, 조회 좌표 기준 거리)"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from database.connection import SessionLocal
+from database.models import PlaceRecord
+
+from . import config, kakao_client, place_index, place_store
+
+
+def _doc(place_id: str, name: str = "국밥집", distance: int = 120) -> dict:
+    return {
+        "id": place_id,
+        "name": name,
+        "category": "한식",
+        "lat": 37.5,
+        "lng": 127.0,
+        "distance": distance,
+        "image_url": "https://img/x.jpg",
+    }
+
+
+def _add(*documents: dict) -> None:
+    async def run():
+        place_index.add_many(list(documents))
+        await place_store.flush()
+
+    asyncio.run(run())
+
+
+def test_record_is_served_from_memory_without_request_fields():
+    _add(_doc("800001"))
+    record = asyncio.run(place_index.get("800001"))
+    assert record["name"] == "국밥집"
+    assert "distance" not in record and "image_url" not in record
+    # 복사본 반환 → 호출자가 고쳐도 인덱스는 그대로
+    record["name"] = "변경"
+    assert asyncio.run(place_index.get("800001"))["name"] == "국밥집"
+
+
+def test_memory_miss_falls_back_to_db():
+    _add(_doc("800002"))
+    place_index._index.clear()
+    assert asyncio.run(place_index.get("800002"))["name"] == "국밥집"
+    assert place_index._index.peek("800002") is not None
+    assert asyncio.run(place_index.get("800003")) is None
+
+
+def test_expired_db_record_is_not_served():
+    _add(_doc("800004"))
+    place_index._index.clear()
+    with SessionLocal() as db:
+        row = db.get(PlaceRecord, "800004")
+        row.updated_at = datetime.utcnow() - timedelta(seconds=config.PLACE_INDEX_TTL + 60)
+        db.commit()
+    assert asyncio.run(place_index.get("800004")) is None
+
+
+def test_only_changed_records_are_written(monkeypatch):
+    _add(_doc("800005"))
+    writes = []
+    monkeypatch.setattr(place_store, "submit", lambda fn, records: writes.append(records))
+
+    # distance만 다른 같은 매장은 저장하지 않음
+    place_index.add_many([_doc("800005", distance=999), _doc("800006")])
+    place_index.add_many([_doc("800005", name="새이름")])
+    assert [[r["id"] for r in batch] for batch in writes] == [["800006"], ["800005"]]
+
+
+def test_get_place_recomputes_distance_for_caller():
+    _add(_doc("800007"))
+    assert asyncio.run(kakao_client.get_place("800007"))["distance"] == 0
+    place = asyncio.run(kakao_client.get_place("800007", lat=37.501, lng=127.0))
+    assert 100 <= place["distance"] <= 120
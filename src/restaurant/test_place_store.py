@@ -0,0 +1,64 @@
+"""플레이스 메타데이터 영구 저장소 테스트 (write-through, 항목별 만료, compaction)"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from database.connection import SessionLocal
+from database.models import PlaceMetadata
+
+from . import config, place_store
+
+
+def _age(place_id: str, seconds: float, *columns: str) -> None:
+    past = datetime.utcnow() - timedelta(seconds=seconds)
+    with SessionLocal() as db:
+        row = db.get(PlaceMetadata, place_id)
+        for column in columns:
+            setattr(row, column, past)
+        db.commit()
+
+
+def test_save_is_written_through_and_loaded_back():
+    reviews = {"reviews": [{"contents": "맛있어요"}], "total_count": 12, "avg_score": 4.3}
+
+    async def run():
+        place_store.save("700001", "image", "https://img/700001.jpg")
+        place_store.save("700001", "reviews", reviews)
+        await place_store.flush()
+        image = await place_store.load("700001", "image")
+        return image, await place_store.load("700001", "reviews")
+
+    assert asyncio.run(run()) == ("https://img/700001.jpg", reviews)
+    with SessionLocal() as db:
+        row = db.get(PlaceMetadata, "700001")
+        assert (row.avg_score, row.review_count) == (4.3, 12)
+
+
+def test_fields_expire_independently():
+    place_store._save_sync("700002", "image", "https://img/700002.jpg")
+    place_store._save_sync("700002", "info", {"phone": "02-000-0000"})
+    _age("700002", config.PLACE_STORE_INFO_MAX_AGE + 60, "info_updated_at")
+
+    assert asyncio.run(place_store.load("700002", "info")) is None
+    assert asyncio.run(place_store.load("700002", "image")) == "https://img/700002.jpg"
+    assert asyncio.run(place_store.load("700002", "reviews")) is None
+
+
+def test_disabled_store_neither_reads_nor_writes(monkeypatch):
+    place_store._save_sync("700003", "image", "https://img/700003.jpg")
+    monkeypatch.setattr(config, "PLACE_STORE_ENABLED", False)
+    place_store.save("700004", "image", "https://img/700004.jpg")
+    assert not place_store._pending
+    assert asyncio.run(place_store.load("700003", "image")) is None
+
+
+def test_compaction_removes_rows_past_the_longest_max_age():
+    longest = max(age for _, age in place_store._FIELDS.values())
+    place_store._save_sync("700005", "image", "https://img/700005.jpg")
+    place_store._save_sync("700006", "image", "https://img/700006.jpg")
+    _age("700005", longest + 60, "updated_at", "image_updated_at")
+
+    assert asyncio.run(place_store.compact()) >= 1
+    with SessionLocal() as db:
+        assert db.get(PlaceMetadata, "700005") is None
+        assert db.get(PlaceMetadata, "700006") is not None
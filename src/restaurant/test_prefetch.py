@@ -0,0 +1,59 @@
+"""다음 페이지 프리페치와 요청 합치기 우선순위 테스트"""
+
+import asyncio
+
+import httpx
+
+from . import kakao_client
+from .governor import Priority, TokenBucket, governor, outbound_priority
+
+
+def _results(request: httpx.Request) -> httpx.Response:
+    page = request.url.params["page"]
+    docs = [{"id": f"{page}00{i}", "place_name": f"매장{i}", "category_name": "음식점 > 한식", "x": "127.0", "y": "37.5"}
+            for i in range(3)]
+    return httpx.Response(200, json={"documents": docs, "meta": {"total_count": 30, "is_end": False}})
+
+
+def test_user_request_joining_rejected_prefetch_is_reissued(kakao, monkeypatch):
+    """BACKGROUND 프리페치가 예산에서 거부돼도, 거기에 합쳐진 사용자 요청은 USER로 다시 보내 실제 결과를 받음"""
+    kakao.handler = _results
+    # BACKGROUND 예약분(50%) 아래 → 프리페치는 거부, 사용자 요청은 통과
+    bucket = TokenBucket(rate=0.001, burst=10)
+    bucket.tokens = 4
+    monkeypatch.setitem(governor.buckets, "rest", bucket)
+
+    async def run():
+        with outbound_priority(Priority.BACKGROUND):
+            prefetch = asyncio.create_task(kakao_client.search_keyword("국밥", page=2))
+        await asyncio.sleep(0)
+        user = await kakao_client.search_keyword("국밥", page=2)
+        await prefetch
+        return user
+
+    user = asyncio.run(run())
+    assert [d["id"] for d in user["documents"]] == ["2000", "2001", "2002"]
+    assert len(kakao.calls) == 1
+    assert kakao_client.prefetch_stats()["reissued"] >= 1
+    assert governor.skipped["BACKGROUND"] == 1
+
+
+def test_prefetch_fills_the_next_page(kakao, monkeypatch):
+    """page 응답 뒤 page+1을 BACKGROUND로 캐시에 채워 다음 요청은 업스트림 없이 응답"""
+    monkeypatch.setattr(kakao_client.config, "SEARCH_PREFETCH_ENABLED", True)
+    kakao.handler = lambda request: (
+        _results(request) if "keyword" in request.url.path else httpx.Response(200, text="<head></head>")
+    )
+
+    async def run():
+        await kakao_client.search_keyword("냉면", page=1)
+        kakao_client.prefetch_next_page("냉면", None, None, 2000, 1, 15)
+        await asyncio.gather(*kakao_client._prefetch_tasks.values())
+        before = kakao.count("keyword")
+        second = await kakao_client.search_keyword("냉면", page=2)
+        return before, second
+
+    before, second = asyncio.run(run())
+    assert before == 2
+    assert kakao.count("keyword") == 2
+    assert second["documents"][0]["id"] == "2000"
@@ -0,0 +1,85 @@
+"""행정동 중심점 인덱스 및 coord2region fallback 테스트"""
+
+import asyncio
+
+import httpx
+
+from . import kakao_client
+from .region import RegionIndex
+
+
+def _region(dong: str, gu: str = "강남구") -> dict:
+    return {
+        "region_1depth": "서울특별시",
+        "region_2depth": gu,
+        "region_3depth": dong,
+        "display_name": f"{gu} {dong}",
+    }
+
+
+def test_nearest_returns_closest_within_distance():
+    index = RegionIndex()
+    index.add(37.500, 127.036, _region("역삼동"))
+    index.add(37.504, 127.049, _region("삼성동"))
+
+    assert index.nearest(37.501, 127.037, 3000)["region_3depth"] == "역삼동"
+    assert index.nearest(37.504, 127.048, 3000)["region_3depth"] == "삼성동"
+    assert index.nearest(37.600, 127.036, 3000) is None
+
+
+def test_nearest_searches_neighbouring_buckets():
+    """격자 경계 바로 건너편의 동도 찾음"""
+    index = RegionIndex()
+    index.add(37.5499, 127.0, _region("경계동"))
+    assert index.nearest(37.5501, 127.0, 100)["region_3depth"] == "경계동"
+
+
+def test_observed_region_beats_nearer_seed():
+    """시드 지역보다 실제 관측된 동을 우선 (조금 더 멀어도)"""
+    index = RegionIndex()
+    index.add(37.500, 127.036, _region("시드동"), seed=True)
+    index.add(37.505, 127.036, _region("관측동"))
+    assert index.nearest(37.500, 127.036, 3000)["region_3depth"] == "관측동"
+
+
+def test_observations_move_centroid_across_buckets():
+    index = RegionIndex()
+    index.add(37.549, 127.0, _region("이동동"))
+    index.add(37.651, 127.0, _region("이동동"))
+    assert len(index) == 1
+    assert index.nearest(37.549, 127.0, 1000) is None
+    assert index.nearest(37.600, 127.0, 1000)["region_3depth"] == "이동동"
+
+
+def test_upstream_failure_falls_back_to_nearest_indexed_region(kakao, monkeypatch):
+    monkeypatch.setattr(kakao_client, "_region_index", RegionIndex())
+    kakao_client._region_index.add(37.500, 127.036, _region("역삼동"))
+    kakao.handler = lambda request: httpx.Response(500)
+
+    region = asyncio.run(kakao_client.coord2region(37.501, 127.037))
+    assert region["region_3depth"] == "역삼동"
+    # 실패한 결과는 캐시하지 않음 → 다음 요청은 다시 업스트림으로
+    assert len(kakao_client._region_cache) == 0
+
+
+def test_upstream_answer_is_indexed_for_later_fallback(kakao, monkeypatch):
+    monkeypatch.setattr(kakao_client, "_region_index", RegionIndex())
+    kakao.handler = lambda request: httpx.Response(200, json={"documents": [{
+        "region_type": "H",
+        "region_1depth_name": "서울특별시",
+        "region_2depth_name": "마포구",
+        "region_3depth_name": "서교동",
+    }]})
+    region = asyncio.run(kakao_client.coord2region(37.556, 126.923))
+    assert region["display_name"] == "마포구 서교동"
+
+    kakao.handler = lambda request: httpx.Response(503)
+    region = asyncio.run(kakao_client.coord2region(37.557, 126.925))
+    assert region["region_3depth"] == "서교동"
+
+
+def test_far_from_any_region_uses_default(kakao, monkeypatch):
+    monkeypatch.setattr(kakao_client, "_region_index", RegionIndex())
+    kakao.handler = lambda request: httpx.Response(500)
+    region = asyncio.run(kakao_client.coord2region(35.1, 129.0))
+    assert region == kakao_client._DEFAULT_REGION
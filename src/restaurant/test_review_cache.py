@@ -0,0 +1,97 @@
+"""리뷰 캐시 stale-while-revalidate 테스트 (soft/hard TTL, 백그라운드 갱신 수 제한)"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from . import config, kakao_client
+
+
+@pytest.fixture(autouse=True)
+def no_store(monkeypatch):
+    monkeypatch.setattr(config, "PLACE_STORE_ENABLED", False)
+
+
+def _comments(score: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"comment": {
+            "scorecnt": 1,
+            "scoresum": score,
+            "list": [{"username": "김민수", "point": score, "contents": "맛있어요"}],
+        }})
+    return handler
+
+
+def _seed(place_id: str, avg_score: float, age: float) -> None:
+    result = {"reviews": [], "total_count": 1, "avg_score": avg_score}
+    kakao_client._cache_reviews(place_id, result, time.time() - age)
+
+
+def test_fresh_entry_is_served_without_upstream(kakao):
+    kakao.handler = _comments(4)
+    assert asyncio.run(kakao_client.fetch_place_reviews("910001"))["avg_score"] == 4.0
+    assert asyncio.run(kakao_client.fetch_place_reviews("910001"))["avg_score"] == 4.0
+    assert kakao.count("/main/v/") == 1
+
+
+def test_stale_entry_is_served_then_refreshed_in_background(kakao):
+    kakao.handler = _comments(5)
+    _seed("910002", 3.0, config.REVIEW_CACHE_SOFT_TTL + 60)
+
+    async def run():
+        stale = await kakao_client.fetch_place_reviews("910002")
+        refresh = kakao_client._review_refreshes["910002"]
+        await refresh
+        return stale, await kakao_client.fetch_place_reviews("910002")
+
+    stale, fresh = asyncio.run(run())
+    assert (stale["avg_score"], fresh["avg_score"]) == (3.0, 5.0)
+    assert kakao.count("/main/v/") == 1
+    assert not kakao_client._review_refreshes
+
+
+def test_failed_refresh_keeps_the_stale_entry(kakao):
+    kakao.handler = lambda request: httpx.Response(404)
+    _seed("910003", 3.0, config.REVIEW_CACHE_SOFT_TTL + 60)
+
+    async def run():
+        await kakao_client.fetch_place_reviews("910003")
+        await kakao_client._review_refreshes["910003"]
+        return await kakao_client.fetch_place_reviews("910003")
+
+    assert asyncio.run(run())["avg_score"] == 3.0
+
+
+def test_entry_past_hard_ttl_is_fetched_synchronously(kakao):
+    kakao.handler = _comments(5)
+    _seed("910004", 3.0, config.REVIEW_CACHE_HARD_TTL + 60)
+    assert asyncio.run(kakao_client.fetch_place_reviews("910004"))["avg_score"] == 5.0
+    assert kakao.count("/main/v/") == 1
+
+
+def test_background_refreshes_are_capped(kakao, monkeypatch):
+    monkeypatch.setattr(config, "REVIEW_REFRESH_CONCURRENCY", 1)
+    skipped = kakao_client._review_counters["refresh_skipped"]
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return _comments(5)(request)
+
+    kakao.handler = slow
+    for place_id in ("910005", "910006"):
+        _seed(place_id, 3.0, config.REVIEW_CACHE_SOFT_TTL + 60)
+
+    async def run():
+        await kakao_client.fetch_place_reviews("910005")
+        await kakao_client.fetch_place_reviews("910006")
+        # 같은 매장은 진행 중인 갱신에 합쳐짐
+        await kakao_client.fetch_place_reviews("910005")
+        refreshing = sorted(kakao_client._review_refreshes)
+        await asyncio.gather(*kakao_client._review_refreshes.values())
+        return refreshing
+
+    assert asyncio.run(run()) == ["910005"]
+    assert kakao.count("/main/v/") == 1
+    assert kakao_client._review_counters["refresh_skipped"] == skipped + 1
@@ -0,0 +1,113 @@
+"""리뷰 증분 동기화 커서 테스트 (페이지 상한에 걸려도 구멍 없이 이어받기)"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from database.connection import SessionLocal
+from database.models import PlaceReviewStats, Review
+
+from . import config, kakao_client, review_sync
+from .review_store import ingest_sync, load_cursor_sync
+
+PAGE_SIZE = 3
+
+
+class Board:
+    """카카오 리뷰 목록 목 (최신순, commentid가 클수록 최신)"""
+
+    def __init__(self, count: int):
+        self.ids = list(range(count, 0, -1))
+        self.conditional: list[bool] = []
+
+    def post(self, count: int) -> None:
+        top = self.ids[0] if self.ids else 0
+        self.ids[:0] = range(top + count, top, -1)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if "/main/" in request.url.path:
+            self.conditional.append("if-none-match" in request.headers)
+            start = 0
+        else:
+            start = self.ids.index(int(request.url.path.rsplit("/", 1)[-1])) + 1
+        page = self.ids[start:start + PAGE_SIZE]
+        comment = {
+            "list": [{"commentid": i, "contents": f"리뷰 {i}", "point": 4, "date": "2026.10.18."} for i in page],
+            "hasNext": start + PAGE_SIZE < len(self.ids),
+            "scorecnt": len(self.ids),
+            "scoresum": 4 * len(self.ids),
+        }
+        return httpx.Response(200, json={"comment": comment}, headers={"ETag": f'"{self.ids[0]}"'})
+
+
+def _stored(place_id: str) -> set[int]:
+    with SessionLocal() as db:
+        return {int(sid) for sid in db.scalars(select(Review.source_id).where(Review.place_id == place_id))}
+
+
+def _sync(place_id: str) -> dict:
+    assert asyncio.run(review_sync.sync_place(place_id))
+    return load_cursor_sync(place_id)
+
+
+@pytest.fixture
+def board(kakao, monkeypatch) -> Board:
+    monkeypatch.setattr(config, "REVIEW_SYNC_MAX_PAGES", 2)
+    board = Board(3)
+    kakao.handler = board.handler
+    return board
+
+
+def test_page_cap_leaves_cursor_and_resumes_without_gaps(board):
+    place_id = "900001"
+    assert _sync(place_id)["latest_source_id"] == "3"
+
+    # 새 리뷰 10개 → 2페이지(6개)만 읽고 멈춤, 커서는 그대로
+    board.post(10)
+    cursor = _sync(place_id)
+    assert cursor["latest_source_id"] == "3"
+    assert (cursor["resume_source_id"], cursor["resume_after_id"]) == ("13", "8")
+    assert _stored(place_id) == {1, 2, 3, 13, 12, 11, 10, 9, 8}
+
+    # 그 사이 2개 더 → 새 리뷰를 읽고 끊긴 지점(8 다음)부터 이어서
+    board.post(2)
+    cursor = _sync(place_id)
+    assert cursor["latest_source_id"] == "3"
+    assert (cursor["resume_source_id"], cursor["resume_after_id"]) == ("15", "5")
+
+    cursor = _sync(place_id)
+    assert cursor["latest_source_id"] == "15"
+    assert cursor["resume_after_id"] is None
+    assert _stored(place_id) == set(range(1, 16))
+
+
+def test_no_conditional_request_while_resume_is_pending(board):
+    """끊긴 구간이 남았는데 304를 받으면 구간을 못 채우므로 조건부 요청을 보내지 않음"""
+    place_id = "900002"
+    _sync(place_id)
+    board.post(10)
+    _sync(place_id)
+    _sync(place_id)
+    assert board.conditional == [False, True, False]
+
+
+def test_stats_rows_follow_review_cache_ttls(kakao):
+    """soft TTL 지난 집계 행은 쓰되 백그라운드 갱신, hard TTL 지난 행은 제외"""
+    ages = {"900011": 60, "900012": config.REVIEW_CACHE_SOFT_TTL + 60, "900013": config.REVIEW_CACHE_HARD_TTL + 60}
+    for place_id, age in ages.items():
+        ingest_sync(place_id, [], 10, 42, reached_cursor=True)
+        with SessionLocal() as db:
+            db.get(PlaceReviewStats, place_id).updated_at = datetime.utcnow() - timedelta(seconds=age)
+            db.commit()
+
+    async def run():
+        stats = await kakao_client.review_stats(list(ages))
+        return stats, set(kakao_client._review_refreshes)
+
+    stats, refreshing = asyncio.run(run())
+    assert {pid: row["stale"] for pid, row in stats.items()} == {"900011": False, "900012": True}
+    assert stats["900012"]["avg_score"] == 4.2
+    assert refreshing == {"900012"}
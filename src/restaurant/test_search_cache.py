@@ -0,0 +1,78 @@
+"""검색 결과 격자 캐시 / 요청 좌표 기준 변환 테스트"""
+
+import asyncio
+
+import httpx
+
+from . import kakao_client
+from .geo import METERS_PER_DEG_LAT
+
+LAT, LNG = 37.5, 127.0
+
+
+def _doc(pid: str, north_m: float) -> dict:
+    return {
+        "id": pid,
+        "place_name": f"매장{pid}",
+        "category_name": "음식점 > 한식",
+        "x": str(LNG),
+        "y": str(LAT + north_m / METERS_PER_DEG_LAT),
+        "distance": "0",
+    }
+
+
+def _respond(docs: list[dict], is_end: bool, total_count: int | None = None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "documents": docs,
+            "meta": {"total_count": total_count or len(docs), "is_end": is_end},
+        })
+    return handler
+
+
+def test_nearby_callers_share_one_upstream_call(kakao):
+    """같은 격자 안의 두 좌표는 업스트림 1회, 거리는 각자 기준으로 다시 계산"""
+    kakao.handler = _respond([_doc("1", 0), _doc("2", 100)], is_end=True)
+
+    async def run():
+        first = await kakao_client.search_keyword("국밥", LAT, LNG, radius=500)
+        second = await kakao_client.search_keyword("국밥", LAT + 20 / METERS_PER_DEG_LAT, LNG, radius=500)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert kakao.count("keyword") == 1
+    assert [d["distance"] for d in first["documents"]] == [0, 100]
+    assert [d["distance"] for d in second["documents"]] == [20, 80]
+
+
+def test_localized_meta_counts_only_documents_in_radius(kakao):
+    """넓힌 반경에만 걸린 매장은 빠지고, 마지막 1페이지면 total_count도 요청 반경 기준"""
+    kakao.handler = _respond([_doc("1", 0), _doc("2", 450), _doc("3", 560)], is_end=True)
+
+    result = asyncio.run(kakao_client.search_keyword("국밥", LAT, LNG, radius=500))
+    assert [d["id"] for d in result["documents"]] == ["1", "2"]
+    assert result["meta"] == {"total_count": 2, "is_end": True}
+
+
+def test_localized_meta_keeps_paging_until_upstream_ends(kakao):
+    """넓힌 조회에 다음 페이지가 있으면 is_end=False 유지, total_count는 남은 비율로 추정"""
+    kakao.handler = _respond([_doc("1", 0), _doc("2", 560)], is_end=False, total_count=40)
+
+    result = asyncio.run(kakao_client.search_keyword("국밥", LAT, LNG, radius=500, size=2))
+    assert [d["id"] for d in result["documents"]] == ["1"]
+    assert result["meta"] == {"total_count": 20, "is_end": False}
+
+
+def test_pages_use_the_same_padded_query(kakao):
+    """모든 페이지가 같은 격자 중심/반경으로 조회 → 페이지 사이 중복·누락 없음"""
+    kakao.handler = _respond([_doc("1", 0)], is_end=False, total_count=30)
+
+    async def run():
+        await kakao_client.search_keyword("국밥", LAT, LNG, radius=500, page=1)
+        await kakao_client.search_keyword("국밥", LAT, LNG, radius=500, page=2)
+
+    asyncio.run(run())
+    first, second = (dict(url.params) for url in kakao.calls)
+    assert (first["page"], second["page"]) == ("1", "2")
+    for key in ("x", "y", "radius"):
+        assert first[key] == second[key]
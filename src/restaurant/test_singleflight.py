@@ -0,0 +1,65 @@
+"""동일 요청 합치기 (SingleFlight) 테스트"""
+
+import asyncio
+
+import pytest
+
+from .singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """같은 키 동시 호출은 한 번만 실행되고 결과를 함께 받음"""
+    flight = SingleFlight()
+    runs = 0
+
+    async def fetch():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert runs == 1
+    assert flight.stats() == {"inflight": 0, "calls": 1, "coalesced": 4}
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    """기다리던 호출자 하나가 취소돼도 공유 요청과 나머지 호출자는 계속"""
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def run():
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("result", True)
+
+
+def test_failure_is_not_kept_for_the_next_call():
+    """실패한 요청은 키에서 지워져 다음 호출이 다시 실행"""
+    flight = SingleFlight()
+    attempts = 0
+
+    async def fetch():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("upstream down")
+        return "recovered"
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await flight.do("key", fetch)
+        return await flight.do("key", fetch)
+
+    assert asyncio.run(run()) == "recovered"
+    assert attempts == 2